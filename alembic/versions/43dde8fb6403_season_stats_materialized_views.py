@@ -0,0 +1,68 @@
+"""season stats materialized views
+
+Revision ID: 43dde8fb6403
+Revises: c38d9b54619c
+Create Date: 2026-10-18 21:11:43.022769
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "43dde8fb6403"
+down_revision: Union[str, None] = "c38d9b54619c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# RACE aggregates shared by both views; grid 0 means a pit-lane start
+STATS_COLUMNS = """
+    count(*) AS starts,
+    count(*) FILTER (WHERE r.position = 1) AS wins,
+    count(*) FILTER (WHERE r.position <= 3) AS podiums,
+    count(*) FILTER (WHERE NOT r.classified) AS dnfs,
+    coalesce(sum(r.points), 0)::float8 AS points,
+    round(avg(r.grid) FILTER (WHERE r.grid > 0), 2)::float8 AS avg_grid,
+    round(avg(r.position), 2)::float8 AS avg_finish,
+    round(avg(r.grid - r.position) FILTER (WHERE r.grid > 0), 2)::float8
+        AS avg_positions_gained
+"""
+RACE_RESULTS = """
+    FROM session_results r
+    JOIN entries e ON e.id = r.entry_id
+    JOIN sessions s ON s.id = r.session_id
+    WHERE s.type = 'RACE'
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW season_driver_stats AS
+        SELECT e.season_id, e.driver_id, e.team_id, {STATS_COLUMNS}
+        {RACE_RESULTS}
+        GROUP BY e.season_id, e.driver_id, e.team_id
+        """
+    )
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW season_team_stats AS
+        SELECT e.season_id, e.team_id, {STATS_COLUMNS}
+        {RACE_RESULTS}
+        GROUP BY e.season_id, e.team_id
+        """
+    )
+    # unique indexes are what REFRESH ... CONCURRENTLY diffs on
+    op.create_index(
+        "uq_season_driver_stats", "season_driver_stats", ["season_id", "driver_id"], unique=True
+    )
+    op.create_index(
+        "uq_season_team_stats", "season_team_stats", ["season_id", "team_id"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW season_team_stats")
+    op.execute("DROP MATERIALIZED VIEW season_driver_stats")
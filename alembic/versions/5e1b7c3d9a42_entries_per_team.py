@@ -0,0 +1,76 @@
+"""entries per team
+
+Revision ID: 5e1b7c3d9a42
+Revises: 9a4c2e7b1f30
+Create Date: 2026-10-19 00:21:05.613920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1b7c3d9a42"
+down_revision: Union[str, None] = "9a4c2e7b1f30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# as in cd8635bac9ee
+STARTED = "coalesce(r.status, '') NOT IN ('DNS', 'DNQ')"
+STATS_COLUMNS = f"""
+    count(*) FILTER (WHERE {STARTED}) AS starts,
+    count(*) FILTER (WHERE r.position = 1) AS wins,
+    count(*) FILTER (WHERE r.position <= 3) AS podiums,
+    count(*) FILTER (WHERE {STARTED} AND NOT r.classified) AS dnfs,
+    coalesce(sum(r.points), 0)::float8 AS points,
+    round(avg(r.grid) FILTER (WHERE r.grid > 0), 2)::float8 AS avg_grid,
+    round(avg(r.position), 2)::float8 AS avg_finish,
+    round(avg(r.grid - r.position) FILTER (WHERE r.grid > 0), 2)::float8
+        AS avg_positions_gained
+"""
+RACE_RESULTS = """
+    FROM session_results r
+    JOIN entries e ON e.id = r.entry_id
+    JOIN sessions s ON s.id = r.session_id
+    WHERE s.type = 'RACE'
+"""
+
+
+def _recreate_driver_stats(select: str) -> None:
+    op.execute("DROP MATERIALIZED VIEW season_driver_stats")
+    op.execute(f"CREATE MATERIALIZED VIEW season_driver_stats AS {select}")
+    op.create_index(
+        "uq_season_driver_stats", "season_driver_stats", ["season_id", "driver_id"], unique=True
+    )
+
+
+def upgrade() -> None:
+    # A driver who changes teams mid-season gets one entry per team
+    op.drop_constraint("uq_entries_season_driver", "entries", type_="unique")
+    # one row per driver over all their entries, shown with the team of their latest race
+    _recreate_driver_stats(
+        f"""
+        SELECT e.season_id, e.driver_id,
+            (array_agg(e.team_id ORDER BY ev.round DESC, e.id DESC))[1] AS team_id,
+            {STATS_COLUMNS}
+        FROM session_results r
+        JOIN entries e ON e.id = r.entry_id
+        JOIN sessions s ON s.id = r.session_id
+        JOIN events ev ON ev.id = s.event_id
+        WHERE s.type = 'RACE'
+        GROUP BY e.season_id, e.driver_id
+        """
+    )
+
+
+def downgrade() -> None:
+    _recreate_driver_stats(
+        f"""
+        SELECT e.season_id, e.driver_id, e.team_id, {STATS_COLUMNS}
+        {RACE_RESULTS}
+        GROUP BY e.season_id, e.driver_id, e.team_id
+        """
+    )
+    op.create_unique_constraint("uq_entries_season_driver", "entries", ["season_id", "driver_id"])
@@ -0,0 +1,38 @@
+"""binary collation for sort names
+
+Revision ID: 9a4c2e7b1f30
+Revises: cd8635bac9ee
+Create Date: 2026-10-18 23:58:31.207114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4c2e7b1f30"
+down_revision: Union[str, None] = "cd8635bac9ee"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# columns the list endpoints sort by -> length
+SORT_NAMES = {
+    ("drivers", "last_name"): 64,
+    ("drivers", "first_name"): 64,
+    ("teams", "name"): 128,
+}
+
+
+def upgrade() -> None:
+    # "C" orders by code point, as Python does for the reference index; ix_drivers_name
+    # is rebuilt with the new collation
+    for (table, column), length in SORT_NAMES.items():
+        op.alter_column(table, column, type_=sa.String(length, collation="C"))
+
+
+def downgrade() -> None:
+    for (table, column), length in SORT_NAMES.items():
+        op.alter_column(table, column, type_=sa.String(length, collation="default"))
@@ -0,0 +1,92 @@
+"""season stats skip non-starts
+
+Revision ID: cd8635bac9ee
+Revises: 43dde8fb6403
+Create Date: 2026-10-18 23:40:12.514307
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "cd8635bac9ee"
+down_revision: Union[str, None] = "43dde8fb6403"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# A DNS/DNQ row is a race the driver never started: it is neither a start nor a DNF
+STARTED = "coalesce(r.status, '') NOT IN ('DNS', 'DNQ')"
+
+STATS_COLUMNS = f"""
+    count(*) FILTER (WHERE {STARTED}) AS starts,
+    count(*) FILTER (WHERE r.position = 1) AS wins,
+    count(*) FILTER (WHERE r.position <= 3) AS podiums,
+    count(*) FILTER (WHERE {STARTED} AND NOT r.classified) AS dnfs,
+    coalesce(sum(r.points), 0)::float8 AS points,
+    round(avg(r.grid) FILTER (WHERE r.grid > 0), 2)::float8 AS avg_grid,
+    round(avg(r.position), 2)::float8 AS avg_finish,
+    round(avg(r.grid - r.position) FILTER (WHERE r.grid > 0), 2)::float8
+        AS avg_positions_gained
+"""
+# as created by 43dde8fb6403
+OLD_STATS_COLUMNS = """
+    count(*) AS starts,
+    count(*) FILTER (WHERE r.position = 1) AS wins,
+    count(*) FILTER (WHERE r.position <= 3) AS podiums,
+    count(*) FILTER (WHERE NOT r.classified) AS dnfs,
+    coalesce(sum(r.points), 0)::float8 AS points,
+    round(avg(r.grid) FILTER (WHERE r.grid > 0), 2)::float8 AS avg_grid,
+    round(avg(r.position), 2)::float8 AS avg_finish,
+    round(avg(r.grid - r.position) FILTER (WHERE r.grid > 0), 2)::float8
+        AS avg_positions_gained
+"""
+RACE_RESULTS = """
+    FROM session_results r
+    JOIN entries e ON e.id = r.entry_id
+    JOIN sessions s ON s.id = r.session_id
+    WHERE s.type = 'RACE'
+"""
+
+
+def _create_views(columns: str) -> None:
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW season_driver_stats AS
+        SELECT e.season_id, e.driver_id, e.team_id, {columns}
+        {RACE_RESULTS}
+        GROUP BY e.season_id, e.driver_id, e.team_id
+        """
+    )
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW season_team_stats AS
+        SELECT e.season_id, e.team_id, {columns}
+        {RACE_RESULTS}
+        GROUP BY e.season_id, e.team_id
+        """
+    )
+    # unique indexes are what REFRESH ... CONCURRENTLY diffs on
+    op.create_index(
+        "uq_season_driver_stats", "season_driver_stats", ["season_id", "driver_id"], unique=True
+    )
+    op.create_index(
+        "uq_season_team_stats", "season_team_stats", ["season_id", "team_id"], unique=True
+    )
+
+
+def _drop_views() -> None:
+    op.execute("DROP MATERIALIZED VIEW season_team_stats")
+    op.execute("DROP MATERIALIZED VIEW season_driver_stats")
+
+
+def upgrade() -> None:
+    _drop_views()
+    _create_views(STATS_COLUMNS)
+
+
+def downgrade() -> None:
+    _drop_views()
+    _create_views(OLD_STATS_COLUMNS)
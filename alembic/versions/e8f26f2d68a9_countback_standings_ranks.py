@@ -0,0 +1,77 @@
+"""countback standings ranks
+
+Revision ID: e8f26f2d68a9
+Revises: d33cd0ad87ab
+Create Date: 2026-10-18 21:08:00.851938
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "e8f26f2d68a9"
+down_revision: Union[str, None] = "d33cd0ad87ab"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Per-position finish counts packed base 256 (see f1api.services.standings)
+COUNTBACK = """
+    coalesce(
+        sum(power(256::numeric, 64 - r.position)) FILTER (WHERE r.position BETWEEN 1 AND 64),
+        0
+    )
+"""
+
+
+def upgrade() -> None:
+    # Re-rank persisted standings by points, then countback; equal competitors share a rank
+    op.execute(
+        f"""
+        UPDATE driver_standings ds SET position = ranked.position
+        FROM (
+            SELECT e.season_id, e.driver_id,
+                   rank() OVER (
+                       PARTITION BY e.season_id ORDER BY sum(r.points) DESC, {COUNTBACK} DESC
+                   ) AS position
+            FROM session_results r
+            JOIN entries e ON e.id = r.entry_id
+            JOIN sessions s ON s.id = r.session_id
+            WHERE s.type = 'RACE'
+            GROUP BY e.season_id, e.driver_id, e.team_id
+        ) AS ranked
+        WHERE ds.season_id = ranked.season_id AND ds.driver_id = ranked.driver_id
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE constructor_standings cs SET position = ranked.position
+        FROM (
+            SELECT e.season_id, e.team_id,
+                   rank() OVER (
+                       PARTITION BY e.season_id ORDER BY sum(r.points) DESC, {COUNTBACK} DESC
+                   ) AS position
+            FROM session_results r
+            JOIN entries e ON e.id = r.entry_id
+            JOIN sessions s ON s.id = r.session_id
+            WHERE s.type = 'RACE'
+            GROUP BY e.season_id, e.team_id
+        ) AS ranked
+        WHERE cs.season_id = ranked.season_id AND cs.team_id = ranked.team_id
+        """
+    )
+    # positions changed: invalidate standings ETags
+    op.execute(
+        """
+        INSERT INTO data_versions (scope, version) VALUES ('standings', 1)
+        ON CONFLICT (scope) DO UPDATE
+        SET version = data_versions.version + 1, updated_at = now()
+        """
+    )
+
+
+def downgrade() -> None:
+    # the previous alphabetical tie-break is not restored
+    pass
@@ -0,0 +1,123 @@
+"""
+Batch lookups by id, and by ref where the resource has one.
+
+``GET /<resource>:batchGet?ids=1,2,3&refs=a,b`` (cached and ETagged like any other
+GET) and ``POST /<resource>:batchGet`` with a ``BatchGetRequest`` body resolve all
+keys in one ``WHERE id = ANY(:ids) OR ref = ANY(:refs)`` query. Items come back in
+request order (ids, then refs; each row once) and keys that matched nothing are
+listed under ``missing``. ``?fields=`` narrows the items as on the other endpoints.
+Resources held in the reference index (``f1api.core.reference``) are resolved from
+its maps by ``batch_lookup`` instead, without a query.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Integer, String, any_, bindparam, or_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from f1api.api.fields import Columns, select_fields
+from f1api.api.serialization import FastJSONResponse, serialize_rows
+from f1api.schemas import BatchGetRequest, BatchMissing
+from f1api.schemas.batch import MAX_BATCH_KEYS
+
+IdsQuery = Query(None, description="Comma-separated ids, e.g. `1,2,3`")
+RefsQuery = Query(None, description="Comma-separated refs, e.g. `max_verstappen,norris`")
+
+
+def parse_keys(ids: str | None, refs: str | None = None) -> BatchGetRequest:
+    """Keys from the query string of a batch GET."""
+    try:
+        id_list = [int(i) for i in (ids or "").split(",") if i.strip()]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers") from exc
+    ref_list = [r.strip() for r in (refs or "").split(",") if r.strip()]
+    try:
+        return BatchGetRequest(ids=id_list, refs=ref_list)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BATCH_KEYS} ids and {MAX_BATCH_KEYS} refs"
+        ) from exc
+
+
+def _unique_keys(keys: BatchGetRequest, has_refs: bool) -> tuple[list[int], list[str]]:
+    if keys.refs and not has_refs:
+        raise HTTPException(status_code=400, detail="This resource can only be looked up by id")
+    ids = list(dict.fromkeys(keys.ids))
+    refs = list(dict.fromkeys(keys.refs))
+    if not ids and not refs:
+        raise HTTPException(status_code=400, detail="No ids or refs to look up")
+    return ids, refs
+
+
+def _batch_response(
+    ids: Sequence[int],
+    refs: Sequence[str],
+    by_id: Mapping[int, Any],
+    by_ref: Mapping[str, Any],
+    schema: type[BaseModel],
+    names: Sequence[str],
+) -> FastJSONResponse:
+    found: dict[int, Any] = {}  # id -> row, in request order
+    missing = BatchMissing()
+    for key in ids:
+        if key in by_id:
+            found.setdefault(key, by_id[key])
+        else:
+            missing.ids.append(key)
+    for ref in refs:
+        if ref in by_ref:
+            found.setdefault(by_ref[ref].id, by_ref[ref])
+        else:
+            missing.refs.append(ref)
+
+    return FastJSONResponse(
+        {
+            "items": serialize_rows(list(found.values()), schema, names),
+            "missing": missing.model_dump(),
+        }
+    )
+
+
+async def batch_get(
+    db: AsyncSession,
+    keys: BatchGetRequest,
+    schema: type[BaseModel],
+    columns: Columns,
+    names: Sequence[str],
+    id_col: InstrumentedAttribute[int],
+    ref_col: InstrumentedAttribute[str] | None = None,
+) -> FastJSONResponse:
+    """``BatchResponse[schema]`` for ``keys``, fetched in one query."""
+    ids, refs = _unique_keys(keys, ref_col is not None)
+    key_cols: list[InstrumentedAttribute[Any]] = [id_col] if ref_col is None else [id_col, ref_col]
+    conditions: list[ColumnElement[bool]] = []
+    if ids:
+        conditions.append(id_col == any_(bindparam("ids", ids, type_=ARRAY(Integer))))
+    if ref_col is not None and refs:
+        conditions.append(ref_col == any_(bindparam("refs", refs, type_=ARRAY(String))))
+    stmt = select_fields(columns, names, key_cols).where(or_(*conditions))
+    rows = (await db.execute(stmt)).all()
+
+    by_id = {getattr(row, id_col.key): row for row in rows}
+    by_ref = {getattr(row, ref_col.key): row for row in rows} if ref_col is not None else {}
+    return _batch_response(ids, refs, by_id, by_ref, schema, names)
+
+
+def batch_lookup(
+    keys: BatchGetRequest,
+    schema: type[BaseModel],
+    names: Sequence[str],
+    by_id: Mapping[int, Any],
+    by_ref: Mapping[str, Any] | None = None,
+) -> FastJSONResponse:
+    """``BatchResponse[schema]`` for ``keys``, resolved from in-memory maps of records."""
+    ids, refs = _unique_keys(keys, by_ref is not None)
+    return _batch_response(ids, refs, by_id, by_ref or {}, schema, names)
@@ -1,44 +1,97 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from f1api.core.db import get_db
+from f1api.api.batch import IdsQuery, RefsQuery, batch_lookup, parse_keys
+from f1api.api.fields import FieldsQuery, model_columns, parse_fields, select_fields
+from f1api.api.pagination import CountMode, CountQuery, CursorQuery, paginate, paginate_records
+from f1api.api.serialization import FastJSONResponse, item_response, page_response
+from f1api.core.db import read_session
+from f1api.core.reference import ReferenceIndex, get_reference_index, reference_index
 from f1api.models import Driver
-from f1api.schemas import DriverRead, PaginatedResponse
+from f1api.schemas import BatchGetRequest, BatchResponse, DriverRead, PaginatedResponse
+
+_COLUMNS = model_columns(Driver, DriverRead)
 
 router = APIRouter(prefix="/drivers", tags=["Drivers"])
 
 
 @router.get("", response_model=PaginatedResponse[DriverRead])
-def list_drivers(
-    db: Session = Depends(get_db),  # noqa: B008
+async def list_drivers(
+    request: Request,
     ref: str | None = None,
     code: str | None = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[DriverRead]:
-    # Build base query
-    stmt = select(Driver)
-    if ref:
-        stmt = stmt.filter(Driver.ref == ref)
-    if code:
-        stmt = stmt.filter(Driver.code == code)
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, DriverRead)
+    order_by = (Driver.last_name, Driver.first_name, Driver.id)
+
+    # ref/code lookups are answered from the reference index, without a session
+    if ref or code:
+        index = await reference_index.current()
+        if ref:
+            driver = index.drivers_by_ref.get(ref)
+            records = [driver] if driver and (not code or driver.code == code) else []
+        else:
+            records = list(index.drivers_by_code.get(code or "", ()))
+        page = paginate_records(
+            records,
+            order_by=[col.key for col in order_by],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+        return page_response(page, DriverRead, limit, offset, names)
+
+    # Get paginated items over just the requested columns (plus total count, per ?count=)
+    async with read_session(request) as db:
+        page = await paginate(
+            db,
+            select_fields(_COLUMNS, names, order_by),
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+    return page_response(page, DriverRead, limit, offset, names)
+
 
-    # Get total count (before limit/offset)
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = db.scalar(count_stmt) or 0
+@router.get(":batchGet", response_model=BatchResponse[DriverRead])
+async def batch_get_drivers(
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    ids: str | None = IdsQuery,
+    refs: str | None = RefsQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Look up many drivers by id and/or ref at once."""
+    names = parse_fields(fields, DriverRead)
+    keys = parse_keys(ids, refs)
+    return batch_lookup(keys, DriverRead, names, index.drivers, index.drivers_by_ref)
 
-    # Get paginated items
-    stmt = stmt.order_by(Driver.last_name, Driver.first_name).limit(limit).offset(offset)
-    drivers = db.scalars(stmt).all()
-    items = [DriverRead.model_validate(d) for d in drivers]
 
-    return PaginatedResponse.create(items=items, total=total, limit=limit, offset=offset)
+@router.post(":batchGet", response_model=BatchResponse[DriverRead])
+async def batch_get_drivers_post(
+    keys: BatchGetRequest,
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Same as the GET form, for key lists too long for a URL."""
+    names = parse_fields(fields, DriverRead)
+    return batch_lookup(keys, DriverRead, names, index.drivers, index.drivers_by_ref)
 
 
 @router.get("/{driver_id}", response_model=DriverRead)
-def get_driver(driver_id: int, db: Session = Depends(get_db)) -> DriverRead:  # noqa: B008
-    driver = db.get(Driver, driver_id)
+async def get_driver(
+    driver_id: int,
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, DriverRead)
+    driver = index.drivers.get(driver_id)
     if not driver:
         raise HTTPException(status_code=404, detail="Driver not found")
-    return DriverRead.model_validate(driver)
+    return item_response(driver, DriverRead, names)
@@ -1,41 +1,106 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from f1api.core.db import get_db
+from f1api.api.batch import IdsQuery, batch_get, parse_keys
+from f1api.api.fields import FieldsQuery, model_columns, parse_fields, select_fields
+from f1api.api.pagination import CountMode, CountQuery, CursorQuery, paginate
+from f1api.api.serialization import FastJSONResponse, item_response, page_response
+from f1api.api.sessions import RESULT_SHEET, build_classification
+from f1api.core.db import get_read_db
 from f1api.models import Event, Season
-from f1api.schemas import EventRead, PaginatedResponse
+from f1api.schemas import (
+    BatchGetRequest,
+    BatchResponse,
+    EventClassification,
+    EventRead,
+    PaginatedResponse,
+)
+
+_COLUMNS = model_columns(Event, EventRead)
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
 
 @router.get("", response_model=PaginatedResponse[EventRead])
-def list_events(
-    db: Session = Depends(get_db),  # noqa: B008
+async def list_events(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
     season_year: int | None = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[EventRead]:
-    # Build base query
-    stmt = select(Event)
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    # Build base query over just the requested columns
+    names = parse_fields(fields, EventRead)
+    order_by = (Event.round, Event.id)
+    stmt = select_fields(_COLUMNS, names, order_by)
     if season_year:
         stmt = stmt.join(Event.season).filter(Season.year == season_year)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = db.scalar(count_stmt) or 0
+    # Get paginated items (plus total count, per ?count=)
+    page = await paginate(
+        db,
+        stmt,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+    )
+    return page_response(page, EventRead, limit, offset, names)
+
 
-    # Get paginated items
-    stmt = stmt.order_by(Event.round).limit(limit).offset(offset)
-    events = db.scalars(stmt).all()
-    items = [EventRead.model_validate(e) for e in events]
+@router.get(":batchGet", response_model=BatchResponse[EventRead])
+async def batch_get_events(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    ids: str | None = IdsQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Look up many events by id in one query."""
+    names = parse_fields(fields, EventRead)
+    keys = parse_keys(ids)
+    return await batch_get(db, keys, EventRead, _COLUMNS, names, Event.id)
 
-    return PaginatedResponse.create(items=items, total=total, limit=limit, offset=offset)
+
+@router.post(":batchGet", response_model=BatchResponse[EventRead])
+async def batch_get_events_post(
+    keys: BatchGetRequest,
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Same as the GET form, for key lists too long for a URL."""
+    names = parse_fields(fields, EventRead)
+    return await batch_get(db, keys, EventRead, _COLUMNS, names, Event.id)
 
 
 @router.get("/{event_id}", response_model=EventRead)
-def get_event(event_id: int, db: Session = Depends(get_db)) -> EventRead:  # noqa: B008
-    event = db.get(Event, event_id)
+async def get_event(
+    event_id: int,
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, EventRead)
+    event = (await db.execute(select_fields(_COLUMNS, names).filter(Event.id == event_id))).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return item_response(event, EventRead, names)
+
+
+@router.get("/{event_id}/results", response_model=EventClassification)
+async def get_event_results(
+    event_id: int,
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+) -> EventClassification:
+    """Classification of every session of an event, loaded in a fixed number of queries."""
+    event = await db.get(
+        Event, event_id, options=[selectinload(Event.sessions).options(RESULT_SHEET)]
+    )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return EventRead.model_validate(event)
+    sessions = sorted(event.sessions, key=lambda s: (s.session_order, s.id))
+    return EventClassification(
+        event=EventRead.model_validate(event),
+        sessions=[build_classification(s) for s in sessions],
+    )
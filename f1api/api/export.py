@@ -0,0 +1,132 @@
+"""
+Bulk export of session results as NDJSON, CSV, Arrow IPC or Parquet.
+
+Rows are read from a server-side cursor ``EXPORT_BATCH_ROWS`` at a time and
+encoded batch by batch into a ``StreamingResponse``, so memory stays flat however
+many rows are exported. FastAPI closes dependency sessions before a streamed body
+runs, so the stream opens its own read connection (replica routing and
+``X-Read-Your-Writes`` apply as for any other read). The ETag is sent before that
+connection is chosen, so the stream skips replicas that are behind it. The columnar formats need
+the optional ``arrow`` extra and answer 501 without it.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from enum import StrEnum
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, Select, select
+
+from f1api.core.db import WRITER_LSN_SCOPE_KEY, read_connection, read_your_writes
+from f1api.models import Season
+from f1api.services.export import (
+    EXPORT_BATCH_ROWS,
+    RESULT_COLUMNS,
+    ColumnarWriter,
+    pa,
+    results_export_query,
+)
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+
+FormatQuery = Query(
+    ExportFormat.NDJSON,
+    description="ndjson (one JSON object per line), csv, arrow (IPC stream) or parquet",
+)
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+async def stream_batches(
+    stmt: Select[Any], primary: bool = False, fresh_as_of: int | None = None
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """``stmt``'s rows in batches, from a server-side cursor on a read connection."""
+    async with read_connection(primary=primary, fresh_as_of=fresh_as_of) as conn:
+        result = await conn.stream(stmt.execution_options(yield_per=EXPORT_BATCH_ROWS))
+        async for batch in result.partitions():
+            yield batch
+
+
+async def _ndjson(batches: AsyncIterator[Sequence[Row[Any]]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b"".join(
+            orjson.dumps(row._asdict(), option=orjson.OPT_APPEND_NEWLINE) for row in batch
+        )
+
+
+async def _csv(batches: AsyncIterator[Sequence[Row[Any]]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(RESULT_COLUMNS)
+    async for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # header only: nothing was exported
+        yield buffer.getvalue().encode()
+
+
+async def _columnar(
+    batches: AsyncIterator[Sequence[Row[Any]]], format: ExportFormat
+) -> AsyncIterator[bytes]:
+    writer = ColumnarWriter(format.value)
+    async for batch in batches:
+        if chunk := writer.write(batch):
+            yield chunk
+    yield writer.close()
+
+
+@router.get("/results", response_class=StreamingResponse)
+async def export_results(
+    request: Request,
+    season_year: int | None = Query(None, description="Season year (default: every season)"),
+    format: ExportFormat = FormatQuery,
+) -> StreamingResponse:
+    """
+    Stream every session result (of one season, if given) with its session, event,
+    driver and team, one flat row per result.
+    """
+    if format in (ExportFormat.ARROW, ExportFormat.PARQUET) and pa is None:
+        raise HTTPException(status_code=501, detail=f"{format} export needs the arrow extra")
+    primary = read_your_writes(request.scope)
+    fresh_as_of = request.scope.get(WRITER_LSN_SCOPE_KEY)
+    if season_year is not None:
+        async with read_connection(primary=primary, fresh_as_of=fresh_as_of) as conn:
+            if not await conn.scalar(select(Season.id).filter(Season.year == season_year)):
+                raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    batches = stream_batches(
+        results_export_query(season_year), primary=primary, fresh_as_of=fresh_as_of
+    )
+    if format is ExportFormat.NDJSON:
+        body = _ndjson(batches)
+    elif format is ExportFormat.CSV:
+        body = _csv(batches)
+    else:
+        body = _columnar(batches, format)
+    filename = f"results-{season_year or 'all'}.{format.value}"
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
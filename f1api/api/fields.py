@@ -0,0 +1,60 @@
+"""
+Sparse fieldsets: ``?fields=id,code,last_name`` on list and detail endpoints.
+
+The requested fields narrow the SQL projection as well as the payload: only their
+columns are selected (plus the sort keys keyset pagination reads off the last row),
+as plain rows rather than ORM entities. Without ``?fields=`` every field of the
+response schema is returned, in schema order. Unknown names are a 400.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from f1api.api.pagination import SortKey, sort_column
+
+FieldsQuery = Query(
+    None,
+    description="Comma-separated fields to return, e.g. `id,code,last_name` (default: all)",
+)
+
+# response field name -> column it is read from
+Columns = Mapping[str, ColumnElement[Any] | InstrumentedAttribute[Any]]
+
+
+def model_columns(
+    model: type[Any], schema: type[BaseModel]
+) -> dict[str, InstrumentedAttribute[Any]]:
+    """Columns of ``model`` named like the fields of ``schema``."""
+    return {name: getattr(model, name) for name in schema.model_fields}
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...]:
+    """Requested field names in schema order (all fields when ``fields`` is empty)."""
+    requested = {name.strip() for name in (fields or "").split(",")} - {""}
+    if not requested:
+        return tuple(schema.model_fields)
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(name for name in schema.model_fields if name in requested)
+
+
+def select_fields(
+    columns: Columns,
+    names: Sequence[str],
+    order_by: Sequence[SortKey] = (),
+) -> Select[Any]:
+    """``SELECT`` of the ``names`` columns, plus any ``order_by`` keys not among them."""
+    selected: list[ColumnElement[Any] | InstrumentedAttribute[Any]]
+    selected = [columns[name].label(name) for name in names]
+    sort_columns = [sort_column(key)[0] for key in order_by]
+    selected += [col for col in sort_columns if col.key not in names]
+    return select(*selected)
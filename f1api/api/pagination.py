@@ -0,0 +1,244 @@
+"""
+Shared limit/offset and keyset (cursor) pagination for list endpoints.
+
+Cursor mode is opt-in via ``?cursor=`` (empty value for the first page). It seeks
+past the last row of the previous page on the endpoint's sort keys instead of
+scanning and discarding ``offset`` rows, and skips the total count. Sort keys are
+ascending unless given as ``column.desc()``.
+
+``?count=`` chooses how ``total`` is produced: ``exact`` (``count(*)``), ``estimate``
+(planner statistics, no scan) or ``none``. It defaults to ``exact`` in offset mode
+and ``none`` in cursor mode. ``paginate_records`` applies the same parameters to
+records already in memory (the reference index); its totals are always exact.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import StrEnum
+from typing import Any
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Select, Table, and_, func, or_, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+# a column, ascending, or ``column.desc()``
+SortKey = InstrumentedAttribute[Any] | UnaryExpression[Any]
+
+
+class CountMode(StrEnum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+CursorQuery = Query(
+    None,
+    description="Opaque keyset cursor from `next_cursor`; pass an empty value to start "
+    "cursor pagination (offset and total are then ignored)",
+)
+
+CountQuery = Query(
+    None,
+    description="How to compute `total`: exact, estimate (planner statistics) or none "
+    "(default: exact, or none in cursor mode)",
+)
+
+
+@dataclass(slots=True)
+class Page:
+    rows: Sequence[Any]
+    total: int | None
+    next_cursor: str | None
+    cursor_mode: bool
+    total_is_estimate: bool = False
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, arity: int) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if (
+        not isinstance(values, list)
+        or len(values) != arity
+        or not all(isinstance(v, str | int | float) for v in values)
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def sort_column(key: SortKey) -> tuple[Any, bool]:
+    """The column a sort key orders by, and whether it is descending."""
+    if isinstance(key, UnaryExpression) and key.modifier is operators.desc_op:
+        return key.element, True
+    return key, False
+
+
+def _seek(order_by: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows strictly after ``values`` in ``order_by`` order."""
+    keys = [sort_column(key) for key in order_by]
+    if not any(descending for _, descending in keys):
+        return tuple_(*(col for col, _ in keys)) > tuple_(*values)
+    # mixed directions have no row-value form: (a < x) OR (a = x AND b > y) ...
+    return or_(
+        *(
+            and_(
+                *(prev == value for (prev, _), value in zip(keys[:i], values[:i], strict=True)),
+                col < values[i] if descending else col > values[i],
+            )
+            for i, (col, descending) in enumerate(keys)
+        )
+    )
+
+
+def _check_cursor_types(values: Sequence[Any], order_by: Sequence[Any]) -> None:
+    """
+    Reject cursor values that do not fit their sort column (e.g. a cursor from
+    another endpoint), before they reach the database as a row comparison.
+    """
+    for value, key in zip(values, order_by, strict=True):
+        col, _ = sort_column(key)
+        try:
+            expected = col.type.python_type
+        except NotImplementedError:
+            continue
+        if isinstance(value, bool):
+            ok = expected is bool
+        elif expected in (float, Decimal):
+            ok = isinstance(value, int | float)
+        else:
+            ok = isinstance(value, expected)
+        if not ok:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _fetch(db: AsyncSession, stmt: Select[Any]) -> Sequence[Any]:
+    """ORM entities for ``select(Model)``, plain rows for column selects."""
+    descriptions = stmt.column_descriptions
+    if len(descriptions) == 1 and isinstance(descriptions[0]["expr"], type):
+        return (await db.scalars(stmt)).all()
+    return (await db.execute(stmt)).all()
+
+
+async def estimate_count(db: AsyncSession, stmt: Select[Any]) -> int:
+    """
+    Row estimate from planner statistics, without scanning.
+
+    Unfiltered single-table selects read ``pg_class.reltuples``; anything else (or
+    a never-analyzed table) uses the top-level ``EXPLAIN`` row estimate.
+    """
+    froms = stmt.get_final_froms()
+    if stmt.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+        reltuples = await db.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:name AS regclass)"),
+            {"name": froms[0].name},
+        )
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    conn = await db.connection()
+    compiled = stmt.compile(dialect=conn.dialect)
+    plan = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)
+    return int(plan.scalar_one()[0]["Plan"]["Plan Rows"])
+
+
+def paginate_records(
+    records: Sequence[Any],
+    *,
+    order_by: Sequence[str],
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count: CountMode | None = None,
+) -> Page:
+    """
+    ``paginate`` over in-memory records, ordered by the ``order_by`` attributes
+    (which must make the ordering total).
+
+    Strings compare by code point, so text sort columns must use the ``"C"``
+    collation in the database for both paths to agree.
+    """
+    if count is None:
+        count = CountMode.NONE if cursor is not None else CountMode.EXACT
+    total = None if count is CountMode.NONE else len(records)
+
+    def key(record: Any) -> tuple[Any, ...]:
+        return tuple(getattr(record, name) for name in order_by)
+
+    rows = sorted(records, key=key)
+    if cursor is not None:
+        if cursor:
+            after = tuple(decode_cursor(cursor, len(order_by)))
+            try:
+                rows = [row for row in rows if key(row) > after]
+            except TypeError as exc:  # cursor values of the wrong types
+                raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(key(rows[-1]))
+        return Page(rows, total, next_cursor, cursor_mode=True)
+
+    return Page(rows[offset : offset + limit], total, None, cursor_mode=False)
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select[Any],
+    *,
+    order_by: Sequence[SortKey],
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count: CountMode | None = None,
+    count_stmt: Select[Any] | None = None,
+) -> Page:
+    """
+    Run ``stmt`` (unordered) for one page.
+
+    ``order_by`` must make the ordering total (end with a unique key) and its
+    attribute names must be readable from the result rows.
+    """
+    if count is None:
+        count = CountMode.NONE if cursor is not None else CountMode.EXACT
+
+    total: int | None = None
+    if count is CountMode.EXACT:
+        if count_stmt is None:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+        total = await db.scalar(count_stmt) or 0
+    elif count is CountMode.ESTIMATE:
+        total = await estimate_count(db, stmt)
+    estimated = count is CountMode.ESTIMATE
+
+    if cursor is not None:
+        if cursor:
+            values = decode_cursor(cursor, len(order_by))
+            _check_cursor_types(values, order_by)
+            stmt = stmt.where(_seek(order_by, values))
+        rows = await _fetch(db, stmt.order_by(*order_by).limit(limit + 1))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(
+                [getattr(rows[-1], sort_column(key)[0].key) for key in order_by]
+            )
+        return Page(rows, total, next_cursor, cursor_mode=True, total_is_estimate=estimated)
+
+    rows = await _fetch(db, stmt.order_by(*order_by).limit(limit).offset(offset))
+    return Page(rows, total, None, cursor_mode=False, total_is_estimate=estimated)
@@ -1,10 +1,13 @@
 from fastapi import APIRouter
 
-from f1api.api import drivers, events, seasons, standings, teams
+from f1api.api import drivers, events, export, seasons, sessions, standings, stats, teams
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(seasons.router)
 api_router.include_router(teams.router)
 api_router.include_router(drivers.router)
 api_router.include_router(events.router)
+api_router.include_router(sessions.router)
 api_router.include_router(standings.router)
+api_router.include_router(stats.router)
+api_router.include_router(export.router)
@@ -1,34 +1,163 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
-from f1api.core.db import get_db
-from f1api.models import Season
-from f1api.schemas import PaginatedResponse, SeasonRead
+from f1api.api.batch import IdsQuery, batch_lookup, parse_keys
+from f1api.api.fields import FieldsQuery, model_columns, parse_fields, select_fields
+from f1api.api.pagination import CountMode, CountQuery, CursorQuery, paginate
+from f1api.api.serialization import (
+    FastJSONResponse,
+    item_response,
+    page_response,
+    serialize_rows,
+)
+from f1api.api.standings import (
+    CONSTRUCTOR_STANDING_ORDER,
+    DRIVER_STANDING_ORDER,
+    constructor_standings_select,
+    driver_standings_select,
+)
+from f1api.core.db import get_read_db
+from f1api.core.reference import ReferenceIndex, get_reference_index
+from f1api.models import Entry, Event, Season
+from f1api.schemas import (
+    BatchGetRequest,
+    BatchResponse,
+    CircuitRead,
+    ConstructorStandingRead,
+    DriverRead,
+    DriverStandingRead,
+    EventRead,
+    PaginatedResponse,
+    SeasonRead,
+    SeasonSnapshot,
+    TeamRead,
+)
+
+_COLUMNS = model_columns(Season, SeasonRead)
+
+# The season's events with their circuit, and its entries with driver and team: one
+# SELECT each (selectinload) with the related rows joined in
+SEASON_DOCUMENT = (
+    selectinload(Season.events).joinedload(Event.circuit),
+    selectinload(Season.entries).options(joinedload(Entry.driver), joinedload(Entry.team)),
+)
 
 router = APIRouter(prefix="/seasons", tags=["Seasons"])
 
 
 @router.get("", response_model=PaginatedResponse[SeasonRead])
-def list_seasons(
-    db: Session = Depends(get_db),  # noqa: B008
+async def list_seasons(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[SeasonRead]:
-    # Get total count
-    total = db.scalar(select(func.count()).select_from(Season)) or 0
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, SeasonRead)
+    order_by = (Season.year,)
+
+    # Get paginated items (plus total count, per ?count=)
+    page = await paginate(
+        db,
+        select_fields(_COLUMNS, names, order_by),
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        count_stmt=select(func.count()).select_from(Season),
+    )
+    return page_response(page, SeasonRead, limit, offset, names)
+
+
+@router.get(":batchGet", response_model=BatchResponse[SeasonRead])
+async def batch_get_seasons(
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    ids: str | None = IdsQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Look up many seasons by id at once."""
+    names = parse_fields(fields, SeasonRead)
+    keys = parse_keys(ids)
+    return batch_lookup(keys, SeasonRead, names, index.seasons)
 
-    # Get paginated items
-    stmt = select(Season).order_by(Season.year).limit(limit).offset(offset)
-    seasons = db.scalars(stmt).all()
-    items = [SeasonRead.model_validate(s) for s in seasons]
 
-    return PaginatedResponse.create(items=items, total=total, limit=limit, offset=offset)
+@router.post(":batchGet", response_model=BatchResponse[SeasonRead])
+async def batch_get_seasons_post(
+    keys: BatchGetRequest,
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Same as the GET form, for key lists too long for a URL."""
+    names = parse_fields(fields, SeasonRead)
+    return batch_lookup(keys, SeasonRead, names, index.seasons)
 
 
 @router.get("/{season_id}", response_model=SeasonRead)
-def get_season(season_id: int, db: Session = Depends(get_db)) -> SeasonRead:  # noqa: B008
-    season = db.get(Season, season_id)
+async def get_season(
+    season_id: int,
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, SeasonRead)
+    season = index.seasons.get(season_id)
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
-    return SeasonRead.model_validate(season)
+    return item_response(season, SeasonRead, names)
+
+
+@router.get("/{year}/snapshot", response_model=SeasonSnapshot)
+async def get_season_snapshot(
+    year: int,
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+) -> FastJSONResponse:
+    """
+    A season as one document: events with circuits, entries with drivers and teams,
+    and both championship tables, in five queries. The response cache keeps the
+    serialized document until one of the data scopes it reads changes.
+    """
+    season = await db.scalar(select(Season).filter(Season.year == year).options(*SEASON_DOCUMENT))
+    if not season:
+        raise HTTPException(status_code=404, detail=f"Season {year} not found")
+
+    driver_standings = await db.execute(
+        driver_standings_select(season.id, tuple(DriverStandingRead.model_fields)).order_by(
+            *DRIVER_STANDING_ORDER
+        )
+    )
+    constructor_standings = await db.execute(
+        constructor_standings_select(
+            season.id, tuple(ConstructorStandingRead.model_fields)
+        ).order_by(*CONSTRUCTOR_STANDING_ORDER)
+    )
+    events = sorted(season.events, key=lambda e: (e.round, e.id))
+    entries = sorted(season.entries, key=lambda e: (e.team.name, e.driver.last_name, e.id))
+    return FastJSONResponse(
+        {
+            "season": serialize_rows([season], SeasonRead)[0],
+            "events": [
+                {**event, "circuit": circuit}
+                for event, circuit in zip(
+                    serialize_rows(events, EventRead),
+                    serialize_rows([e.circuit for e in events], CircuitRead),
+                    strict=True,
+                )
+            ],
+            "entries": [
+                {"id": e.id, "car_number": e.car_number, "driver": driver, "team": team}
+                for e, driver, team in zip(
+                    entries,
+                    serialize_rows([e.driver for e in entries], DriverRead),
+                    serialize_rows([e.team for e in entries], TeamRead),
+                    strict=True,
+                )
+            ],
+            "driver_standings": serialize_rows(driver_standings.all(), DriverStandingRead),
+            "constructor_standings": serialize_rows(
+                constructor_standings.all(), ConstructorStandingRead
+            ),
+        }
+    )
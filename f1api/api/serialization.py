@@ -0,0 +1,83 @@
+"""
+Fast JSON path for list endpoints.
+
+The default path validates every row into a schema model, re-validates the list
+in ``PaginatedResponse``, validates the return value against ``response_model``
+and then JSON-encodes it. Routers that opt in instead read the schema's fields
+straight off ORM entities / ``Row`` tuples and encode the page with orjson. The
+output is byte-identical to the default path. The ``response_model`` is still
+declared on the route for the OpenAPI schema. Items can be narrowed to the
+fields requested with ``?fields=`` (see ``f1api.api.fields``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from functools import cache
+from operator import attrgetter
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from f1api.api.pagination import Page
+from f1api.schemas import PaginatedResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson (same compact, non-ASCII-escaped output)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@cache
+def row_reader(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Getter returning the ``names`` values, in order, from an entity or Row."""
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return lambda row: (getter(row),)
+    return getter
+
+
+def serialize_rows(
+    rows: Sequence[Any], schema: type[BaseModel], fields: Sequence[str] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Rows as plain dicts shaped like ``schema`` (trusted DB values, no validation),
+    narrowed to ``fields`` (in that order) when given.
+    """
+    names = tuple(schema.model_fields if fields is None else fields)
+    read = row_reader(names)
+    return [dict(zip(names, read(row), strict=True)) for row in rows]
+
+
+def item_response(
+    row: Any, schema: type[BaseModel], fields: Sequence[str] | None = None
+) -> FastJSONResponse:
+    """A single ``schema`` item (or the ``fields`` of it), encoded without pydantic."""
+    return FastJSONResponse(serialize_rows([row], schema, fields)[0])
+
+
+def page_response(
+    page: Page,
+    schema: type[BaseModel],
+    limit: int,
+    offset: int,
+    fields: Sequence[str] | None = None,
+) -> FastJSONResponse:
+    """``PaginatedResponse[schema]`` for ``page``, encoded without pydantic."""
+    page_no, pages = PaginatedResponse.page_numbers(page.total, limit, offset, page.cursor_mode)
+    return FastJSONResponse(
+        {
+            "items": serialize_rows(page.rows, schema, fields),
+            "total": page.total,
+            "total_is_estimate": page.total_is_estimate,
+            "limit": limit,
+            "offset": offset,
+            "page": page_no,
+            "pages": pages,
+            "next_cursor": page.next_cursor,
+        }
+    )
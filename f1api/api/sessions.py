@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from f1api.core.db import get_read_db
+from f1api.models import Entry, SessionResult
+from f1api.models import Session as RaceSession
+from f1api.schemas import ClassificationRow, SessionClassification, SessionRead
+
+router = APIRouter(prefix="/sessions", tags=["Sessions"])
+
+
+# Eager-load a session's results with entry, driver and team: one SELECT for all
+# results (selectinload) joined to entries/drivers/teams, instead of a lazy load per
+# result row. Nest it under an outer loader with ``.options(RESULT_SHEET)``.
+RESULT_SHEET = selectinload(RaceSession.results).options(
+    joinedload(SessionResult.entry).options(joinedload(Entry.driver), joinedload(Entry.team))
+)
+
+
+def _sort_key(result: SessionResult) -> tuple[int, int, int]:
+    # Classified positions first, then unclassified by laps completed
+    return (
+        result.position if result.position is not None else 10_000,
+        -(result.laps or 0),
+        result.id,
+    )
+
+
+def build_classification(session: RaceSession) -> SessionClassification:
+    """Session plus its ordered result sheet; relationships must already be loaded."""
+    rows = []
+    for result in sorted(session.results, key=_sort_key):
+        entry = result.entry
+        rows.append(
+            ClassificationRow(
+                position=result.position,
+                driver_id=entry.driver.id,
+                driver_ref=entry.driver.ref,
+                driver_code=entry.driver.code,
+                driver_first_name=entry.driver.first_name,
+                driver_last_name=entry.driver.last_name,
+                team_id=entry.team.id,
+                team_name=entry.team.name,
+                car_number=entry.car_number,
+                grid=result.grid,
+                laps=result.laps,
+                points=result.points,
+                status=result.status,
+                time_ms=result.time_ms,
+                gap_ms=result.gap_ms,
+                classified=result.classified,
+            )
+        )
+    return SessionClassification(session=SessionRead.model_validate(session), results=rows)
+
+
+@router.get("/{session_id}", response_model=SessionRead)
+async def get_session(
+    session_id: int,
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+) -> SessionRead:
+    session = await db.get(RaceSession, session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return SessionRead.model_validate(session)
+
+
+@router.get("/{session_id}/results", response_model=SessionClassification)
+async def get_session_results(
+    session_id: int,
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+) -> SessionClassification:
+    """Full classification of a session (driver, team, position, points, gap, laps, grid)."""
+    session = await db.get(RaceSession, session_id, options=[RESULT_SHEET])
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return build_classification(session)
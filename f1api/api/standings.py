@@ -1,147 +1,251 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from collections.abc import Sequence
+from operator import attrgetter
+from typing import Any
 
-from f1api.core.db import get_db
-from f1api.models import Driver, Entry, Season, SessionResult, SessionType, Team
-from f1api.models import Session as RaceSession
-from f1api.schemas import ConstructorStandingRead, DriverStandingRead, PaginatedResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from f1api.api.fields import FieldsQuery, parse_fields, select_fields
+from f1api.api.pagination import CountMode, CountQuery, CursorQuery, paginate
+from f1api.api.serialization import FastJSONResponse, page_response
+from f1api.core.db import get_read_db
+from f1api.models import ConstructorStanding, Driver, DriverStanding, Event, Season, Team
+from f1api.schemas import (
+    ConstructorProgression,
+    ConstructorProgressionRow,
+    ConstructorStandingRead,
+    DriverProgression,
+    DriverProgressionRow,
+    DriverStandingRead,
+    PaginatedResponse,
+)
+from f1api.services.standings import constructor_progression_query, driver_progression_query
 
 router = APIRouter(prefix="/standings", tags=["Standings"])
 
+AfterRoundQuery = Query(
+    None, ge=1, description="Stop after this round (default: latest round with race results)"
+)
+_SERIES = ("positions", "points", "wins")
+
+_DRIVER_COLUMNS = {
+    "position": DriverStanding.position,
+    "driver_id": Driver.id,
+    "driver_ref": Driver.ref,
+    "driver_code": Driver.code,
+    "driver_first_name": Driver.first_name,
+    "driver_last_name": Driver.last_name,
+    "team_id": Team.id,
+    "team_name": Team.name,
+    "points": DriverStanding.points,
+    "wins": DriverStanding.wins,
+}
+_CONSTRUCTOR_COLUMNS = {
+    "position": ConstructorStanding.position,
+    "team_id": Team.id,
+    "team_ref": Team.ref,
+    "team_name": Team.name,
+    "points": ConstructorStanding.points,
+    "wins": ConstructorStanding.wins,
+}
+DRIVER_STANDING_ORDER = (DriverStanding.position, DriverStanding.driver_id)
+CONSTRUCTOR_STANDING_ORDER = (ConstructorStanding.position, ConstructorStanding.team_id)
+
+
+def driver_standings_select(season_id: int, names: Sequence[str]) -> Select[Any]:
+    """Pre-ranked rows maintained by f1api.services.standings, as the ``names`` fields."""
+    return (
+        select_fields(_DRIVER_COLUMNS, names, DRIVER_STANDING_ORDER)
+        .join(DriverStanding.driver)
+        .join(DriverStanding.team)
+        .filter(DriverStanding.season_id == season_id)
+    )
+
+
+def constructor_standings_select(season_id: int, names: Sequence[str]) -> Select[Any]:
+    """Pre-ranked rows maintained by f1api.services.standings, as the ``names`` fields."""
+    return (
+        select_fields(_CONSTRUCTOR_COLUMNS, names, CONSTRUCTOR_STANDING_ORDER)
+        .join(ConstructorStanding.team)
+        .filter(ConstructorStanding.season_id == season_id)
+    )
+
 
 @router.get("/drivers", response_model=PaginatedResponse[DriverStandingRead])
-def get_driver_standings(
-    db: Session = Depends(get_db),  # noqa: B008
+async def get_driver_standings(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
     season_year: int = Query(..., description="Season year (required)"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[DriverStandingRead]:
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
     """
     Get driver championship standings for a season.
-    Points are aggregated from all race sessions.
+    Reads the persisted standings table, which is kept in sync with race results.
     """
     # Verify season exists
-    season = db.scalar(select(Season).filter(Season.year == season_year))
+    season = await db.scalar(select(Season).filter(Season.year == season_year))
     if not season:
         raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
 
-    # Build base aggregation query
-    base_stmt = (
-        select(
-            Driver.id.label("driver_id"),
-            Driver.ref.label("driver_ref"),
-            Driver.code.label("driver_code"),
-            Driver.first_name.label("driver_first_name"),
-            Driver.last_name.label("driver_last_name"),
-            Team.id.label("team_id"),
-            Team.name.label("team_name"),
-            func.sum(SessionResult.points).label("points"),
-            func.count(func.nullif(SessionResult.position != 1, True)).label("wins"),
-        )
-        .select_from(SessionResult)
-        .join(SessionResult.entry)
-        .join(Entry.driver)
-        .join(Entry.team)
-        .join(SessionResult.session)
-        .filter(Entry.season_id == season.id)
-        .filter(RaceSession.type == SessionType.RACE)
-        .group_by(Driver.id, Team.id)
+    names = parse_fields(fields, DriverStandingRead)
+
+    # Get paginated items (plus total count, per ?count=)
+    page = await paginate(
+        db,
+        driver_standings_select(season.id, names),
+        order_by=DRIVER_STANDING_ORDER,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        count_stmt=select(func.count())
+        .select_from(DriverStanding)
+        .filter(DriverStanding.season_id == season.id),
     )
-
-    # Get total count
-    count_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total = db.scalar(count_stmt) or 0
-
-    # Get paginated items
-    stmt = (
-        base_stmt.order_by(func.sum(SessionResult.points).desc(), Driver.last_name)
-        .limit(limit)
-        .offset(offset)
-    )
-
-    rows = db.execute(stmt).all()
-
-    # Build response with positions
-    items = []
-    for idx, row in enumerate(rows, start=1 + offset):
-        items.append(
-            DriverStandingRead(
-                position=idx,
-                driver_id=row.driver_id,
-                driver_ref=row.driver_ref,
-                driver_code=row.driver_code,
-                driver_first_name=row.driver_first_name,
-                driver_last_name=row.driver_last_name,
-                team_id=row.team_id,
-                team_name=row.team_name,
-                points=float(row.points or 0),
-                wins=int(row.wins or 0),
-            )
-        )
-
-    return PaginatedResponse.create(items=items, total=total, limit=limit, offset=offset)
+    return page_response(page, DriverStandingRead, limit, offset, names)
 
 
 @router.get("/constructors", response_model=PaginatedResponse[ConstructorStandingRead])
-def get_constructor_standings(
-    db: Session = Depends(get_db),  # noqa: B008
+async def get_constructor_standings(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
     season_year: int = Query(..., description="Season year (required)"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[ConstructorStandingRead]:
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
     """
     Get constructor (team) championship standings for a season.
-    Points are aggregated from all drivers' race results.
+    Reads the persisted standings table, which is kept in sync with race results.
     """
     # Verify season exists
-    season = db.scalar(select(Season).filter(Season.year == season_year))
+    season = await db.scalar(select(Season).filter(Season.year == season_year))
     if not season:
         raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
 
-    # Build base aggregation query
-    base_stmt = (
-        select(
-            Team.id.label("team_id"),
-            Team.ref.label("team_ref"),
-            Team.name.label("team_name"),
-            func.sum(SessionResult.points).label("points"),
-            func.count(func.nullif(SessionResult.position != 1, True)).label("wins"),
-        )
-        .select_from(SessionResult)
-        .join(SessionResult.entry)
-        .join(Entry.team)
-        .join(SessionResult.session)
-        .filter(Entry.season_id == season.id)
-        .filter(RaceSession.type == SessionType.RACE)
-        .group_by(Team.id)
+    names = parse_fields(fields, ConstructorStandingRead)
+
+    # Get paginated items (plus total count, per ?count=)
+    page = await paginate(
+        db,
+        constructor_standings_select(season.id, names),
+        order_by=CONSTRUCTOR_STANDING_ORDER,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        count_stmt=select(func.count())
+        .select_from(ConstructorStanding)
+        .filter(ConstructorStanding.season_id == season.id),
     )
+    return page_response(page, ConstructorStandingRead, limit, offset, names)
+
+
+def _progression(
+    rows: Sequence[Row[Any]], schema: type[BaseModel]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fold rows ordered by (round, position) into the rounds and one series per competitor."""
+    fields = [name for name in schema.model_fields if name not in _SERIES]
+    identity = attrgetter(*fields)
+    rounds: list[dict[str, Any]] = []
+    series: dict[Any, dict[str, Any]] = {}
+    for row in rows:
+        if not rounds or rounds[-1]["round"] != row.round:
+            rounds.append(
+                {"round": row.round, "event_id": row.event_id, "event_name": row.event_name}
+            )
+        key = identity(row)
+        item = series.get(key)
+        if item is None:
+            item = series[key] = {**dict(zip(fields, key, strict=True)), **{s: [] for s in _SERIES}}
+        item["positions"].append(row.position)
+        item["points"].append(row.points)
+        item["wins"].append(row.wins)
+    return rounds, sorted(series.values(), key=lambda item: item["positions"][-1])
+
+
+@router.get("/drivers/progression", response_model=DriverProgression)
+async def get_driver_progression(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    season_year: int = Query(..., description="Season year (required)"),
+    after_round: int | None = AfterRoundQuery,
+) -> FastJSONResponse:
+    """
+    Get cumulative driver points, wins and positions after every round of a season.
+    Computed in one query with running window sums over the race results.
+    """
+    season = await db.scalar(select(Season).filter(Season.year == season_year))
+    if not season:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total = db.scalar(count_stmt) or 0
+    progression = driver_progression_query(season.id, after_round).subquery()
+    rows = (
+        await db.execute(
+            select(
+                progression.c.round,
+                Event.id.label("event_id"),
+                Event.name.label("event_name"),
+                progression.c.position,
+                Driver.id.label("driver_id"),
+                Driver.ref.label("driver_ref"),
+                Driver.code.label("driver_code"),
+                Driver.first_name.label("driver_first_name"),
+                Driver.last_name.label("driver_last_name"),
+                Team.id.label("team_id"),
+                Team.name.label("team_name"),
+                progression.c.points,
+                progression.c.wins,
+            )
+            .join(Driver, Driver.id == progression.c.driver_id)
+            .join(Team, Team.id == progression.c.team_id)
+            .join(Event, and_(Event.season_id == season.id, Event.round == progression.c.round))
+            .order_by(progression.c.round, progression.c.position)
+        )
+    ).all()
+    rounds, drivers = _progression(rows, DriverProgressionRow)
+    return FastJSONResponse({"season_year": season_year, "rounds": rounds, "drivers": drivers})
 
-    # Get paginated items
-    stmt = (
-        base_stmt.order_by(func.sum(SessionResult.points).desc(), Team.name)
-        .limit(limit)
-        .offset(offset)
-    )
 
-    rows = db.execute(stmt).all()
-
-    # Build response with positions
-    items = []
-    for idx, row in enumerate(rows, start=1 + offset):
-        items.append(
-            ConstructorStandingRead(
-                position=idx,
-                team_id=row.team_id,
-                team_ref=row.team_ref,
-                team_name=row.team_name,
-                points=float(row.points or 0),
-                wins=int(row.wins or 0),
+@router.get("/constructors/progression", response_model=ConstructorProgression)
+async def get_constructor_progression(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    season_year: int = Query(..., description="Season year (required)"),
+    after_round: int | None = AfterRoundQuery,
+) -> FastJSONResponse:
+    """
+    Get cumulative constructor points, wins and positions after every round of a season.
+    Computed in one query with running window sums over the race results.
+    """
+    season = await db.scalar(select(Season).filter(Season.year == season_year))
+    if not season:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    progression = constructor_progression_query(season.id, after_round).subquery()
+    rows = (
+        await db.execute(
+            select(
+                progression.c.round,
+                Event.id.label("event_id"),
+                Event.name.label("event_name"),
+                progression.c.position,
+                Team.id.label("team_id"),
+                Team.ref.label("team_ref"),
+                Team.name.label("team_name"),
+                progression.c.points,
+                progression.c.wins,
             )
+            .join(Team, Team.id == progression.c.team_id)
+            .join(Event, and_(Event.season_id == season.id, Event.round == progression.c.round))
+            .order_by(progression.c.round, progression.c.position)
         )
-
-    return PaginatedResponse.create(items=items, total=total, limit=limit, offset=offset)
+    ).all()
+    rounds, constructors = _progression(rows, ConstructorProgressionRow)
+    return FastJSONResponse(
+        {"season_year": season_year, "rounds": rounds, "constructors": constructors}
+    )
@@ -0,0 +1,127 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from f1api.api.fields import FieldsQuery, parse_fields, select_fields
+from f1api.api.pagination import CountMode, CountQuery, CursorQuery, paginate
+from f1api.api.serialization import FastJSONResponse, page_response
+from f1api.core.db import get_read_db
+from f1api.models import Driver, Season, SeasonDriverStats, SeasonTeamStats, Team
+from f1api.schemas import DriverSeasonStatsRead, PaginatedResponse, TeamSeasonStatsRead
+
+router = APIRouter(prefix="/stats", tags=["Stats"])
+
+_DRIVER_COLUMNS = {
+    "driver_id": SeasonDriverStats.driver_id,
+    "driver_ref": Driver.ref,
+    "driver_code": Driver.code,
+    "driver_first_name": Driver.first_name,
+    "driver_last_name": Driver.last_name,
+    "team_id": SeasonDriverStats.team_id,
+    "team_name": Team.name,
+    "starts": SeasonDriverStats.starts,
+    "wins": SeasonDriverStats.wins,
+    "podiums": SeasonDriverStats.podiums,
+    "dnfs": SeasonDriverStats.dnfs,
+    "points": SeasonDriverStats.points,
+    "avg_grid": SeasonDriverStats.avg_grid,
+    "avg_finish": SeasonDriverStats.avg_finish,
+    "avg_positions_gained": SeasonDriverStats.avg_positions_gained,
+}
+_TEAM_COLUMNS = {
+    "team_id": SeasonTeamStats.team_id,
+    "team_ref": Team.ref,
+    "team_name": Team.name,
+    "starts": SeasonTeamStats.starts,
+    "wins": SeasonTeamStats.wins,
+    "podiums": SeasonTeamStats.podiums,
+    "dnfs": SeasonTeamStats.dnfs,
+    "points": SeasonTeamStats.points,
+    "avg_grid": SeasonTeamStats.avg_grid,
+    "avg_finish": SeasonTeamStats.avg_finish,
+    "avg_positions_gained": SeasonTeamStats.avg_positions_gained,
+}
+
+
+@router.get("/drivers", response_model=PaginatedResponse[DriverSeasonStatsRead])
+async def get_driver_season_stats(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    season_year: int = Query(..., description="Season year (required)"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """
+    Get per-driver race statistics (starts, wins, podiums, DNFs, average grid and finish),
+    most points first.
+    Reads the season_driver_stats materialized view, refreshed after each ingestion.
+    """
+    season = await db.scalar(select(Season).filter(Season.year == season_year))
+    if not season:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    names = parse_fields(fields, DriverSeasonStatsRead)
+    order_by = (SeasonDriverStats.points.desc(), SeasonDriverStats.driver_id)
+    base_stmt = (
+        select_fields(_DRIVER_COLUMNS, names, order_by)
+        .join(Driver, Driver.id == SeasonDriverStats.driver_id)
+        .join(Team, Team.id == SeasonDriverStats.team_id)
+        .filter(SeasonDriverStats.season_id == season.id)
+    )
+
+    page = await paginate(
+        db,
+        base_stmt,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        count_stmt=select(func.count())
+        .select_from(SeasonDriverStats)
+        .filter(SeasonDriverStats.season_id == season.id),
+    )
+    return page_response(page, DriverSeasonStatsRead, limit, offset, names)
+
+
+@router.get("/teams", response_model=PaginatedResponse[TeamSeasonStatsRead])
+async def get_team_season_stats(
+    db: AsyncSession = Depends(get_read_db),  # noqa: B008
+    season_year: int = Query(..., description="Season year (required)"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """
+    Get per-team race statistics over all of a team's cars, most points first.
+    Reads the season_team_stats materialized view, refreshed after each ingestion.
+    """
+    season = await db.scalar(select(Season).filter(Season.year == season_year))
+    if not season:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    names = parse_fields(fields, TeamSeasonStatsRead)
+    order_by = (SeasonTeamStats.points.desc(), SeasonTeamStats.team_id)
+    base_stmt = (
+        select_fields(_TEAM_COLUMNS, names, order_by)
+        .join(Team, Team.id == SeasonTeamStats.team_id)
+        .filter(SeasonTeamStats.season_id == season.id)
+    )
+
+    page = await paginate(
+        db,
+        base_stmt,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        count_stmt=select(func.count())
+        .select_from(SeasonTeamStats)
+        .filter(SeasonTeamStats.season_id == season.id),
+    )
+    return page_response(page, TeamSeasonStatsRead, limit, offset, names)
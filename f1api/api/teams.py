@@ -1,41 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from f1api.core.db import get_db
+from f1api.api.batch import IdsQuery, RefsQuery, batch_lookup, parse_keys
+from f1api.api.fields import FieldsQuery, model_columns, parse_fields, select_fields
+from f1api.api.pagination import CountMode, CountQuery, CursorQuery, paginate, paginate_records
+from f1api.api.serialization import FastJSONResponse, item_response, page_response
+from f1api.core.db import read_session
+from f1api.core.reference import ReferenceIndex, get_reference_index, reference_index
 from f1api.models import Team
-from f1api.schemas import PaginatedResponse, TeamRead
+from f1api.schemas import BatchGetRequest, BatchResponse, PaginatedResponse, TeamRead
+
+_COLUMNS = model_columns(Team, TeamRead)
 
 router = APIRouter(prefix="/teams", tags=["Teams"])
 
 
 @router.get("", response_model=PaginatedResponse[TeamRead])
-def list_teams(
-    db: Session = Depends(get_db),  # noqa: B008
+async def list_teams(
+    request: Request,
     ref: str | None = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[TeamRead]:
-    # Build base query
-    stmt = select(Team)
+    cursor: str | None = CursorQuery,
+    count: CountMode | None = CountQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, TeamRead)
+    order_by = (Team.name, Team.id)
+
+    # ref lookups are answered from the reference index, without a session
     if ref:
-        stmt = stmt.filter(Team.ref == ref)
+        team = (await reference_index.current()).teams_by_ref.get(ref)
+        page = paginate_records(
+            [team] if team else [],
+            order_by=[col.key for col in order_by],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+        return page_response(page, TeamRead, limit, offset, names)
+
+    # Get paginated items over just the requested columns (plus total count, per ?count=)
+    async with read_session(request) as db:
+        page = await paginate(
+            db,
+            select_fields(_COLUMNS, names, order_by),
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+    return page_response(page, TeamRead, limit, offset, names)
+
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = db.scalar(count_stmt) or 0
+@router.get(":batchGet", response_model=BatchResponse[TeamRead])
+async def batch_get_teams(
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    ids: str | None = IdsQuery,
+    refs: str | None = RefsQuery,
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Look up many teams by id and/or ref at once."""
+    names = parse_fields(fields, TeamRead)
+    keys = parse_keys(ids, refs)
+    return batch_lookup(keys, TeamRead, names, index.teams, index.teams_by_ref)
 
-    # Get paginated items
-    stmt = stmt.order_by(Team.name).limit(limit).offset(offset)
-    teams = db.scalars(stmt).all()
-    items = [TeamRead.model_validate(t) for t in teams]
 
-    return PaginatedResponse.create(items=items, total=total, limit=limit, offset=offset)
+@router.post(":batchGet", response_model=BatchResponse[TeamRead])
+async def batch_get_teams_post(
+    keys: BatchGetRequest,
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    """Same as the GET form, for key lists too long for a URL."""
+    names = parse_fields(fields, TeamRead)
+    return batch_lookup(keys, TeamRead, names, index.teams, index.teams_by_ref)
 
 
 @router.get("/{team_id}", response_model=TeamRead)
-def get_team(team_id: int, db: Session = Depends(get_db)) -> TeamRead:  # noqa: B008
-    team = db.get(Team, team_id)
+async def get_team(
+    team_id: int,
+    index: ReferenceIndex = Depends(get_reference_index),  # noqa: B008
+    fields: str | None = FieldsQuery,
+) -> FastJSONResponse:
+    names = parse_fields(fields, TeamRead)
+    team = index.teams.get(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
-    return TeamRead.model_validate(team)
+    return item_response(team, TeamRead, names)
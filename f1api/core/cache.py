@@ -0,0 +1,267 @@
+"""
+In-process response cache for the read-only API.
+
+Responses are stored as already-serialized bytes, keyed on the request path plus
+its normalized query string, with a TTL per route prefix and LRU eviction once
+the byte budget is exceeded. Compressed variants of an entry are produced on first
+request for each encoding and kept with it, so hot responses are compressed once
+rather than per request. Writers call ``invalidate_response_cache()`` after
+committing so stale data is never served from this process. Requests sent with
+``X-Read-Your-Writes`` bypass the cache, and responses built from a lagging
+replica are not stored (see ``f1api.core.db``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from f1api.core.compression import compress, encode_response
+from f1api.core.config import settings
+from f1api.core.db import UNCACHEABLE_SCOPE_KEY, read_your_writes
+from f1api.core.metrics import ROUTE_SCOPE_KEY, register_collector, route_template
+
+# Scope key under which f1api.core.versions passes the data versions of a request
+DATA_VERSION_SCOPE_KEY = "f1api.data_version"
+
+# TTL (seconds) per route prefix; the longest matching prefix wins, 0 disables caching
+ROUTE_TTLS: dict[str, float] = {
+    "/api/v1/seasons": 300.0,
+    "/api/v1/teams": 300.0,
+    "/api/v1/drivers": 300.0,
+    "/api/v1/events": 300.0,
+    "/api/v1/sessions": 300.0,
+    "/api/v1/standings": 30.0,
+    "/api/v1/stats": 300.0,
+    "/api/v1/export": 0.0,  # streamed; caching would buffer the whole export
+    "/api/v1/_debug": 0.0,
+}
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    route: str = ""
+    expires_at: float = 0.0
+    variants: dict[str, bytes] = field(default_factory=dict)  # encoding -> encoded body
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.body)
+            + sum(len(k) + len(v) for k, v in self.headers)
+            + sum(len(body) for body in self.variants.values())
+        )
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class ResponseCache:
+    """Thread-safe TTL + LRU cache bounded by total payload bytes."""
+
+    max_bytes: int
+    default_ttl: float
+    route_ttls: dict[str, float] = field(default_factory=dict)
+    clock: Callable[[], float] = time.monotonic
+
+    def __post_init__(self) -> None:
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def ttl_for(self, path: str) -> float:
+        best, ttl = -1, self.default_ttl
+        for prefix, prefix_ttl in self.route_ttls.items():
+            if path.startswith(prefix) and len(prefix) > best:
+                best, ttl = len(prefix), prefix_ttl
+        return ttl
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self.clock():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry
+
+    def set(self, key: str, entry: CachedResponse, ttl: float) -> None:
+        if ttl <= 0 or entry.size > self.max_bytes:
+            return
+        entry.expires_at = self.clock() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._stats.entries += 1
+            self._stats.bytes += entry.size
+            self._evict()
+
+    def variant(self, key: str, entry: CachedResponse, encoding: str) -> bytes:
+        """``entry``'s body in ``encoding``, compressed and kept on first use."""
+        body = entry.variants.get(encoding)
+        if body is not None:
+            return body
+        body = compress(entry.body, encoding, once=True)  # outside the lock
+        with self._lock:
+            if encoding in entry.variants:  # another request got there first
+                return entry.variants[encoding]
+            entry.variants[encoding] = body
+            if self._entries.get(key) is entry:
+                self._stats.bytes += len(body)
+                self._evict()
+        return body
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry whose key starts with ``prefix`` (all entries by default)."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._drop(key)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            s = self._stats
+            return CacheStats(s.hits, s.misses, s.evictions, s.entries, s.bytes)
+
+    def _evict(self) -> None:
+        while self._stats.bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._stats.entries -= 1
+        self._stats.bytes -= entry.size
+
+
+def cache_key(scope: Scope) -> str:
+    """Route path plus a normalized (sorted) query string."""
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+    return f"{scope['path']}?{urlencode(sorted(query))}"
+
+
+response_cache = ResponseCache(
+    max_bytes=settings.response_cache_max_bytes,
+    default_ttl=settings.response_cache_default_ttl,
+    route_ttls=ROUTE_TTLS,
+)
+
+
+def _cache_samples() -> Iterable[str]:
+    stats = response_cache.stats()
+    for name, kind, value in (
+        ("f1api_response_cache_hits_total", "counter", stats.hits),
+        ("f1api_response_cache_misses_total", "counter", stats.misses),
+        ("f1api_response_cache_evictions_total", "counter", stats.evictions),
+        ("f1api_response_cache_entries", "gauge", stats.entries),
+        ("f1api_response_cache_bytes", "gauge", stats.bytes),
+    ):
+        yield f"# TYPE {name} {kind}"
+        yield f"{name} {value}"
+
+
+register_collector(_cache_samples)
+
+
+def invalidate_response_cache(prefix: str = "") -> None:
+    """Hook for writers (seed/ingest) to call once their transaction has committed."""
+    response_cache.invalidate(prefix)
+
+
+class ResponseCacheMiddleware:
+    """Serve successful GET responses under ``/api/v1`` from ``response_cache``."""
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache = response_cache) -> None:
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith("/api/v1/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        ttl = self.cache.ttl_for(scope["path"])
+        if ttl <= 0 or read_your_writes(scope):
+            await self.app(scope, receive, send)
+            return
+
+        # keyed on the data versions too, so other processes' writes are never served stale
+        key = f"{cache_key(scope)}#{scope.get(DATA_VERSION_SCOPE_KEY, '')}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            scope[ROUTE_SCOPE_KEY] = cached.route
+            await self._send_entry(scope, send, key, cached, b"HIT")
+            return
+
+        start: Message = {}
+        chunks: list[bytes] = []
+        started = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, started
+            if message["type"] == "http.response.start":
+                start = message  # held back until we know whether the body is complete
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            ok = start["status"] == 200 and not scope.get(UNCACHEABLE_SCOPE_KEY)
+            more_body = message.get("more_body", False)
+            if ok:
+                chunks.append(message.get("body", b""))
+            if ok and not more_body:
+                entry = CachedResponse(
+                    200, list(start["headers"]), b"".join(chunks), route_template(scope)
+                )
+                self.cache.set(key, entry, ttl)
+                if not started:
+                    await self._send_entry(scope, send, key, entry, b"MISS")
+                    return
+            if not started:
+                started = True
+                await send({**start, "headers": [*start["headers"], (b"x-cache", b"MISS")]})
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+    async def _send_entry(
+        self, scope: Scope, send: Send, key: str, entry: CachedResponse, cache_status: bytes
+    ) -> None:
+        headers, body = encode_response(
+            scope,
+            entry.headers,
+            entry.body,
+            lambda _, encoding: self.cache.variant(key, entry, encoding),
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": entry.status,
+                "headers": [*headers, (b"x-cache", cache_status)],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,158 @@
+"""
+Response compression for the API.
+
+The encoding is negotiated from ``Accept-Encoding``: br and zstd when the
+optional ``compression`` extra is installed, gzip always. Only compressible
+media types of at least ``compression_min_bytes`` are encoded. Responses served
+by the response cache are encoded there, once per entry and encoding (see
+``f1api.core.cache``). ``CompressionMiddleware`` handles everything else and
+leaves responses that are already encoded alone. Streamed bodies pass through
+unchanged.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+from collections.abc import Callable
+from types import ModuleType
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from f1api.core.config import settings
+
+
+def _optional(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional extra not installed
+        return None
+
+
+brotli = _optional("brotli")
+zstandard = _optional("zstandard")
+
+Headers = list[tuple[bytes, bytes]]
+Compressor = Callable[[bytes, str], bytes]
+
+_COMPRESSIBLE = (b"application/json", b"application/x-ndjson", b"text/")
+
+# Server preference when the client accepts several encodings with the same q
+ENCODINGS: tuple[str, ...] = tuple(
+    name
+    for name, available in (("br", brotli), ("zstd", zstandard), ("gzip", gzip))
+    if available is not None
+)
+
+
+def compress(body: bytes, encoding: str, *, once: bool = False) -> bytes:
+    """``body`` in ``encoding``; ``once`` spends more CPU for bodies that are sent many times."""
+    if encoding == "br" and brotli is not None:
+        # quality 11 is several times slower again for a few percent
+        return bytes(brotli.compress(body, quality=9 if once else 4))
+    if encoding == "zstd" and zstandard is not None:
+        return bytes(zstandard.ZstdCompressor(level=12 if once else 3).compress(body))
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9 if once else 6, mtime=0)
+    raise ValueError(f"unsupported encoding {encoding!r}")
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Best supported encoding for an ``Accept-Encoding`` header, or None for identity."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong ETag of the ``encoding`` variant of a representation (``"abc"`` -> ``"abc-br"``)."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _header(headers: Headers, name: bytes) -> bytes | None:
+    return next((value for key, value in headers if key.lower() == name), None)
+
+
+def is_compressible(headers: Headers) -> bool:
+    content_type = _header(headers, b"content-type") or b""
+    return content_type.startswith(_COMPRESSIBLE) and _header(headers, b"content-encoding") is None
+
+
+def _with_vary(headers: Headers) -> Headers:
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return [*headers, (b"vary", b"Accept-Encoding")]
+    if b"accept-encoding" in vary.lower() or vary.strip() == b"*":
+        return headers
+    rest = [(key, value) for key, value in headers if key.lower() != b"vary"]
+    return [*rest, (b"vary", vary + b", Accept-Encoding")]
+
+
+def encode_response(
+    scope: Scope, headers: Headers, body: bytes, compressor: Compressor = compress
+) -> tuple[Headers, bytes]:
+    """Headers and body to send for a complete response, encoded if the client accepts it."""
+    if not settings.compression_enabled or not is_compressible(headers):
+        return headers, body
+    headers = _with_vary(headers)
+    accept = _header(scope["headers"], b"accept-encoding")
+    if accept is None or len(body) < settings.compression_min_bytes:
+        return headers, body
+    encoding = negotiate(accept.decode("latin-1"))
+    if encoding is None:
+        return headers, body
+    encoded = compressor(body, encoding)
+    rest = [(key, value) for key, value in headers if key.lower() != b"content-length"]
+    return [
+        *rest,
+        (b"content-encoding", encoding.encode()),
+        (b"content-length", str(len(encoded)).encode()),
+    ], encoded
+
+
+class CompressionMiddleware:
+    """Compress complete, uncached responses according to ``Accept-Encoding``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+
+        async def encode(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message  # held back until we know whether the body is complete
+                return
+            if start and message["type"] == "http.response.body":
+                held, start = start, {}
+                if not message.get("more_body", False):
+                    headers, body = encode_response(
+                        scope, list(held["headers"]), message.get("body", b"")
+                    )
+                    await send({**held, "headers": headers})
+                    await send({**message, "body": body})
+                    return
+                await send(held)
+            await send(message)
+
+        await self.app(scope, receive, encode)
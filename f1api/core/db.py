@@ -1,18 +1,242 @@
+"""
+Engines and sessions.
+
+Writers (seed, ingestion, scripts) use the sync ``engine`` on the primary. API
+handlers use async sessions: ``get_read_db`` sends read-only traffic to the
+configured replicas (round-robin, skipping any that recently failed to connect,
+falling back to the primary), ``get_async_db`` always uses the primary. A
+request can opt out of replica reads (and the response cache) with
+``X-Read-Your-Writes: 1``.
+
+A replica may lag behind the data versions a response is cached and ETagged
+under, which are read from the primary together with its WAL position. A replica
+read whose replica has not replayed up to that position is marked uncacheable
+on the request scope, so it is served without an ETag and not cached.
+
+All engines share the pool settings from ``Settings``. Connections are pinged
+before reuse only after sitting idle for ``db_pre_ping_idle_seconds``, which saves
+the extra round trip on busy pools while still catching connections dropped by
+the server or a firewall while idle.
+"""
+
 from __future__ import annotations
 
-from collections.abc import Generator
+import itertools
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Sequence
+from contextlib import asynccontextmanager
+from typing import Any
 
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import Engine, create_engine, event, make_url, text
+from sqlalchemy.exc import DBAPIError, DisconnectionError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from starlette.types import Scope
 
 from f1api.core.config import settings
+from f1api.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_engine
+
+# Scope keys: the primary's WAL position when the request's data versions were read
+# (set by f1api.core.versions), and a flag for responses that must not be cached
+WRITER_LSN_SCOPE_KEY = "f1api.writer_lsn"
+UNCACHEABLE_SCOPE_KEY = "f1api.uncacheable"
+
+# WAL position a server has applied: replayed on a standby, written on a primary
+_APPLIED_LSN = text(
+    "SELECT CAST(CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn() "
+    "ELSE pg_current_wal_insert_lsn() END AS text)"
+)
+
+
+def parse_lsn(lsn: str) -> int:
+    """``'16/B374D848'`` -> a comparable integer."""
+    high, _, low = lsn.partition("/")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool and connection options shared by the sync and async engines."""
+    connect_args: dict[str, Any] = {}
+    if settings.db_statement_timeout_ms:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    if make_url(url).get_driver_name() == "psycopg":
+        # None turns psycopg's automatic server-side prepares off
+        connect_args["prepare_threshold"] = (
+            settings.db_prepare_threshold if settings.db_prepared_statements else None
+        )
+    return {
+        "pool_pre_ping": settings.db_pre_ping_idle_seconds == 0,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "connect_args": connect_args,
+    }
+
+
+def ping_after_idle(
+    engine: Engine, idle_seconds: float, clock: Callable[[], float] = time.monotonic
+) -> None:
+    """
+    Ping connections on checkout only when they were idle at least ``idle_seconds``.
 
-# Engine (sync, SQLAlchemy 2.x)
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+    A failed ping raises ``DisconnectionError``, so the pool discards the connection
+    and checks out (or opens) another one.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection: Any, record: Any) -> None:
+        record.info["f1api_idle_since"] = clock()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        idle_since = record.info.pop("f1api_idle_since", None)
+        if idle_since is None or clock() - idle_since < idle_seconds:
+            return  # new, or recently used
+        try:
+            alive = engine.dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            raise DisconnectionError("connection failed pre-ping") from exc
+        if not alive:
+            raise DisconnectionError("connection failed pre-ping")
+
+
+def _configure(engine: Engine, name: str) -> None:
+    instrument_engine(engine, name)
+    if settings.db_pre_ping_idle_seconds > 0:
+        ping_after_idle(engine, settings.db_pre_ping_idle_seconds)
+
+
+# Engine (sync, SQLAlchemy 2.x) — seeding, ingestion and scripts
+engine = create_engine(
+    settings.database_url,
+    poolclass=TimedQueuePool,
+    pool_logging_name="sync",
+    **_engine_options(settings.database_url),
+)
+_configure(engine, "sync")
 
 # Session factory
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# Async engine (psycopg3 async driver) — API request handlers
+async_engine = create_async_engine(
+    settings.database_url,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_logging_name="api",
+    **_engine_options(settings.database_url),
+)
+_configure(async_engine.sync_engine, "api")
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+class ReplicaSet:
+    """Round-robin over replica engines; one that fails to connect sits out ``retry_after``."""
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        retry_after: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engines = list(engines)
+        self.retry_after = retry_after
+        self.clock = clock
+        self._turn = itertools.count()
+        self._down_until: dict[AsyncEngine, float] = {}
+        self._replayed: dict[AsyncEngine, int] = {}  # highest WAL position seen per replica
+
+    def candidates(self) -> list[AsyncEngine]:
+        """Healthy replicas, starting with the next one in turn."""
+        if not self.engines:
+            return []
+        start = next(self._turn) % len(self.engines)
+        now = self.clock()
+        ordered = self.engines[start:] + self.engines[:start]
+        return [e for e in ordered if self._down_until.get(e, 0.0) <= now]
+
+    def mark_down(self, engine: AsyncEngine) -> None:
+        self._down_until[engine] = self.clock() + self.retry_after
+
+    async def caught_up(self, conn: AsyncConnection, lsn: int) -> bool:
+        """Whether the replica behind ``conn`` has replayed the WAL up to ``lsn``."""
+        replica = conn.engine
+        if self._replayed.get(replica, -1) >= lsn:
+            return True  # replay only moves forward: no need to ask again
+        applied = await conn.scalar(_APPLIED_LSN)
+        if applied is None:
+            return False
+        self._replayed[replica] = max(self._replayed.get(replica, -1), parse_lsn(applied))
+        return self._replayed[replica] >= lsn
+
+
+def _replica_engine(index: int, url: str) -> AsyncEngine:
+    replica = create_async_engine(
+        url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name=f"replica{index}",
+        **_engine_options(url),
+    )
+    _configure(replica.sync_engine, f"replica{index}")
+    return replica
+
+
+replicas = ReplicaSet(
+    [_replica_engine(i, url) for i, url in enumerate(settings.database_replica_urls)],
+    retry_after=settings.db_replica_retry_seconds,
+)
+
+
+@asynccontextmanager
+async def read_connection(
+    primary: bool = False, fresh_as_of: int | None = None
+) -> AsyncIterator[AsyncConnection]:
+    """
+    Connection to a healthy replica, or to the primary if asked or none is reachable.
+    With ``fresh_as_of``, replicas that have not replayed up to that WAL position
+    are skipped too.
+    """
+    conn: AsyncConnection | None = None
+    for replica in [] if primary else replicas.candidates():
+        try:
+            conn = await replica.connect()
+        except DBAPIError:
+            replicas.mark_down(replica)
+            continue
+        if fresh_as_of is None or await replicas.caught_up(conn, fresh_as_of):
+            break
+        await conn.close()
+        conn = None
+    if conn is None:
+        conn = await async_engine.connect()
+    try:
+        yield conn
+    finally:
+        await conn.close()
+
+
+def read_your_writes(scope: Scope) -> bool:
+    """Per-request escape hatch: read from the primary (e.g. right after a write)."""
+    value = dict(scope["headers"]).get(b"x-read-your-writes", b"")
+    return value.lower() in {b"1", b"true", b"yes"}
+
+
+async def mark_if_stale(scope: Scope, conn: AsyncConnection) -> None:
+    """Flag the response uncacheable if ``conn`` is a replica behind the request's versions."""
+    if conn.engine is async_engine:
+        return
+    writer_lsn = scope.get(WRITER_LSN_SCOPE_KEY)
+    if writer_lsn is None or not await replicas.caught_up(conn, writer_lsn):
+        scope[UNCACHEABLE_SCOPE_KEY] = True
+
 
 # Handy context-managed session
 def get_db() -> Generator[Session, None, None]:
@@ -21,3 +245,23 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@asynccontextmanager
+async def read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Session for read-only work, on a replica unless the request opts out."""
+    async with read_connection(primary=read_your_writes(request.scope)) as conn:
+        await mark_if_stale(request.scope, conn)
+        async with AsyncSessionLocal(bind=conn) as db:
+            yield db
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """``read_session`` as a dependency, for handlers that always query."""
+    async with read_session(request) as db:
+        yield db
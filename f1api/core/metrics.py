@@ -0,0 +1,434 @@
+"""
+Prometheus metrics for the API, exposed in text format on ``/metrics``.
+
+Metric updates happen on every request and every DB query, so they avoid locks:
+each thread writes to its own shard (a plain dict) and shards are only merged
+when ``/metrics`` is scraped. Request metrics are labelled by the route template
+(``/api/v1/drivers/{driver_id}``), never the raw path.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+COUNT_BUCKETS = (0.0, 1.0, 2.0, 3.0, 5.0, 10.0, 25.0, 50.0, 100.0)
+
+Labels = tuple[str, ...]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: list[dict[Labels, Any]] = []
+        self._shards_lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _shard(self) -> dict[Labels, Any]:
+        try:
+            shard: dict[Labels, Any] = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._shards_lock:  # once per thread
+                self._shards.append(shard)
+        return shard
+
+    def _snapshots(self) -> list[dict[Labels, Any]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [dict(shard) for shard in shards]
+
+    def _fmt(self, labels: Labels, extra: str = "") -> str:
+        pairs = [f'{k}="{_escape(v)}"' for k, v in zip(self.labelnames, labels, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def values(self) -> dict[Labels, float]:
+        merged: dict[Labels, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                merged[labels] = merged.get(labels, 0.0) + value
+        return merged
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in sorted(self.values().items()):
+            yield f"{self.name}{self._fmt(labels)} {value}"
+
+
+class Gauge(Counter):
+    """Up/down gauge; per-thread deltas are summed at scrape time."""
+
+    kind = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        shard = self._shard()
+        data = shard.get(labels)
+        if data is None:
+            # per-bucket counts (last slot is +Inf) followed by the running sum
+            data = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        data[bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+    def samples(self) -> Iterable[str]:
+        merged: dict[Labels, list[float]] = {}
+        for shard in self._snapshots():
+            for labels, data in shard.items():
+                acc = merged.setdefault(labels, [0.0] * len(data))
+                for i, v in enumerate(list(data)):
+                    acc[i] += v
+        for labels, data in sorted(merged.items()):
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, float("inf")), data[:-1], strict=True):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                le_label = f'le="{le}"'
+                yield f"{self.name}_bucket{self._fmt(labels, le_label)} {cumulative}"
+            yield f"{self.name}_sum{self._fmt(labels)} {data[-1]}"
+            yield f"{self.name}_count{self._fmt(labels)} {cumulative}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRY: list[_Metric] = []
+COLLECTORS: list[Callable[[], Iterable[str]]] = []
+
+
+def register_collector(collector: Callable[[], Iterable[str]]) -> None:
+    """Add a callback producing exposition lines computed at scrape time."""
+    COLLECTORS.append(collector)
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    for collector in COLLECTORS:
+        lines.extend(collector())
+    return "\n".join(lines) + "\n"
+
+
+# --- HTTP ---------------------------------------------------------------------
+
+HTTP_REQUESTS = Counter(
+    "f1api_http_requests_total", "HTTP requests served.", ("method", "route", "status")
+)
+HTTP_LATENCY = Histogram(
+    "f1api_http_request_duration_seconds", "HTTP request latency.", ("method", "route")
+)
+HTTP_IN_FLIGHT = Gauge("f1api_http_requests_in_flight", "HTTP requests being served.")
+HTTP_RESPONSE_SIZE = Histogram(
+    "f1api_http_response_size_bytes",
+    "HTTP response body size.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "f1api_http_request_db_queries",
+    "DB queries issued while serving one request.",
+    ("route",),
+    buckets=COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "f1api_http_request_db_seconds", "DB time spent while serving one request.", ("route",)
+)
+
+# Scope key used to label requests answered before routing (e.g. cache hits)
+ROUTE_SCOPE_KEY = "f1api.route"
+
+
+def route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get(ROUTE_SCOPE_KEY) or "unmatched"
+
+
+@dataclass(slots=True)
+class RequestDBStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+_request_db_stats: ContextVar[RequestDBStats | None] = ContextVar(
+    "f1api_request_db_stats", default=None
+)
+
+
+class MetricsMiddleware:
+    """Record per-route request count, latency, size and DB usage."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+        db_stats = RequestDBStats()
+        token = _request_db_stats.set(db_stats)
+
+        async def instrumented_send(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, instrumented_send)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            _request_db_stats.reset(token)
+
+            method, route = scope["method"], route_template(scope)
+            HTTP_REQUESTS.inc((method, route, str(status)))
+            HTTP_LATENCY.observe(elapsed, (method, route))
+            HTTP_RESPONSE_SIZE.observe(size, (method, route))
+            REQUEST_DB_QUERIES.observe(db_stats.queries, (route,))
+            REQUEST_DB_SECONDS.observe(db_stats.seconds, (route,))
+
+
+# --- Database -----------------------------------------------------------------
+
+DB_QUERIES = Counter("f1api_db_queries_total", "DB statements executed.", ("pool",))
+DB_QUERY_ERRORS = Counter(
+    "f1api_db_query_errors_total", "DB statements that raised an error.", ("pool",)
+)
+DB_QUERY_LATENCY = Histogram(
+    "f1api_db_query_duration_seconds", "DB statement execution time.", ("pool",)
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "f1api_db_pool_checkout_wait_seconds",
+    "Time spent waiting for (or opening) a pooled connection.",
+    ("pool",),
+)
+
+
+POOL_CHECKOUTS = Counter(
+    "f1api_db_pool_checkouts_total", "Connections handed out by the pool.", ("pool",)
+)
+POOL_WAITS = Counter(
+    "f1api_db_pool_waits_total",
+    "Checkouts that found every connection in use and had to wait for one.",
+    ("pool",),
+)
+POOL_TIMEOUTS = Counter(
+    "f1api_db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT_SECONDS.",
+    ("pool",),
+)
+POOL_CONNECTS = Counter(
+    "f1api_db_pool_connects_total", "New DB connections opened by the pool.", ("pool",)
+)
+POOL_INVALIDATIONS = Counter(
+    "f1api_db_pool_invalidations_total",
+    "Connections discarded as broken (failed ping, disconnect) or recycled.",
+    ("pool",),
+)
+
+
+def _timed_get(pool: QueuePool, get: Callable[[], ConnectionPoolEntry]) -> ConnectionPoolEntry:
+    name = pool.logging_name or "default"
+    if pool._max_overflow > -1 and pool.checkedout() >= pool.size() + pool._max_overflow:
+        POOL_WAITS.inc((name,))
+    started = time.perf_counter()
+    try:
+        return get()
+    except PoolTimeoutError:
+        POOL_TIMEOUTS.inc((name,))
+        raise
+    finally:
+        POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, (name,))
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waited."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        return _timed_get(self, super()._do_get)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording how long each checkout waited."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        return _timed_get(self, super()._do_get)
+
+
+_engines: list[tuple[str, weakref.ref[Engine]]] = []
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Count/time statements on ``engine`` and export its pool utilization and events."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Any, cursor: Any, statement: Any, params: Any, context: Any, many: Any
+    ) -> None:
+        conn.info.setdefault("f1api_query_start", []).append(time.perf_counter())
+
+    def _finish(conn: Any) -> None:
+        elapsed = time.perf_counter() - conn.info["f1api_query_start"].pop()
+        DB_QUERIES.inc((name,))
+        DB_QUERY_LATENCY.observe(elapsed, (name,))
+        stats = _request_db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(
+        conn: Any, cursor: Any, statement: Any, params: Any, context: Any, many: Any
+    ) -> None:
+        _finish(conn)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context: Any) -> None:
+        # after_cursor_execute does not run for a failed statement
+        conn = context.connection
+        if conn is None or context.statement is None or not conn.info.get("f1api_query_start"):
+            return  # failed before a statement was sent (e.g. while connecting)
+        _finish(conn)
+        DB_QUERY_ERRORS.inc((name,))
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        POOL_CHECKOUTS.inc((name,))
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection: Any, record: Any) -> None:
+        POOL_CONNECTS.inc((name,))
+
+    @event.listens_for(engine, "invalidate")
+    @event.listens_for(engine, "soft_invalidate")
+    def _invalidate(dbapi_connection: Any, record: Any, exception: Any) -> None:
+        POOL_INVALIDATIONS.inc((name,))
+
+    _engines.append((name, weakref.ref(engine)))
+
+
+def pool_status() -> list[dict[str, Any]]:
+    """Configuration, occupancy and lifetime counters of every instrumented pool."""
+    counters = {
+        "checkouts": POOL_CHECKOUTS.values(),
+        "waits": POOL_WAITS.values(),
+        "timeouts": POOL_TIMEOUTS.values(),
+        "connects": POOL_CONNECTS.values(),
+        "invalidations": POOL_INVALIDATIONS.values(),
+    }
+    status = []
+    for name, ref in _engines:
+        engine = ref()
+        pool = engine.pool if engine is not None else None
+        if not isinstance(pool, QueuePool):
+            continue
+        status.append(
+            {
+                "pool": name,
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+                "recycle": pool._recycle,
+                "pre_ping": pool._pre_ping,
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                **{key: int(values.get((name,), 0)) for key, values in counters.items()},
+            }
+        )
+    return status
+
+
+def _pool_samples() -> Iterable[str]:
+    gauges = {
+        "f1api_db_pool_size": "Configured pool size.",
+        "f1api_db_pool_checked_out": "Connections currently checked out.",
+        "f1api_db_pool_overflow": "Connections open beyond pool_size.",
+        "f1api_db_pool_utilization": "Checked-out connections / (pool_size + max_overflow).",
+    }
+    values: dict[str, list[str]] = {metric: [] for metric in gauges}
+    for name, ref in _engines:
+        engine = ref()
+        pool = engine.pool if engine is not None else None
+        if not isinstance(pool, QueuePool):
+            continue
+        capacity = pool.size() + max(pool._max_overflow, 0)
+        label = f'{{pool="{name}"}}'
+        values["f1api_db_pool_size"].append(f"f1api_db_pool_size{label} {pool.size()}")
+        values["f1api_db_pool_checked_out"].append(
+            f"f1api_db_pool_checked_out{label} {pool.checkedout()}"
+        )
+        values["f1api_db_pool_overflow"].append(
+            f"f1api_db_pool_overflow{label} {max(pool.overflow(), 0)}"
+        )
+        values["f1api_db_pool_utilization"].append(
+            f"f1api_db_pool_utilization{label} {pool.checkedout() / capacity if capacity else 0}"
+        )
+    for metric, documentation in gauges.items():
+        yield f"# HELP {metric} {documentation}"
+        yield f"# TYPE {metric} gauge"
+        yield from values[metric]
+
+
+register_collector(_pool_samples)
@@ -0,0 +1,160 @@
+"""
+Process-local index of the small, nearly static reference tables.
+
+Drivers, teams, circuits and seasons are held as immutable records (NamedTuples
+with the fields of their read schemas) in plain dicts by id and natural key. The
+index is rebuilt from the primary when the data version of one of those tables
+changes - checked against the same per-process snapshot the ETags use - and swapped
+in with one assignment, so a reader always sees one complete index. Detail and
+ref/code lookups are served from it without a database session.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from f1api.core.db import async_engine
+from f1api.core.versions import DataVersionStore, data_versions, version_token
+from f1api.models import Circuit, Driver, Season, Team
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_SCOPES = ("drivers", "teams", "circuits", "seasons")
+
+
+class DriverRecord(NamedTuple):
+    id: int
+    ref: str
+    code: str | None
+    permanent_number: int | None
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    nationality: str | None
+    country_code: str | None
+
+
+class TeamRecord(NamedTuple):
+    id: int
+    ref: str
+    name: str
+
+
+class CircuitRecord(NamedTuple):
+    id: int
+    ref: str
+    name: str
+    country_code: str | None
+    city: str | None
+
+
+class SeasonRecord(NamedTuple):
+    id: int
+    year: int
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceIndex:
+    token: str  # data versions it was built from
+    drivers: dict[int, DriverRecord]
+    drivers_by_ref: dict[str, DriverRecord]
+    drivers_by_code: dict[str, tuple[DriverRecord, ...]]  # codes are reused over the years
+    teams: dict[int, TeamRecord]
+    teams_by_ref: dict[str, TeamRecord]
+    circuits: dict[int, CircuitRecord]
+    circuits_by_ref: dict[str, CircuitRecord]
+    seasons: dict[int, SeasonRecord]
+    seasons_by_year: dict[int, SeasonRecord]
+
+    @classmethod
+    def build(
+        cls,
+        token: str,
+        drivers: Iterable[DriverRecord],
+        teams: Iterable[TeamRecord],
+        circuits: Iterable[CircuitRecord],
+        seasons: Iterable[SeasonRecord],
+    ) -> ReferenceIndex:
+        drivers, teams, circuits, seasons = (
+            list(drivers),
+            list(teams),
+            list(circuits),
+            list(seasons),
+        )
+        by_code: dict[str, list[DriverRecord]] = {}
+        for driver in drivers:
+            if driver.code is not None:
+                by_code.setdefault(driver.code, []).append(driver)
+        return cls(
+            token=token,
+            drivers={d.id: d for d in drivers},
+            drivers_by_ref={d.ref: d for d in drivers},
+            drivers_by_code={code: tuple(ds) for code, ds in by_code.items()},
+            teams={t.id: t for t in teams},
+            teams_by_ref={t.ref: t for t in teams},
+            circuits={c.id: c for c in circuits},
+            circuits_by_ref={c.ref: c for c in circuits},
+            seasons={s.id: s for s in seasons},
+            seasons_by_year={s.year: s for s in seasons},
+        )
+
+
+async def _records(conn: AsyncConnection, model: type[Any], record: Any) -> list[Any]:
+    columns = [getattr(model, name) for name in record._fields]
+    return [record._make(row) for row in await conn.execute(select(*columns).order_by(model.id))]
+
+
+async def load_reference_index(token: str) -> ReferenceIndex:
+    # the primary, like the data versions: a lagging replica would pin stale records to `token`
+    async with async_engine.connect() as conn:
+        return ReferenceIndex.build(
+            token,
+            await _records(conn, Driver, DriverRecord),
+            await _records(conn, Team, TeamRecord),
+            await _records(conn, Circuit, CircuitRecord),
+            await _records(conn, Season, SeasonRecord),
+        )
+
+
+class ReferenceStore:
+    """Holds the current ``ReferenceIndex``; rebuilds it when its data versions move."""
+
+    def __init__(
+        self,
+        versions: DataVersionStore = data_versions,
+        loader: Callable[[str], Awaitable[ReferenceIndex]] = load_reference_index,
+    ) -> None:
+        self.versions = versions
+        self.loader = loader
+        self._index: ReferenceIndex | None = None
+
+    async def current(self) -> ReferenceIndex:
+        token = version_token(await self.versions.snapshot(), REFERENCE_SCOPES)
+        index = self._index
+        if index is None or index.token != token:
+            # no lock: concurrent rebuilds produce equal indexes, the last swap wins
+            index = await self.loader(token)
+            self._index = index
+        return index
+
+    async def warm(self) -> None:
+        """Load at startup; if the database is not reachable yet, load on first use."""
+        try:
+            await self.current()
+        except DBAPIError as exc:
+            logger.warning("Reference index not loaded at startup: %s", exc)
+
+
+reference_index = ReferenceStore()
+
+
+async def get_reference_index() -> ReferenceIndex:
+    return await reference_index.current()
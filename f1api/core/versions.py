@@ -0,0 +1,207 @@
+"""
+ETags and conditional GET for the read-only API.
+
+Each route prefix depends on a set of data scopes (see ``data_versions``). The
+strong ETag of a response is a digest of the normalized request URL and the
+current versions of those scopes, so it can be computed - and ``If-None-Match``
+answered with a 304 - before the handler touches the database. Versions are read
+once per ``data_version_refresh_seconds`` per process, and immediately after any
+commit made by this process. Encoded responses carry the ETag of their encoding
+variant (``"<digest>-gzip"``), and any variant's ETag revalidates. Responses read
+from a replica that is behind those versions get no ETag (see ``f1api.core.db``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Engine, String, event, func, select, true
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from f1api.core.cache import DATA_VERSION_SCOPE_KEY, cache_key, response_cache
+from f1api.core.compression import ENCODINGS, encoded_etag
+from f1api.core.config import settings
+from f1api.core.db import (
+    UNCACHEABLE_SCOPE_KEY,
+    WRITER_LSN_SCOPE_KEY,
+    async_engine,
+    parse_lsn,
+)
+from f1api.core.metrics import ROUTE_SCOPE_KEY
+from f1api.models import DataVersion
+
+# Data scopes (table names, "standings") each route prefix reads; longest prefix wins.
+# A ``{name}`` segment in a prefix matches any single path segment.
+_RESULT_SCOPES = ("sessions", "session_results", "entries", "drivers", "teams")
+ROUTE_SCOPES: dict[str, tuple[str, ...]] = {
+    "/api/v1/seasons": ("seasons",),
+    "/api/v1/seasons/{year}/snapshot": (
+        "seasons",
+        "events",
+        "circuits",
+        "entries",
+        "drivers",
+        "teams",
+        "standings",
+    ),
+    "/api/v1/teams": ("teams",),
+    "/api/v1/drivers": ("drivers",),
+    "/api/v1/events": ("events", "seasons", *_RESULT_SCOPES),
+    "/api/v1/sessions": _RESULT_SCOPES,
+    "/api/v1/standings": ("standings", "seasons", "drivers", "teams"),
+    "/api/v1/stats": ("season_stats", "seasons", "drivers", "teams"),
+    "/api/v1/export": ("events", "seasons", *_RESULT_SCOPES),
+}
+
+Versions = dict[str, tuple[int, datetime]]
+
+
+async def _load_versions() -> tuple[Versions, int]:
+    """The versions, and the primary's WAL position they are all visible at."""
+    # one statement: the position is taken after its snapshot, so at or past every
+    # commit the versions reflect
+    lsn = select(func.pg_current_wal_insert_lsn().cast(String).label("lsn")).subquery()
+    stmt = (
+        select(lsn.c.lsn, DataVersion.scope, DataVersion.version, DataVersion.updated_at)
+        .select_from(lsn)
+        .outerjoin(DataVersion, true())
+    )
+    async with async_engine.connect() as conn:
+        rows = (await conn.execute(stmt)).all()
+    versions = {scope: (version, at) for _, scope, version, at in rows if scope is not None}
+    return versions, parse_lsn(rows[0].lsn)
+
+
+class DataVersionStore:
+    """Process-local snapshot of ``data_versions``, refreshed at most every interval."""
+
+    def __init__(
+        self,
+        refresh_interval: float,
+        loader: Callable[[], Awaitable[tuple[Versions, int]]] = _load_versions,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.loader = loader
+        self.clock = clock
+        self._versions: Versions = {}
+        self.writer_lsn: int | None = None
+        self._expires_at = 0.0
+
+    async def snapshot(self) -> Versions:
+        if self.clock() >= self._expires_at:
+            # no lock: a concurrent refresh just costs one extra small query
+            self._versions, self.writer_lsn = await self.loader()
+            self._expires_at = self.clock() + self.refresh_interval
+        return self._versions
+
+    def expire(self) -> None:
+        self._expires_at = 0.0
+
+
+data_versions = DataVersionStore(settings.data_version_refresh_seconds)
+
+
+@event.listens_for(Engine, "commit")
+def _expire_after_commit(conn: Any) -> None:
+    # our own writes must show up in the very next response
+    data_versions.expire()
+
+
+@cache
+def _prefix_pattern(prefix: str) -> re.Pattern[str]:
+    return re.compile(re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(prefix)))
+
+
+def _matches(path: str, prefix: str) -> bool:
+    if "{" not in prefix:
+        return path.startswith(prefix)
+    return _prefix_pattern(prefix).match(path) is not None
+
+
+def scopes_for(path: str) -> tuple[str, tuple[str, ...]] | None:
+    """Longest matching route prefix and its scopes."""
+    best: tuple[str, tuple[str, ...]] | None = None
+    for prefix, scopes in ROUTE_SCOPES.items():
+        if _matches(path, prefix) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, scopes)
+    return best
+
+
+def version_token(versions: Versions, scopes: Iterable[str]) -> str:
+    return ",".join(f"{s}:{versions[s][0] if s in versions else 0}" for s in scopes)
+
+
+def _etag_match(header: str, etag: str) -> str | None:
+    """The tag (``etag`` or one of its encoding variants) that ``header`` matches."""
+    variants = {etag, "*", *(encoded_etag(etag, encoding) for encoding in ENCODINGS)}
+    for candidate in (c.strip().removeprefix("W/") for c in header.split(",")):
+        if candidate in variants:
+            return etag if candidate == "*" else candidate
+    return None
+
+
+class ConditionalGetMiddleware:
+    """Add ETag/Cache-Control/Last-Modified to API GETs and answer If-None-Match with 304."""
+
+    def __init__(self, app: ASGIApp, store: DataVersionStore = data_versions) -> None:
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        matched = scopes_for(scope["path"]) if scope["type"] == "http" else None
+        if matched is None or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        prefix, data_scopes = matched
+        versions = await self.store.snapshot()
+        token = version_token(versions, data_scopes)
+        digest = hashlib.blake2b(f"{cache_key(scope)}|{token}".encode(), digest_size=12)
+        etag = f'"{digest.hexdigest()}"'
+        scope[DATA_VERSION_SCOPE_KEY] = token
+        scope[WRITER_LSN_SCOPE_KEY] = self.store.writer_lsn
+
+        ttl = response_cache.ttl_for(scope["path"])
+        headers = [
+            (b"cache-control", f"public, max-age={int(ttl)}".encode() if ttl > 0 else b"no-cache"),
+        ]
+        modified = [versions[s][1] for s in data_scopes if s in versions]
+        if modified:
+            last_modified = format_datetime(max(modified).astimezone(UTC), usegmt=True)
+            headers.append((b"last-modified", last_modified.encode()))
+
+        request_headers = dict(scope["headers"])
+        if_none_match = request_headers.get(b"if-none-match")
+        matched_tag = _etag_match(if_none_match.decode("latin-1"), etag) if if_none_match else None
+        if matched_tag is not None:
+            scope[ROUTE_SCOPE_KEY] = prefix  # handler not reached: label 304s by prefix
+            headers.append((b"etag", matched_tag.encode()))
+            if settings.compression_enabled:
+                headers.append((b"vary", b"Accept-Encoding"))
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def add_headers(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] == 200
+                and not scope.get(UNCACHEABLE_SCOPE_KEY)
+            ):
+                encoding = dict(message["headers"]).get(b"content-encoding")
+                tag = encoded_etag(etag, encoding.decode()) if encoding else etag
+                message = {
+                    **message,
+                    "headers": [*message["headers"], (b"etag", tag.encode()), *headers],
+                }
+            await send(message)
+
+        await self.app(scope, receive, add_headers)
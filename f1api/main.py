@@ -1,11 +1,30 @@
-from fastapi import FastAPI
-from fastapi.responses import PlainTextResponse
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import FastAPI, Response
 
 from f1api.api.router import api_router
+from f1api.core.cache import ResponseCacheMiddleware
+from f1api.core.compression import CompressionMiddleware
 from f1api.core.config import settings
 from f1api.core.errors import init_exception_handlers
+from f1api.core.metrics import CONTENT_TYPE, MetricsMiddleware, pool_status, render_metrics
+from f1api.core.reference import reference_index
+from f1api.core.versions import ConditionalGetMiddleware
+from f1api.services.hooks import register_write_hooks
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    register_write_hooks()
+    # reference lookups are served from memory; load them before the first request
+    await reference_index.warm()
+    yield
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="F1 API",
     version="0.1.0",
     openapi_url="/api/v1/openapi.json",
@@ -16,6 +35,21 @@ app = FastAPI(
 # install global error handlers
 init_exception_handlers(app)
 
+# serve repeat GETs from the in-process response cache
+if settings.response_cache_enabled:
+    app.add_middleware(ResponseCacheMiddleware)
+
+# gzip/br/zstd for responses the cache did not already encode
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+
+# ETags from data versions; If-None-Match is answered before cache or handler
+if settings.conditional_get_enabled:
+    app.add_middleware(ConditionalGetMiddleware)
+
+# per-route request metrics (outermost, so cache hits are measured too)
+app.add_middleware(MetricsMiddleware)
+
 
 # healthz (keep as-is)
 @app.get("/healthz", tags=["meta"])
@@ -23,11 +57,11 @@ def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/metrics", tags=["meta"], response_class=PlainTextResponse)
-def metrics() -> str:
-    """Prometheus-friendly metrics stub."""
+@app.get("/metrics", tags=["meta"])
+def metrics() -> Response:
+    """Prometheus text exposition of request, DB and pool metrics."""
 
-    return "# Metrics not implemented yet\n"
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
 
 
 # main API
@@ -40,3 +74,14 @@ if settings.app_env != "production":
     def boom() -> None:
         # intentionally raise an unhandled error
         raise RuntimeError("Kaboom")
+
+    @app.get("/api/v1/_debug/pool", tags=["meta"])
+    def pool() -> dict[str, Any]:
+        """Pool settings, occupancy and checkout/wait/invalidation counts per engine."""
+        return {
+            "pre_ping_idle_seconds": settings.db_pre_ping_idle_seconds,
+            "prepare_threshold": (
+                settings.db_prepare_threshold if settings.db_prepared_statements else None
+            ),
+            "pools": pool_status(),
+        }
@@ -1,11 +1,14 @@
 from f1api.models.base import Base
 from f1api.models.circuit import Circuit
+from f1api.models.data_version import DataVersion
 from f1api.models.driver import Driver
 from f1api.models.entry import Entry
 from f1api.models.event import Event
 from f1api.models.season import Season
+from f1api.models.season_stats import SeasonDriverStats, SeasonTeamStats
 from f1api.models.session import Session, SessionType
 from f1api.models.session_result import SessionResult
+from f1api.models.standing import ConstructorStanding, DriverStanding
 from f1api.models.team import Team
 
 __all__ = [
@@ -19,4 +22,9 @@ __all__ = [
     "Session",
     "SessionType",
     "SessionResult",
+    "DriverStanding",
+    "ConstructorStanding",
+    "DataVersion",
+    "SeasonDriverStats",
+    "SeasonTeamStats",
 ]
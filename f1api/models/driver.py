@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import String, UniqueConstraint
+from sqlalchemy import Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from f1api.models.base import Base, TimestampMixin
@@ -16,8 +16,9 @@ class Driver(Base, TimestampMixin):
     code: Mapped[str | None] = mapped_column(String(3), nullable=True)  # "VER"
     permanent_number: Mapped[int | None] = mapped_column(nullable=True)
 
-    first_name: Mapped[str] = mapped_column(String(64), nullable=False)
-    last_name: Mapped[str] = mapped_column(String(64), nullable=False)
+    # binary collation: list order matches the in-memory reference index (code points)
+    first_name: Mapped[str] = mapped_column(String(64, collation="C"), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(64, collation="C"), nullable=False)
     date_of_birth: Mapped[date] = mapped_column(nullable=False)
 
     nationality: Mapped[str | None] = mapped_column(String(64), nullable=True)
@@ -28,6 +29,9 @@ class Driver(Base, TimestampMixin):
     wikipedia_url: Mapped[str | None] = mapped_column(String(256), nullable=True)
     image_url: Mapped[str | None] = mapped_column(String(256), nullable=True)
 
-    __table_args__ = (UniqueConstraint("ref", name="uq_drivers_ref"),)
+    __table_args__ = (
+        UniqueConstraint("ref", name="uq_drivers_ref"),
+        Index("ix_drivers_name", "last_name", "first_name", "id"),  # list order
+    )
 
     entries = relationship("Entry", back_populates="driver", cascade="all, delete-orphan")
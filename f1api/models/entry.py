@@ -9,6 +9,7 @@ from f1api.models.base import Base, TimestampMixin
 class Entry(Base, TimestampMixin):
     """
     A driver racing for a team in a given season (line-up).
+    A driver who changes teams mid-season has one entry per team.
     """
 
     __tablename__ = "entries"
@@ -23,7 +24,6 @@ class Entry(Base, TimestampMixin):
     car_number: Mapped[int | None] = mapped_column(nullable=True)
 
     __table_args__ = (
-        UniqueConstraint("season_id", "driver_id", name="uq_entries_season_driver"),
         UniqueConstraint("season_id", "team_id", "driver_id", name="uq_entries_season_team_driver"),
         Index("ix_entries_season", "season_id"),
     )
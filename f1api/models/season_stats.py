@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from f1api.models.base import Base
+
+# Marks tables that are really materialized views: created by hand in migrations,
+# skipped by autogenerate (see alembic/env.py)
+MATERIALIZED_VIEW = {"materialized_view": True}
+
+
+class SeasonDriverStats(Base):
+    """
+    Per-season RACE aggregates of a driver over all their entries (materialized view),
+    with the team of their latest race. Refreshed after ingestion by
+    f1api.services.season_stats.
+    """
+
+    __tablename__ = "season_driver_stats"
+    __table_args__ = {"info": MATERIALIZED_VIEW}
+
+    season_id: Mapped[int] = mapped_column(primary_key=True)
+    driver_id: Mapped[int] = mapped_column(primary_key=True)
+    team_id: Mapped[int] = mapped_column(nullable=False)
+
+    starts: Mapped[int] = mapped_column(nullable=False)
+    wins: Mapped[int] = mapped_column(nullable=False)
+    podiums: Mapped[int] = mapped_column(nullable=False)
+    dnfs: Mapped[int] = mapped_column(nullable=False)
+    points: Mapped[float] = mapped_column(nullable=False)
+    avg_grid: Mapped[float | None] = mapped_column(nullable=True)
+    avg_finish: Mapped[float | None] = mapped_column(nullable=True)
+    avg_positions_gained: Mapped[float | None] = mapped_column(nullable=True)  # grid - finish
+
+
+class SeasonTeamStats(Base):
+    """
+    Per-season RACE aggregates of a team over all its cars (materialized view).
+    Refreshed after ingestion by f1api.services.season_stats.
+    """
+
+    __tablename__ = "season_team_stats"
+    __table_args__ = {"info": MATERIALIZED_VIEW}
+
+    season_id: Mapped[int] = mapped_column(primary_key=True)
+    team_id: Mapped[int] = mapped_column(primary_key=True)
+
+    starts: Mapped[int] = mapped_column(nullable=False)  # car starts
+    wins: Mapped[int] = mapped_column(nullable=False)
+    podiums: Mapped[int] = mapped_column(nullable=False)
+    dnfs: Mapped[int] = mapped_column(nullable=False)
+    points: Mapped[float] = mapped_column(nullable=False)
+    avg_grid: Mapped[float | None] = mapped_column(nullable=True)
+    avg_finish: Mapped[float | None] = mapped_column(nullable=True)
+    avg_positions_gained: Mapped[float | None] = mapped_column(nullable=True)  # grid - finish
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import StrEnum
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from f1api.models.base import Base, TimestampMixin
@@ -31,7 +31,12 @@ class Session(Base, TimestampMixin):
     session_order: Mapped[int] = mapped_column(nullable=False, default=1)
     started_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
-    __table_args__ = (Index("ix_sessions_event", "event_id"),)
+    __table_args__ = (
+        UniqueConstraint("event_id", "type", "session_order", name="uq_sessions_event_type_order"),
+        Index("ix_sessions_event", "event_id"),
+        # standings and progression only ever read RACE sessions
+        Index("ix_sessions_event_race", "event_id", "id", postgresql_where=text("type = 'RACE'")),
+    )
 
     event = relationship("Event", back_populates="sessions")
     results = relationship("SessionResult", back_populates="session", cascade="all, delete-orphan")
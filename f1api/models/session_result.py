@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Index
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from f1api.models.base import Base, TimestampMixin
@@ -27,8 +27,15 @@ class SessionResult(Base, TimestampMixin):
     classified: Mapped[bool] = mapped_column(nullable=False, default=True)
 
     __table_args__ = (
+        UniqueConstraint("session_id", "entry_id", name="uq_results_session_entry"),
         Index("ix_results_session", "session_id"),
         Index("ix_results_session_pos", "session_id", "position"),
+        # covers the standings aggregation: entries of a season -> their results
+        Index(
+            "ix_results_entry",
+            "entry_id",
+            postgresql_include=["session_id", "points", "position"],
+        ),
     )
 
     session = relationship("Session", back_populates="results")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from f1api.models.base import Base
+
+
+class DriverStanding(Base):
+    """
+    Persisted driver championship row for a season.
+    Maintained from RACE session results by f1api.services.standings.
+    """
+
+    __tablename__ = "driver_standings"
+
+    season_id: Mapped[int] = mapped_column(
+        ForeignKey("seasons.id", ondelete="CASCADE"), primary_key=True
+    )
+    driver_id: Mapped[int] = mapped_column(
+        ForeignKey("drivers.id", ondelete="CASCADE"), primary_key=True
+    )
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+
+    position: Mapped[int] = mapped_column(nullable=False)
+    points: Mapped[float] = mapped_column(nullable=False, default=0.0)
+    wins: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    __table_args__ = (Index("ix_driver_standings_season_pos", "season_id", "position"),)
+
+    driver = relationship("Driver")
+    team = relationship("Team")
+
+
+class ConstructorStanding(Base):
+    """
+    Persisted constructor championship row for a season.
+    Maintained from RACE session results by f1api.services.standings.
+    """
+
+    __tablename__ = "constructor_standings"
+
+    season_id: Mapped[int] = mapped_column(
+        ForeignKey("seasons.id", ondelete="CASCADE"), primary_key=True
+    )
+    team_id: Mapped[int] = mapped_column(
+        ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    position: Mapped[int] = mapped_column(nullable=False)
+    points: Mapped[float] = mapped_column(nullable=False, default=0.0)
+    wins: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    __table_args__ = (Index("ix_constructor_standings_season_pos", "season_id", "position"),)
+
+    team = relationship("Team")
@@ -11,7 +11,8 @@ class Team(Base, TimestampMixin):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     ref: Mapped[str] = mapped_column(String(64), nullable=False)  # e.g. "red_bull_racing"
-    name: Mapped[str] = mapped_column(String(128), nullable=False)
+    # binary collation: list order matches the in-memory reference index (code points)
+    name: Mapped[str] = mapped_column(String(128, collation="C"), nullable=False)
 
     __table_args__ = (UniqueConstraint("ref", name="uq_teams_ref"),)
 
@@ -1,11 +1,27 @@
+from f1api.schemas.batch import BatchGetRequest, BatchMissing, BatchResponse
 from f1api.schemas.circuit import CircuitRead
 from f1api.schemas.driver import DriverRead
 from f1api.schemas.event import EventRead
 from f1api.schemas.pagination import PaginatedResponse
 from f1api.schemas.season import SeasonRead
+from f1api.schemas.season_stats import DriverSeasonStatsRead, TeamSeasonStatsRead
 from f1api.schemas.session import SessionRead
-from f1api.schemas.session_result import SessionResultRead
-from f1api.schemas.standing import ConstructorStandingRead, DriverStandingRead
+from f1api.schemas.session_result import (
+    ClassificationRow,
+    EventClassification,
+    SessionClassification,
+    SessionResultRead,
+)
+from f1api.schemas.snapshot import SeasonSnapshot, SnapshotEntry, SnapshotEvent
+from f1api.schemas.standing import (
+    ConstructorProgression,
+    ConstructorProgressionRow,
+    ConstructorStandingRead,
+    DriverProgression,
+    DriverProgressionRow,
+    DriverStandingRead,
+    ProgressionRound,
+)
 from f1api.schemas.team import TeamRead
 
 __all__ = [
@@ -16,7 +32,23 @@ __all__ = [
     "EventRead",
     "SessionRead",
     "SessionResultRead",
+    "ClassificationRow",
+    "SessionClassification",
+    "EventClassification",
     "DriverStandingRead",
     "ConstructorStandingRead",
+    "ProgressionRound",
+    "DriverProgressionRow",
+    "DriverProgression",
+    "ConstructorProgressionRow",
+    "ConstructorProgression",
+    "DriverSeasonStatsRead",
+    "TeamSeasonStatsRead",
+    "SnapshotEvent",
+    "SnapshotEntry",
+    "SeasonSnapshot",
     "PaginatedResponse",
+    "BatchGetRequest",
+    "BatchMissing",
+    "BatchResponse",
 ]
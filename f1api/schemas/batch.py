@@ -0,0 +1,32 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+MAX_BATCH_KEYS = 1000
+
+
+class BatchGetRequest(BaseModel):
+    """Ids and/or refs to look up in one call."""
+
+    ids: list[int] = Field(default_factory=list, max_length=MAX_BATCH_KEYS)
+    refs: list[str] = Field(
+        default_factory=list,
+        max_length=MAX_BATCH_KEYS,
+        description="Natural keys (drivers and teams)",
+    )
+
+
+class BatchMissing(BaseModel):
+    """Requested keys that matched nothing."""
+
+    ids: list[int] = Field(default_factory=list)
+    refs: list[str] = Field(default_factory=list)
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    """Generic batch lookup response: found items in request order, plus what was missing."""
+
+    items: list[T] = Field(..., description="Found items, in request order (ids, then refs)")
+    missing: BatchMissing = Field(..., description="Requested ids/refs that do not exist")
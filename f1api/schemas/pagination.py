@@ -9,28 +9,55 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper."""
 
     items: list[T] = Field(..., description="List of items in current page")
-    total: int = Field(..., description="Total number of items available")
+    total: int | None = Field(
+        ..., description="Total number of items available (null when not counted)"
+    )
+    total_is_estimate: bool = Field(
+        False, description="True when total/pages come from planner statistics"
+    )
     limit: int = Field(..., description="Maximum items per page")
     offset: int = Field(..., description="Number of items skipped")
-    page: int = Field(..., description="Current page number (1-indexed)")
-    pages: int = Field(..., description="Total number of pages")
+    page: int | None = Field(
+        ..., description="Current page number (1-indexed, null in cursor mode)"
+    )
+    pages: int | None = Field(..., description="Total number of pages (null when not counted)")
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page (cursor mode only, null on last page)"
+    )
+
+    @staticmethod
+    def page_numbers(
+        total: int | None, limit: int, offset: int, cursor_mode: bool = False
+    ) -> tuple[int | None, int | None]:
+        """``page`` (null in cursor mode) and ``pages`` (null when not counted)."""
+        page: int | None = None
+        pages: int | None = None
+        if not cursor_mode:
+            page = (offset // limit) + 1 if limit > 0 else 1
+        if total is not None:
+            pages = (total + limit - 1) // limit if limit > 0 else 1
+        return page, pages
 
     @classmethod
     def create(
         cls,
         items: list[T],
-        total: int,
+        total: int | None,
         limit: int,
         offset: int,
+        next_cursor: str | None = None,
+        cursor_mode: bool = False,
+        total_is_estimate: bool = False,
     ) -> "PaginatedResponse[T]":
         """Helper to create paginated response with calculated fields."""
-        page = (offset // limit) + 1 if limit > 0 else 1
-        pages = (total + limit - 1) // limit if limit > 0 else 1
+        page, pages = cls.page_numbers(total, limit, offset, cursor_mode)
         return cls(
             items=items,
             total=total,
+            total_is_estimate=total_is_estimate,
             limit=limit,
             offset=offset,
             page=page,
             pages=pages,
+            next_cursor=next_cursor,
         )
@@ -0,0 +1,41 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class DriverSeasonStatsRead(BaseModel):
+    """A driver's race statistics for one season."""
+
+    driver_id: int
+    driver_ref: str
+    driver_code: str | None
+    driver_first_name: str
+    driver_last_name: str
+    team_id: int
+    team_name: str
+    starts: int
+    wins: int
+    podiums: int
+    dnfs: int
+    points: float
+    avg_grid: float | None
+    avg_finish: float | None
+    avg_positions_gained: float | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TeamSeasonStatsRead(BaseModel):
+    """A team's race statistics for one season, over all its cars."""
+
+    team_id: int
+    team_ref: str
+    team_name: str
+    starts: int
+    wins: int
+    podiums: int
+    dnfs: int
+    points: float
+    avg_grid: float | None
+    avg_finish: float | None
+    avg_positions_gained: float | None
+
+    model_config = ConfigDict(from_attributes=True)
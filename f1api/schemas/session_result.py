@@ -1,5 +1,8 @@
 from pydantic import BaseModel, ConfigDict
 
+from f1api.schemas.event import EventRead
+from f1api.schemas.session import SessionRead
+
 
 class SessionResultRead(BaseModel):
     id: int
@@ -11,3 +14,38 @@ class SessionResultRead(BaseModel):
     laps: int | None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ClassificationRow(BaseModel):
+    """One line of a session classification, with driver and team resolved."""
+
+    position: int | None
+    driver_id: int
+    driver_ref: str
+    driver_code: str | None
+    driver_first_name: str
+    driver_last_name: str
+    team_id: int
+    team_name: str
+    car_number: int | None
+    grid: int | None
+    laps: int | None
+    points: float
+    status: str | None
+    time_ms: int | None
+    gap_ms: int | None
+    classified: bool
+
+
+class SessionClassification(BaseModel):
+    """A session with its full result sheet."""
+
+    session: SessionRead
+    results: list[ClassificationRow]
+
+
+class EventClassification(BaseModel):
+    """Every session of an event with its result sheet, in session order."""
+
+    event: EventRead
+    sessions: list[SessionClassification]
@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+
+from f1api.schemas.circuit import CircuitRead
+from f1api.schemas.driver import DriverRead
+from f1api.schemas.event import EventRead
+from f1api.schemas.season import SeasonRead
+from f1api.schemas.standing import ConstructorStandingRead, DriverStandingRead
+from f1api.schemas.team import TeamRead
+
+
+class SnapshotEvent(EventRead):
+    """An event of the season with its circuit."""
+
+    circuit: CircuitRead
+
+
+class SnapshotEntry(BaseModel):
+    """A line-up entry with its driver and team."""
+
+    id: int
+    car_number: int | None
+    driver: DriverRead
+    team: TeamRead
+
+
+class SeasonSnapshot(BaseModel):
+    """Everything a season page shows, as one document."""
+
+    season: SeasonRead
+    events: list[SnapshotEvent]
+    entries: list[SnapshotEntry]
+    driver_standings: list[DriverStandingRead]
+    constructor_standings: list[ConstructorStandingRead]
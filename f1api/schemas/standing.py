@@ -29,3 +29,53 @@ class ConstructorStandingRead(BaseModel):
     wins: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProgressionRound(BaseModel):
+    """A round counted in a championship progression."""
+
+    round: int
+    event_id: int
+    event_name: str
+
+
+class DriverProgressionRow(BaseModel):
+    """A driver's standing after each round; the lists line up with ``rounds``."""
+
+    driver_id: int
+    driver_ref: str
+    driver_code: str | None
+    driver_first_name: str
+    driver_last_name: str
+    team_id: int
+    team_name: str
+    positions: list[int]
+    points: list[float]
+    wins: list[int]
+
+
+class ConstructorProgressionRow(BaseModel):
+    """A constructor's standing after each round; the lists line up with ``rounds``."""
+
+    team_id: int
+    team_ref: str
+    team_name: str
+    positions: list[int]
+    points: list[float]
+    wins: list[int]
+
+
+class DriverProgression(BaseModel):
+    """Driver championship after every round, ordered by the latest position."""
+
+    season_year: int
+    rounds: list[ProgressionRound]
+    drivers: list[DriverProgressionRow]
+
+
+class ConstructorProgression(BaseModel):
+    """Constructor championship after every round, ordered by the latest position."""
+
+    season_year: int
+    rounds: list[ProgressionRound]
+    constructors: list[ConstructorProgressionRow]
@@ -0,0 +1,67 @@
+"""
+Bumping of the per-scope data versions that drive API ETags.
+
+Every committed write bumps the version of the scopes it touched, in the same
+transaction. ORM writes are picked up by ``bump_versions_after_flush`` (registered
+by ``f1api.services.hooks``); Core/bulk writers call ``bump_data_versions``
+themselves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import Connection, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, UOWTransaction
+
+from f1api.models import Base, DataVersion
+
+# Scope names are table names, except that both standings tables share one scope
+STANDINGS_SCOPE = "standings"
+# Bumped when the season stats materialized views are refreshed (not by table writes)
+SEASON_STATS_SCOPE = "season_stats"
+TABLE_SCOPES = {
+    "driver_standings": STANDINGS_SCOPE,
+    "constructor_standings": STANDINGS_SCOPE,
+}
+# Writes to these tables feed the persisted standings
+STANDINGS_INPUTS = frozenset({"seasons", "entries", "events", "sessions", "session_results"})
+
+
+def scope_for_table(table: str) -> str:
+    return TABLE_SCOPES.get(table, table)
+
+
+def bump_data_versions(conn: Connection | Session, scopes: Iterable[str]) -> None:
+    """Increment the given scopes inside the caller's transaction."""
+    # sorted: concurrent writers lock the version rows in the same order
+    rows = [{"scope": scope, "version": 1} for scope in sorted(set(scopes))]
+    if not rows:
+        return
+    stmt = pg_insert(DataVersion).values(rows)
+    conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[DataVersion.scope],
+            set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+        )
+    )
+
+
+def flushed_scopes(session: Session) -> set[str]:
+    """Scopes touched by the pending changes of ``session``."""
+    scopes: set[str] = set()
+    dirty = (obj for obj in session.dirty if session.is_modified(obj))
+    for obj in (*session.new, *dirty, *session.deleted):
+        if isinstance(obj, Base) and not isinstance(obj, DataVersion):
+            scopes.add(scope_for_table(obj.__tablename__))
+    if scopes & STANDINGS_INPUTS:
+        scopes.add(STANDINGS_SCOPE)
+    return scopes
+
+
+def bump_versions_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """``after_flush`` hook: bump the scopes the flush touched."""
+    scopes = flushed_scopes(session)
+    if scopes:
+        bump_data_versions(session.connection(), scopes)
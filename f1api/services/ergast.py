@@ -0,0 +1,347 @@
+"""
+Multi-season import from an Ergast-style CSV archive.
+
+The archive directory holds the usual dump files (``seasons.csv``,
+``constructors.csv``, ``drivers.csv``, ``circuits.csv``, ``races.csv``,
+``results.csv``, ``status.csv`` and optionally ``qualifying.csv``), with ``\\N``
+for missing values. Reference tables are upserted once by the parent process;
+seasons are then loaded in parallel by a process pool, one connection and one
+transaction per season, through the bulk loader in ``f1api.services.ingest``.
+
+A driver who changed teams mid-season gets one entry per team, and each result
+names the team of its ``constructorId``, so it is credited to the team the driver
+actually drove for.
+
+Usage:
+    python -m f1api.services.ergast path/to/archive [--seasons 1950-2024] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+
+from f1api.core.cache import invalidate_response_cache
+from f1api.core.db import engine
+from f1api.services.hooks import register_write_hooks
+from f1api.services.ingest import (
+    CircuitRecord,
+    DriverRecord,
+    EntryRecord,
+    IngestReport,
+    RefIds,
+    SeasonDataset,
+    TeamRecord,
+    load_reference_data,
+    load_season,
+)
+from f1api.services.season_stats import refresh_season_stats
+
+NULL = "\\N"
+
+# Session orders used for imported events (matches the 2024 seed)
+QUALIFYING_ORDER = 2
+RACE_ORDER = 3
+
+
+@dataclass
+class ErgastArchive:
+    teams: list[TeamRecord]
+    drivers: list[DriverRecord]
+    circuits: list[CircuitRecord]
+    seasons: dict[int, SeasonDataset]
+    notes: list[str] = field(default_factory=list)
+
+
+def _rows(path: Path) -> Iterator[dict[str, str | None]]:
+    """CSV rows with ``\\N`` mapped to ``None``; a missing optional file yields nothing."""
+    if not path.exists():
+        return
+    with path.open(newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            yield {k: (None if v == NULL else v) for k, v in row.items()}
+
+
+def _int(value: str | None) -> int | None:
+    return int(value) if value else None
+
+
+def _float(value: str | None) -> float | None:
+    return float(value) if value else None
+
+
+def _started_at(day: str | None, clock: str | None) -> datetime | None:
+    if not day:
+        return None
+    return datetime.fromisoformat(f"{day}T{clock or '00:00:00'}")
+
+
+# Ergast reasons for a car that never took the start
+NOT_STARTED = {
+    "Did not start": "DNS",
+    "Withdrew": "DNS",
+    "Did not qualify": "DNQ",
+    "Did not prequalify": "DNQ",
+    "107% Rule": "DNQ",
+}
+
+
+def _status(text: str | None) -> str | None:
+    """
+    Collapse "Finished" / "+N Lap(s)" to FINISHED and non-starts to DNS / DNQ;
+    keep retirement reasons as-is.
+    """
+    if text is None:
+        return None
+    if text == "Finished" or text.startswith("+"):
+        return "FINISHED"
+    return NOT_STARTED.get(text, text)
+
+
+def read_archive(root: Path, years: set[int] | None = None) -> ErgastArchive:
+    """Parse an archive into reference records plus one dataset per season."""
+    notes: list[str] = []
+
+    team_refs: dict[str, str] = {}
+    teams: list[TeamRecord] = []
+    for row in _rows(root / "constructors.csv"):
+        team_refs[row["constructorId"] or ""] = row["constructorRef"] or ""
+        teams.append({"ref": row["constructorRef"] or "", "name": row["name"] or ""})
+
+    driver_refs: dict[str, str] = {}
+    drivers: list[DriverRecord] = []
+    for row in _rows(root / "drivers.csv"):
+        if row["dob"] is None:  # date_of_birth is mandatory in our schema
+            notes.append(f"skipped driver {row['driverRef']}: no date of birth")
+            continue
+        driver_refs[row["driverId"] or ""] = row["driverRef"] or ""
+        drivers.append(
+            {
+                "ref": row["driverRef"] or "",
+                "code": row["code"],
+                "permanent_number": _int(row["number"]),
+                "first_name": row["forename"] or "",
+                "last_name": row["surname"] or "",
+                "date_of_birth": date.fromisoformat(row["dob"]),
+                "nationality": row["nationality"],
+            }
+        )
+
+    circuit_refs: dict[str, str] = {}
+    circuits: list[CircuitRecord] = []
+    for row in _rows(root / "circuits.csv"):
+        circuit_refs[row["circuitId"] or ""] = row["circuitRef"] or ""
+        circuits.append(
+            {
+                "ref": row["circuitRef"] or "",
+                "name": row["name"] or "",
+                "city": row["location"],
+                "latitude": _float(row["lat"]),
+                "longitude": _float(row["lng"]),
+            }
+        )
+
+    statuses = {row["statusId"]: row["status"] for row in _rows(root / "status.csv")}
+
+    seasons: dict[int, SeasonDataset] = {}
+    race_season: dict[str, tuple[int, int]] = {}  # raceId -> (year, round)
+    for row in _rows(root / "races.csv"):
+        year, rnd = int(row["year"] or 0), int(row["round"] or 0)
+        if years is not None and year not in years:
+            continue
+        race_season[row["raceId"] or ""] = (year, rnd)
+        data = seasons.setdefault(year, _empty_season(year))
+        data["events"].append(
+            {
+                "round": rnd,
+                "circuit": circuit_refs[row["circuitId"] or ""],
+                "name": row["name"] or "",
+            }
+        )
+        data["sessions"].append(
+            {
+                "round": rnd,
+                "type": "RACE",
+                "session_order": RACE_ORDER,
+                "name": "Race",
+                "started_at": _started_at(row["date"], row["time"]),
+            }
+        )
+
+    # Race results, in round / finishing order so "best result" is stable
+    race_rows = [r for r in _rows(root / "results.csv") if r["raceId"] in race_season]
+    race_rows.sort(key=lambda r: (race_season[r["raceId"] or ""], _int(r["positionOrder"]) or 0))
+
+    entries: dict[int, dict[tuple[str, str], EntryRecord]] = defaultdict(dict)
+    winner_ms: dict[str, int] = {}
+    seen: set[tuple[str, str]] = set()
+    for row in race_rows:
+        race_id, driver_id = row["raceId"] or "", row["driverId"] or ""
+        if driver_id not in driver_refs:
+            continue
+        year, rnd = race_season[race_id]
+        driver, team = driver_refs[driver_id], team_refs[row["constructorId"] or ""]
+
+        if (driver, team) not in entries[year]:
+            entries[year][driver, team] = {
+                "driver": driver,
+                "team": team,
+                "car_number": _int(row["number"]),
+            }
+
+        if (race_id, driver_id) in seen:  # shared drives: keep the best-placed result
+            notes.append(f"{year} R{rnd}: duplicate result for {driver}, kept the best-placed one")
+            continue
+        seen.add((race_id, driver_id))
+
+        time_ms = _int(row["milliseconds"])
+        position = _int(row["position"])
+        if position == 1 and time_ms is not None:
+            winner_ms[race_id] = time_ms
+        status = _status(statuses.get(row["statusId"]))
+        seasons[year]["results"].append(
+            {
+                "round": rnd,
+                "session_order": RACE_ORDER,
+                "driver": driver,
+                "team": team,
+                "position": position,
+                "points": _float(row["points"]) or 0.0,
+                "status": status,
+                "time_ms": time_ms,
+                "gap_ms": (
+                    time_ms - winner_ms[race_id]
+                    if time_ms is not None and race_id in winner_ms
+                    else None
+                ),
+                "laps": _int(row["laps"]),
+                "grid": _int(row["grid"]),
+                "classified": position is not None,
+            }
+        )
+
+    # Qualifying: one session per event that has any rows; only entrants are kept
+    quali_rows = [r for r in _rows(root / "qualifying.csv") if r["raceId"] in race_season]
+    quali_rounds: set[tuple[int, int]] = set()
+    quali_seen: set[tuple[str, str]] = set()
+    for row in quali_rows:
+        race_id, driver_id = row["raceId"] or "", row["driverId"] or ""
+        year, rnd = race_season[race_id]
+        quali_driver = driver_refs.get(driver_id)
+        quali_team = team_refs.get(row["constructorId"] or "")
+        if quali_driver is None or quali_team is None:
+            continue
+        if (quali_driver, quali_team) not in entries[year]:
+            continue
+        if (race_id, driver_id) in quali_seen:
+            continue
+        quali_seen.add((race_id, driver_id))
+        if (year, rnd) not in quali_rounds:
+            quali_rounds.add((year, rnd))
+            seasons[year]["sessions"].append(
+                {
+                    "round": rnd,
+                    "type": "QUALIFYING",
+                    "session_order": QUALIFYING_ORDER,
+                    "name": "Qualifying",
+                }
+            )
+        seasons[year]["results"].append(
+            {
+                "round": rnd,
+                "session_order": QUALIFYING_ORDER,
+                "driver": quali_driver,
+                "team": quali_team,
+                "position": _int(row["position"]),
+            }
+        )
+
+    for year, data in seasons.items():
+        data["entries"] = list(entries[year].values())
+    return ErgastArchive(teams, drivers, circuits, seasons, notes)
+
+
+def _empty_season(year: int) -> SeasonDataset:
+    return SeasonDataset(
+        year=year, teams=[], drivers=[], circuits=[], entries=[], events=[], sessions=[], results=[]
+    )
+
+
+def _load_season_worker(data: SeasonDataset, refs: RefIds) -> IngestReport:
+    """Runs in a pool process: its own engine, one connection, one transaction."""
+    with engine.begin() as conn:
+        return load_season(conn, data, refs)
+
+
+def import_archive(
+    root: Path, years: set[int] | None = None, workers: int | None = None
+) -> IngestReport:
+    """Import every (or the selected) season of an archive; returns merged stage timings."""
+    report = IngestReport()
+
+    started = time.perf_counter()
+    archive = read_archive(root, years)
+    total_rows = sum(
+        len(data["entries"]) + len(data["events"]) + len(data["sessions"]) + len(data["results"])
+        for data in archive.seasons.values()
+    )
+    report.record("read", total_rows, started)
+    for note in archive.notes:
+        print(f"   ⚠️  {note}")
+
+    with engine.begin() as conn:
+        refs = load_reference_data(conn, archive.teams, archive.drivers, archive.circuits, report)
+    engine.dispose()  # nothing pooled in the parent while workers run
+
+    # spawn: workers build their own engine instead of inheriting pooled sockets
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {
+            pool.submit(_load_season_worker, data, refs): year
+            for year, data in sorted(archive.seasons.items())
+        }
+        for future in as_completed(futures):
+            report.merge(future.result())
+            print(f"   - season {futures[future]} loaded")
+
+    started = time.perf_counter()
+    report.record("stats", refresh_season_stats(engine), started)
+    invalidate_response_cache()
+    return report
+
+
+def _parse_years(spec: str) -> set[int]:
+    """``1950-2024`` or ``2021,2023`` (or a mix)."""
+    years: set[int] = set()
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        years.update(range(int(first), int(last or first) + 1))
+    return years
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Import seasons from an Ergast-style CSV dump.")
+    parser.add_argument("archive", type=Path)
+    parser.add_argument("--seasons", type=_parse_years, help="e.g. 1950-2024 or 2021,2023")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+    register_write_hooks()
+
+    started = time.perf_counter()
+    report = import_archive(args.archive, args.seasons, args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Imported archive in {elapsed:.2f}s (stage times are summed across workers)")
+    print("\n".join(report.lines()))
+
+
+if __name__ == "__main__":
+    main()
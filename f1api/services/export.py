@@ -0,0 +1,237 @@
+"""
+Flat session result rows for bulk export.
+
+One row per session result, with its session, event, season, entry, driver and
+team resolved by joins in the query, so exporters can stream plain tuples from a
+server-side cursor without building ORM objects.
+
+With the optional ``arrow`` extra (pyarrow), ``ColumnarWriter`` turns those row
+batches into an Arrow IPC stream or a Parquet file, incrementally, for the API and
+for the CLI::
+
+    python -m f1api.services.export results.parquet [--season 2024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import time
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from sqlalchemy import Engine, Select, select
+
+from f1api.core.db import engine as default_engine
+from f1api.models import Driver, Entry, Event, Season, Session, SessionResult, Team
+
+
+def _optional(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional extra not installed
+        return None
+
+
+pa = _optional("pyarrow")
+pq = _optional("pyarrow.parquet")
+
+COLUMNAR_FORMATS = ("arrow", "parquet")
+
+# Rows fetched per round-trip from the server-side cursor
+EXPORT_BATCH_ROWS = 2000
+# Parquet row groups are buffered up to this many rows (one cursor batch is too small)
+PARQUET_ROW_GROUP_ROWS = 100_000
+
+# export column name -> source column, in output order
+RESULT_COLUMNS = {
+    "season": Season.year,
+    "round": Event.round,
+    "event_id": Event.id,
+    "event_name": Event.name,
+    "session_id": Session.id,
+    "session_type": Session.type,
+    "session_name": Session.name,
+    "position": SessionResult.position,
+    "classified": SessionResult.classified,
+    "driver_id": Driver.id,
+    "driver_ref": Driver.ref,
+    "driver_code": Driver.code,
+    "driver_first_name": Driver.first_name,
+    "driver_last_name": Driver.last_name,
+    "team_id": Team.id,
+    "team_ref": Team.ref,
+    "team_name": Team.name,
+    "car_number": Entry.car_number,
+    "grid": SessionResult.grid,
+    "laps": SessionResult.laps,
+    "points": SessionResult.points,
+    "status": SessionResult.status,
+    "time_ms": SessionResult.time_ms,
+    "gap_ms": SessionResult.gap_ms,
+}
+
+
+def results_export_query(season_year: int | None = None) -> Select[Any]:
+    """All session results (of one season, if given) in season/round/session/position order."""
+    stmt = (
+        select(*(column.label(name) for name, column in RESULT_COLUMNS.items()))
+        .select_from(SessionResult)
+        .join(SessionResult.session)
+        .join(Session.event)
+        .join(Event.season)
+        .join(SessionResult.entry)
+        .join(Entry.driver)
+        .join(Entry.team)
+    )
+    if season_year is not None:
+        stmt = stmt.where(Season.year == season_year)
+    return stmt.order_by(
+        Season.year,
+        Event.round,
+        Session.session_order,
+        Session.id,
+        SessionResult.position.asc().nulls_last(),
+        SessionResult.id,
+    )
+
+
+@cache
+def arrow_schema() -> Any:
+    """Arrow schema of the export rows, derived from the source column types."""
+    if pa is None:
+        raise RuntimeError("Columnar export needs pyarrow (install the `arrow` extra)")
+    fields = []
+    for name, attr in RESULT_COLUMNS.items():
+        column = attr.expression
+        python_type = column.type.python_type
+        if issubclass(python_type, bool):
+            arrow_type = pa.bool_()
+        elif issubclass(python_type, int):
+            arrow_type = pa.int64()
+        elif issubclass(python_type, float):
+            arrow_type = pa.float64()
+        else:  # strings and string enums
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type, nullable=bool(column.nullable)))
+    return pa.schema(fields)
+
+
+def record_batch(rows: Sequence[Sequence[Any]]) -> Any:
+    """One Arrow record batch from export rows (column-wise, no per-row objects)."""
+    assert pa is not None  # arrow_schema() raised otherwise
+    schema = arrow_schema()
+    columns = list(zip(*rows, strict=True)) or [()] * len(schema)
+    arrays = [
+        pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _Sink:
+    """Write-only file object that keeps what a pyarrow writer emits until taken."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ColumnarWriter:
+    """
+    Encode export row batches as an Arrow IPC stream or a Parquet file.
+
+    ``write`` and ``close`` return the bytes that are ready, so output can be sent
+    or written as it is produced. Memory is bounded by one batch (Arrow) or one
+    row group (Parquet).
+    """
+
+    def __init__(self, format: str, row_group_rows: int | None = None) -> None:
+        schema = arrow_schema()
+        assert pa is not None and pq is not None
+        self._sink = _Sink()
+        sink = pa.PythonFile(self._sink, mode="w")
+        if format == "arrow":
+            self._writer = pa.ipc.new_stream(sink, schema)
+        elif format == "parquet":
+            self._writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        else:
+            raise ValueError(f"unsupported columnar format {format!r}")
+        self.format = format
+        self.row_group_rows = row_group_rows or PARQUET_ROW_GROUP_ROWS
+        self._pending: list[Any] = []
+        self._pending_rows = 0
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        batch = record_batch(rows)
+        if self.format == "arrow":
+            self._writer.write_batch(batch)
+        else:
+            self._pending.append(batch)
+            self._pending_rows += batch.num_rows
+            if self._pending_rows >= self.row_group_rows:
+                self._write_row_group()
+        return self._sink.take()
+
+    def close(self) -> bytes:
+        if self._pending:
+            self._write_row_group()
+        self._writer.close()
+        return self._sink.take()
+
+    def _write_row_group(self) -> None:
+        assert pa is not None
+        self._writer.write_table(pa.Table.from_batches(self._pending))
+        self._pending, self._pending_rows = [], 0
+
+
+def export_results(
+    path: Path, format: str, season_year: int | None = None, engine: Engine = default_engine
+) -> int:
+    """Write the results export to ``path`` as ``format``; returns the number of rows."""
+    writer = ColumnarWriter(format)
+    exported = 0
+    with engine.connect() as conn, path.open("wb") as out:
+        result = conn.execution_options(yield_per=EXPORT_BATCH_ROWS).execute(
+            results_export_query(season_year)
+        )
+        for batch in result.partitions():
+            out.write(writer.write(batch))
+            exported += len(batch)
+        out.write(writer.close())
+    return exported
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export session results as Arrow or Parquet.")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--season", type=int, help="one season (default: every season)")
+    parser.add_argument(
+        "--format", choices=COLUMNAR_FORMATS, help="default: parquet for *.parquet, else arrow"
+    )
+    args = parser.parse_args(argv)
+    fmt = args.format or ("parquet" if args.output.suffix == ".parquet" else "arrow")
+
+    started = time.perf_counter()
+    rows = export_results(args.output, fmt, args.season)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Exported {rows} results to {args.output} ({fmt}) in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
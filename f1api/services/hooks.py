@@ -0,0 +1,25 @@
+"""
+ORM write hooks that keep derived data in step with the writing transaction.
+
+``register_write_hooks`` attaches them to the ``Session`` class, so sessions from
+any sessionmaker get them. It is called by the app on startup and by the writer
+entry points (seed, ingest, Ergast import, synthetic data); calling it again is a
+no-op.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from f1api.services.data_versions import bump_versions_after_flush
+from f1api.services.standings import sync_standings_after_flush
+
+WRITE_HOOKS = (sync_standings_after_flush, bump_versions_after_flush)
+
+
+def register_write_hooks() -> None:
+    """Rebuild standings and bump data versions for whatever each ORM flush touched."""
+    for hook in WRITE_HOOKS:
+        if not event.contains(Session, "after_flush", hook):
+            event.listen(Session, "after_flush", hook)
@@ -0,0 +1,495 @@
+"""
+Bulk season loader.
+
+A season dataset (one JSON file, or a directory of CSV files) is resolved to ids
+in memory and written table by table, each with a single batched
+``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` inside one transaction.
+Natural keys make re-loads idempotent:
+
+- teams / drivers / circuits: ``ref``
+- entries: (season, team, driver)    - events: (season, round)
+- sessions: (event, type, order)     - results: (session, entry)
+
+A driver who changes teams mid-season has one entry per team; their results name
+the team they drove for. A re-load replaces the season: its entries, sessions and
+results that are missing from the new dataset are deleted. Reference records are
+shared between seasons, so a field a dataset leaves out (None) keeps the value
+already stored.
+
+Usage:
+    python -m f1api.services.ingest data/2024.json [data/2023/ ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, NotRequired, TypedDict
+
+from sqlalchemy import Connection, Engine, Integer, Row, all_, bindparam, delete, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from f1api.core.cache import invalidate_response_cache
+from f1api.core.db import engine as default_engine
+from f1api.models import (
+    Base,
+    Circuit,
+    Driver,
+    Entry,
+    Event,
+    Season,
+    SessionResult,
+    SessionType,
+    Team,
+)
+from f1api.models import Session as RaceSession
+from f1api.services.data_versions import STANDINGS_SCOPE, bump_data_versions
+from f1api.services.hooks import register_write_hooks
+from f1api.services.season_stats import refresh_season_stats
+from f1api.services.standings import rebuild_standings
+
+
+class TeamRecord(TypedDict):
+    ref: str
+    name: str
+
+
+class DriverRecord(TypedDict):
+    ref: str
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    code: NotRequired[str | None]
+    permanent_number: NotRequired[int | None]
+    nationality: NotRequired[str | None]
+    country_code: NotRequired[str | None]
+
+
+class CircuitRecord(TypedDict):
+    ref: str
+    name: str
+    country_code: NotRequired[str | None]
+    city: NotRequired[str | None]
+    latitude: NotRequired[float | None]
+    longitude: NotRequired[float | None]
+
+
+class EntryRecord(TypedDict):
+    driver: str  # driver ref
+    team: str  # team ref
+    car_number: NotRequired[int | None]
+
+
+class EventRecord(TypedDict):
+    round: int
+    circuit: str  # circuit ref
+    name: str
+
+
+class SessionRecord(TypedDict):
+    round: int
+    type: str  # SessionType value
+    session_order: int
+    name: str
+    started_at: NotRequired[datetime | None]
+
+
+class ResultRecord(TypedDict):
+    round: int
+    session_order: int  # identifies the session within the event
+    driver: str  # driver ref (must have an entry)
+    team: NotRequired[str]  # team ref; required when the driver has several entries
+    position: NotRequired[int | None]
+    points: NotRequired[float]
+    status: NotRequired[str | None]  # FINISHED, DNS, DNQ or a retirement reason
+    time_ms: NotRequired[int | None]
+    gap_ms: NotRequired[int | None]
+    laps: NotRequired[int | None]
+    grid: NotRequired[int | None]
+    classified: NotRequired[bool]
+
+
+class SeasonDataset(TypedDict):
+    year: int
+    teams: list[TeamRecord]
+    drivers: list[DriverRecord]
+    circuits: list[CircuitRecord]
+    entries: list[EntryRecord]
+    events: list[EventRecord]
+    sessions: list[SessionRecord]
+    results: list[ResultRecord]
+
+
+@dataclass
+class RefIds:
+    """Database ids of the reference tables, keyed by ref."""
+
+    teams: dict[str, int] = field(default_factory=dict)
+    drivers: dict[str, int] = field(default_factory=dict)
+    circuits: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class IngestReport:
+    rows: dict[str, int] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    def record(self, stage: str, rows: int, started: float) -> None:
+        self.rows[stage] = self.rows.get(stage, 0) + rows
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + time.perf_counter() - started
+
+    def merge(self, other: IngestReport) -> None:
+        for stage, rows in other.rows.items():
+            self.rows[stage] = self.rows.get(stage, 0) + rows
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + other.seconds[stage]
+
+    def lines(self) -> list[str]:
+        out = []
+        for stage, rows in self.rows.items():
+            secs = self.seconds[stage]
+            rate = rows / secs if secs > 0 else 0.0
+            out.append(f"   - {stage:<10} {rows:>9} rows  {secs:8.3f}s  {rate:>12,.0f} rows/s")
+        return out
+
+
+def upsert_rows(
+    conn: Connection,
+    model: type[Base],
+    rows: Sequence[Mapping[str, Any]],
+    keys: Sequence[str],
+    returning: Sequence[str],
+    keep_existing: bool = False,
+) -> Sequence[Row[Any]]:
+    """
+    Batched ``INSERT ... ON CONFLICT (keys) DO UPDATE`` returning ``returning``.
+
+    Rows must share the same columns; duplicates on ``keys`` are collapsed (last
+    wins) since one statement cannot update the same row twice. With
+    ``keep_existing`` a None does not overwrite a stored value.
+    """
+    if not rows:
+        return []
+    unique = list({tuple(r[k] for k in keys): r for r in rows}.values())
+    insert = pg_insert(model)
+    table = model.__table__
+    update = {
+        c: (
+            func.coalesce(insert.excluded[c], table.c[c])
+            if keep_existing and table.c[c].nullable
+            else insert.excluded[c]
+        )
+        for c in unique[0]
+        if c not in keys
+    }
+    if not update:  # key-only table: touch the key so RETURNING still yields the row
+        update = {keys[0]: insert.excluded[keys[0]]}
+    stmt = insert.on_conflict_do_update(index_elements=list(keys), set_=update).returning(
+        *(getattr(model, c) for c in returning)
+    )
+    return conn.execute(stmt, unique).all()
+
+
+def _entry_id(entries_by_driver: dict[int, dict[int, int]], refs: RefIds, r: ResultRecord) -> int:
+    """The entry a result belongs to: the driver's only one, or the one for ``r["team"]``."""
+    by_team = entries_by_driver[refs.drivers[r["driver"]]]
+    if "team" in r:
+        return by_team[refs.teams[r["team"]]]
+    if len(by_team) > 1:
+        raise ValueError(
+            f"Round {r['round']}: {r['driver']} has entries with several teams; "
+            "the result must name its team"
+        )
+    return next(iter(by_team.values()))
+
+
+def _ids(name: str, ids: Iterable[int]) -> Any:
+    """An integer array parameter, for ``!= ALL(...)`` over thousands of ids."""
+    return bindparam(name, list(ids), type_=ARRAY(Integer))
+
+
+def load_reference_data(
+    conn: Connection,
+    teams: Iterable[TeamRecord],
+    drivers: Iterable[DriverRecord],
+    circuits: Iterable[CircuitRecord],
+    report: IngestReport | None = None,
+) -> RefIds:
+    """Upsert teams, drivers and circuits; return their ids by ref."""
+    report = report if report is not None else IngestReport()
+    refs = RefIds()
+
+    started = time.perf_counter()
+    team_rows = [{"ref": t["ref"], "name": t["name"]} for t in teams]
+    inserted = upsert_rows(conn, Team, team_rows, ["ref"], ["ref", "id"], keep_existing=True)
+    refs.teams = {r.ref: r.id for r in inserted}
+    report.record("teams", len(team_rows), started)
+
+    started = time.perf_counter()
+    driver_rows = [
+        {
+            "ref": d["ref"],
+            "code": d.get("code"),
+            "permanent_number": d.get("permanent_number"),
+            "first_name": d["first_name"],
+            "last_name": d["last_name"],
+            "date_of_birth": d["date_of_birth"],
+            "nationality": d.get("nationality"),
+            "country_code": d.get("country_code"),
+        }
+        for d in drivers
+    ]
+    inserted = upsert_rows(conn, Driver, driver_rows, ["ref"], ["ref", "id"], keep_existing=True)
+    refs.drivers = {r.ref: r.id for r in inserted}
+    report.record("drivers", len(driver_rows), started)
+
+    started = time.perf_counter()
+    circuit_rows = [
+        {
+            "ref": c["ref"],
+            "name": c["name"],
+            "country_code": c.get("country_code"),
+            "city": c.get("city"),
+            "latitude": c.get("latitude"),
+            "longitude": c.get("longitude"),
+        }
+        for c in circuits
+    ]
+    inserted = upsert_rows(conn, Circuit, circuit_rows, ["ref"], ["ref", "id"], keep_existing=True)
+    refs.circuits = {r.ref: r.id for r in inserted}
+    report.record("circuits", len(circuit_rows), started)
+
+    bump_data_versions(conn, ["teams", "drivers", "circuits"])
+    return refs
+
+
+def load_season(conn: Connection, data: SeasonDataset, refs: RefIds | None = None) -> IngestReport:
+    """
+    Load one season inside the caller's transaction.
+
+    When ``refs`` is given the reference tables are assumed to be loaded already
+    (e.g. once for a multi-season import) and the dataset's copies are skipped.
+    """
+    report = IngestReport()
+    if refs is None:
+        refs = load_reference_data(conn, data["teams"], data["drivers"], data["circuits"], report)
+
+    started = time.perf_counter()
+    season_id = upsert_rows(conn, Season, [{"year": data["year"]}], ["year"], ["id"])[0].id
+    report.record("seasons", 1, started)
+
+    started = time.perf_counter()
+    entry_rows = [
+        {
+            "season_id": season_id,
+            "driver_id": refs.drivers[e["driver"]],
+            "team_id": refs.teams[e["team"]],
+            "car_number": e.get("car_number"),
+        }
+        for e in data["entries"]
+    ]
+    inserted = upsert_rows(
+        conn,
+        Entry,
+        entry_rows,
+        ["season_id", "team_id", "driver_id"],
+        ["driver_id", "team_id", "id"],
+    )
+    entries_by_driver: dict[int, dict[int, int]] = {}
+    for r in inserted:
+        entries_by_driver.setdefault(r.driver_id, {})[r.team_id] = r.id
+    # dropped entries take their results with them (ON DELETE CASCADE)
+    conn.execute(
+        delete(Entry).filter(
+            Entry.season_id == season_id,
+            Entry.id != all_(_ids("entry_ids", (r.id for r in inserted))),
+        )
+    )
+    report.record("entries", len(entry_rows), started)
+
+    started = time.perf_counter()
+    event_rows = [
+        {
+            "season_id": season_id,
+            "circuit_id": refs.circuits[e["circuit"]],
+            "round": e["round"],
+            "name": e["name"],
+        }
+        for e in data["events"]
+    ]
+    inserted = upsert_rows(conn, Event, event_rows, ["season_id", "round"], ["round", "id"])
+    event_by_round = {r.round: r.id for r in inserted}
+    report.record("events", len(event_rows), started)
+
+    started = time.perf_counter()
+    session_rows = [
+        {
+            "event_id": event_by_round[s["round"]],
+            "type": SessionType(s["type"]),
+            "session_order": s["session_order"],
+            "name": s["name"],
+            "started_at": s.get("started_at"),
+        }
+        for s in data["sessions"]
+    ]
+    round_by_event = {event_id: rnd for rnd, event_id in event_by_round.items()}
+    inserted = upsert_rows(
+        conn,
+        RaceSession,
+        session_rows,
+        ["event_id", "type", "session_order"],
+        ["event_id", "session_order", "id"],
+    )
+    session_by_key = {(round_by_event[r.event_id], r.session_order): r.id for r in inserted}
+    season_sessions = (
+        select(RaceSession.id).join(RaceSession.event).filter(Event.season_id == season_id)
+    )
+    # dropped sessions take their results with them (ON DELETE CASCADE)
+    conn.execute(
+        delete(RaceSession).filter(
+            RaceSession.id.in_(season_sessions),
+            RaceSession.id != all_(_ids("session_ids", session_by_key.values())),
+        )
+    )
+    report.record("sessions", len(session_rows), started)
+
+    started = time.perf_counter()
+    result_rows = [
+        {
+            "session_id": session_by_key[(r["round"], r["session_order"])],
+            "entry_id": _entry_id(entries_by_driver, refs, r),
+            "position": r.get("position"),
+            "points": r.get("points", 0.0),
+            "status": r.get("status"),
+            "time_ms": r.get("time_ms"),
+            "gap_ms": r.get("gap_ms"),
+            "laps": r.get("laps"),
+            "grid": r.get("grid"),
+            "classified": r.get("classified", True),
+        }
+        for r in data["results"]
+    ]
+    inserted = upsert_rows(conn, SessionResult, result_rows, ["session_id", "entry_id"], ["id"])
+    conn.execute(
+        delete(SessionResult).filter(
+            SessionResult.session_id.in_(season_sessions),
+            SessionResult.id != all_(_ids("result_ids", (r.id for r in inserted))),
+        )
+    )
+    report.record("results", len(result_rows), started)
+
+    started = time.perf_counter()
+    rebuild_standings(conn, season_id)
+    bump_data_versions(
+        conn, ["seasons", "entries", "events", "sessions", "session_results", STANDINGS_SCOPE]
+    )
+    report.record("standings", 0, started)
+    return report
+
+
+def ingest_season(
+    data: SeasonDataset, engine: Engine = default_engine, refresh_stats: bool = True
+) -> IngestReport:
+    """Load a season in its own transaction, refresh the stats views, drop cached responses."""
+    with engine.begin() as conn:
+        report = load_season(conn, data)
+    if refresh_stats:
+        started = time.perf_counter()
+        report.record("stats", refresh_season_stats(engine), started)
+    invalidate_response_cache()
+    return report
+
+
+# --- Dataset files ------------------------------------------------------------
+
+TABLES = ("teams", "drivers", "circuits", "entries", "events", "sessions", "results")
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "t", "yes", "y"}
+
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "date_of_birth": date.fromisoformat,
+    "started_at": datetime.fromisoformat,
+    "permanent_number": int,
+    "car_number": int,
+    "round": int,
+    "session_order": int,
+    "position": int,
+    "points": float,
+    "time_ms": int,
+    "gap_ms": int,
+    "laps": int,
+    "grid": int,
+    "latitude": float,
+    "longitude": float,
+    "classified": _parse_bool,
+}
+
+
+def _coerce(record: dict[str, Any]) -> dict[str, Any]:
+    """Convert string fields to their column types; empty strings become missing."""
+    out: dict[str, Any] = {}
+    for key, value in record.items():
+        if value == "" or value is None:
+            continue
+        if isinstance(value, str) and key in _CONVERTERS:
+            value = _CONVERTERS[key](value)
+        out[key] = value
+    return out
+
+
+def read_dataset(path: Path) -> SeasonDataset:
+    """
+    Read a season from ``<season>.json`` (an object with ``year`` and one list per
+    table) or from a directory holding ``season.csv`` (column ``year``) plus one
+    ``<table>.csv`` per table with the record fields as headers.
+    """
+    raw: dict[str, Any]
+    if path.is_dir():
+        with (path / "season.csv").open(newline="", encoding="utf-8") as fh:
+            raw = {"year": int(next(csv.DictReader(fh))["year"])}
+        for table in TABLES:
+            table_path = path / f"{table}.csv"
+            if not table_path.exists():
+                raw[table] = []
+                continue
+            with table_path.open(newline="", encoding="utf-8") as fh:
+                raw[table] = list(csv.DictReader(fh))
+    else:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+
+    dataset: dict[str, Any] = {"year": int(raw["year"])}
+    for table in TABLES:
+        dataset[table] = [_coerce(dict(rec)) for rec in raw.get(table, [])]
+    return SeasonDataset(**dataset)  # type: ignore[typeddict-item]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load season datasets (JSON or CSV dir).")
+    parser.add_argument("paths", nargs="+", type=Path)
+    args = parser.parse_args(argv)
+    register_write_hooks()
+
+    for path in args.paths:
+        data = read_dataset(path)
+        started = time.perf_counter()
+        report = ingest_season(data, refresh_stats=False)
+        print(f"✅ Loaded season {data['year']} in {time.perf_counter() - started:.2f}s")
+        print("\n".join(report.lines()))
+
+    # once for all seasons: the refresh recomputes the whole views
+    started = time.perf_counter()
+    rows = refresh_season_stats()
+    print(f"✅ Refreshed season stats ({rows} rows) in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
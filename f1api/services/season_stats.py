@@ -0,0 +1,31 @@
+"""
+Refresh of the per-season stats materialized views.
+
+``season_driver_stats`` and ``season_team_stats`` aggregate RACE results per
+season, so the stats endpoints never scan ``session_results``. The views are not
+kept in sync on every write: bulk writers call ``refresh_season_stats`` once their
+load has committed. The refresh is ``CONCURRENTLY`` (readers keep the old rows
+until it commits) and bumps the ``season_stats`` data version.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Engine, func, select, text
+
+from f1api.core.db import engine as default_engine
+from f1api.models import SeasonDriverStats, SeasonTeamStats
+from f1api.services.data_versions import SEASON_STATS_SCOPE, bump_data_versions
+
+VIEWS = ("season_driver_stats", "season_team_stats")
+
+
+def refresh_season_stats(engine: Engine = default_engine) -> int:
+    """Recompute the stats views from the committed results; returns their row count."""
+    with engine.begin() as conn:
+        for view in VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+        bump_data_versions(conn, [SEASON_STATS_SCOPE])
+        return sum(
+            conn.scalar(select(func.count()).select_from(model)) or 0
+            for model in (SeasonDriverStats, SeasonTeamStats)
+        )
@@ -1,26 +1,10 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any, TypedDict, TypeVar
+from typing import TypedDict
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-
-from f1api.core.db import SessionLocal
-from f1api.models import (
-    Base,
-    Circuit,
-    Driver,
-    Entry,
-    Event,
-    Season,
-    SessionResult,
-    SessionType,
-    Team,
-)
-from f1api.models import Session as RaceSession
-
-T = TypeVar("T", bound=Base)
+from f1api.services.hooks import register_write_hooks
+from f1api.services.ingest import SeasonDataset, ingest_season
 
 
 class TeamData(TypedDict):
@@ -48,10 +32,6 @@ class CircuitData(TypedDict):
     city: str
 
 
-class RaceResultTuple(TypedDict):
-    pass  # We'll use tuples for race results
-
-
 class RaceData(TypedDict):
     round: int
     circuit: str
@@ -60,22 +40,6 @@ class RaceData(TypedDict):
     results: list[tuple[str, int | None, float, str, int, int]]
 
 
-def get_or_create(
-    session: Session, model: type[T], defaults: dict[str, Any] | None = None, **kwargs: Any
-) -> tuple[T, bool]:
-    """Get existing object or create new one."""
-    stmt = select(model).filter_by(**kwargs)
-    obj = session.execute(stmt).scalar_one_or_none()
-    if obj:
-        return obj, False
-    params = {**kwargs, **(defaults or {})}
-    obj = model(**params)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj, True
-
-
 def seed_comprehensive_2024() -> None:  # noqa: PLR0914
     """
     Comprehensive 2024 season seed with:
@@ -84,11 +48,8 @@ def seed_comprehensive_2024() -> None:  # noqa: PLR0914
     - 6 races (Bahrain, Saudi Arabia, Australia, Japan, China, Miami)
     - Realistic race results and standings
     """
-    db = SessionLocal()
+    register_write_hooks()
     try:
-        # Season
-        season, _ = get_or_create(db, Season, year=2024)
-
         # === TEAMS ===
         teams_data: list[TeamData] = [
             {"ref": "red_bull_racing", "name": "Red Bull Racing"},
@@ -102,11 +63,6 @@ def seed_comprehensive_2024() -> None:  # noqa: PLR0914
             {"ref": "kick_sauber", "name": "Kick Sauber"},
             {"ref": "haas", "name": "Haas F1 Team"},
         ]
-        teams: dict[str, Team] = {}
-        for t_data in teams_data:
-            team, _ = get_or_create(db, Team, ref=t_data["ref"], defaults={"name": t_data["name"]})
-            teams[t_data["ref"]] = team
-
         # === DRIVERS ===
         drivers_data: list[DriverData] = [
             # Red Bull Racing
@@ -361,36 +317,6 @@ def seed_comprehensive_2024() -> None:  # noqa: PLR0914
             },
         ]
 
-        drivers: dict[str, Driver] = {}
-        entries: dict[str, Entry] = {}
-        for d_data in drivers_data:
-            driver, _ = get_or_create(
-                db,
-                Driver,
-                ref=d_data["ref"],
-                defaults={
-                    "code": d_data["code"],
-                    "permanent_number": d_data["number"],
-                    "first_name": d_data["first"],
-                    "last_name": d_data["last"],
-                    "date_of_birth": d_data["dob"],
-                    "nationality": d_data["nat"],
-                    "country_code": d_data["cc"],
-                },
-            )
-            drivers[d_data["ref"]] = driver
-
-            # Create entry (lineup)
-            entry, _ = get_or_create(
-                db,
-                Entry,
-                season_id=season.id,
-                driver_id=driver.id,
-                team_id=teams[d_data["team"]].id,
-                defaults={"car_number": d_data["car"]},
-            )
-            entries[d_data["ref"]] = entry
-
         # === CIRCUITS ===
         circuits_data: list[CircuitData] = [
             {
@@ -416,20 +342,6 @@ def seed_comprehensive_2024() -> None:  # noqa: PLR0914
             {"ref": "miami", "name": "Miami International Autodrome", "cc": "USA", "city": "Miami"},
         ]
 
-        circuits: dict[str, Circuit] = {}
-        for c_data in circuits_data:
-            circuit, _ = get_or_create(
-                db,
-                Circuit,
-                ref=c_data["ref"],
-                defaults={
-                    "name": c_data["name"],
-                    "country_code": c_data["cc"],
-                    "city": c_data["city"],
-                },
-            )
-            circuits[c_data["ref"]] = circuit
-
         # === EVENTS & RACE RESULTS ===
         # Realistic 2024 season results (simplified)
         races_data: list[RaceData] = [
@@ -544,61 +456,68 @@ def seed_comprehensive_2024() -> None:  # noqa: PLR0914
             },
         ]
 
-        for race_data in races_data:
-            # Create event
-            event, _ = get_or_create(
-                db,
-                Event,
-                season_id=season.id,
-                circuit_id=circuits[race_data["circuit"]].id,
-                round=race_data["round"],
-                defaults={"name": race_data["name"]},
-            )
-
-            # Create sessions (FP, Q, Race)
-            _fp_session, _ = get_or_create(
-                db,
-                RaceSession,
-                event_id=event.id,
-                type=SessionType.FP,
-                session_order=1,
-                defaults={"name": "Practice", "started_at": race_data["date"]},
-            )
-            _q_session, _ = get_or_create(
-                db,
-                RaceSession,
-                event_id=event.id,
-                type=SessionType.QUALIFYING,
-                session_order=2,
-                defaults={"name": "Qualifying", "started_at": race_data["date"]},
-            )
-            race_session, _ = get_or_create(
-                db,
-                RaceSession,
-                event_id=event.id,
-                type=SessionType.RACE,
-                session_order=3,
-                defaults={"name": "Race", "started_at": race_data["date"]},
-            )
-
-            # Create race results
-            for driver_ref, position, points, status, laps, grid in race_data["results"]:
-                get_or_create(
-                    db,
-                    SessionResult,
-                    session_id=race_session.id,
-                    entry_id=entries[driver_ref].id,
-                    defaults={
-                        "position": position,
-                        "points": points,
-                        "status": status,
-                        "laps": laps,
-                        "grid": grid,
-                        "classified": status == "FINISHED",
-                    },
+        dataset = SeasonDataset(
+            year=2024,
+            teams=[{"ref": t["ref"], "name": t["name"]} for t in teams_data],
+            drivers=[
+                {
+                    "ref": d["ref"],
+                    "code": d["code"],
+                    "permanent_number": d["number"],
+                    "first_name": d["first"],
+                    "last_name": d["last"],
+                    "date_of_birth": d["dob"],
+                    "nationality": d["nat"],
+                    "country_code": d["cc"],
+                }
+                for d in drivers_data
+            ],
+            circuits=[
+                {"ref": c["ref"], "name": c["name"], "country_code": c["cc"], "city": c["city"]}
+                for c in circuits_data
+            ],
+            entries=[
+                {"driver": d["ref"], "team": d["team"], "car_number": d["car"]}
+                for d in drivers_data
+            ],
+            events=[
+                {"round": r["round"], "circuit": r["circuit"], "name": r["name"]}
+                for r in races_data
+            ],
+            # Sessions per event: FP, Q, Race
+            sessions=[
+                {
+                    "round": r["round"],
+                    "type": session_type,
+                    "session_order": order,
+                    "name": name,
+                    "started_at": r["date"],
+                }
+                for r in races_data
+                for order, (session_type, name) in enumerate(
+                    (("FP", "Practice"), ("QUALIFYING", "Qualifying"), ("RACE", "Race")), start=1
                 )
-
-        db.commit()
+            ],
+            results=[
+                {
+                    "round": r["round"],
+                    "session_order": 3,
+                    "driver": driver_ref,
+                    "position": position,
+                    "points": points,
+                    "status": status,
+                    "laps": laps,
+                    "grid": grid,
+                    "classified": status == "FINISHED",
+                }
+                for r in races_data
+                for driver_ref, position, points, status, laps, grid in r["results"]
+            ],
+        )
+
+        # Same path as any ingest: one transaction (bulk upserts plus the standings
+        # rebuild), then the stats views refresh and the response cache is dropped
+        ingest_season(dataset)
         print("✅ Comprehensive 2024 season data seeded successfully!")
         print("   - 10 teams")
         print("   - 20 drivers")
@@ -607,10 +526,7 @@ def seed_comprehensive_2024() -> None:  # noqa: PLR0914
 
     except Exception as e:
         print(f"❌ Seed failed: {e}")
-        db.rollback()
         raise
-    finally:
-        db.close()
 
 
 # Legacy alias for backward compatibility
@@ -0,0 +1,283 @@
+"""
+Maintenance of the persisted driver/constructor standings tables.
+
+Standings are rebuilt for a season whenever the RACE results feeding it change,
+so the API only ever reads pre-ranked rows. A changed result can move every other
+row of the season (positions, countback ties), so the affected season's rows are
+recomputed as a whole - one INSERT ... SELECT per table - rather than patched.
+Positions follow the F1 countback (see ``COUNTBACK_BASE``). The per-round
+progression is not persisted: it is computed in one query with running window
+sums. ORM writes are picked up by ``sync_standings_after_flush`` (registered by
+``f1api.services.hooks``); Core/bulk writers call
+``rebuild_standings`` themselves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Integer,
+    Numeric,
+    Select,
+    and_,
+    cast,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.orm import InstrumentedAttribute, Session, UOWTransaction
+
+from f1api.models import (
+    ConstructorStanding,
+    DriverStanding,
+    Entry,
+    Event,
+    SessionResult,
+    SessionType,
+)
+from f1api.models import Session as RaceSession
+
+# F1 countback: points, then most wins, then most 2nd places, and so on. The count
+# of finishes in each position is packed into one exact numeric, one base-256 digit
+# per position (most significant = P1), so comparing the vectors is comparing
+# numbers and running totals are plain sums. A season has < 256 races.
+COUNTBACK_BASE = 256
+COUNTBACK_DEPTH = 64  # positions counted; no grid has been larger
+
+
+def _countback() -> ColumnElement[Any]:
+    """Sum of this group's RACE finishes as a packed per-position count vector."""
+    digit = func.power(cast(COUNTBACK_BASE, Numeric), COUNTBACK_DEPTH - SessionResult.position)
+    return func.coalesce(
+        func.sum(digit).filter(SessionResult.position.between(1, COUNTBACK_DEPTH)), 0
+    )
+
+
+def _rank(points: Any, countback: Any, **window: Any) -> Any:
+    """Championship position; competitors equal on points and full countback share it."""
+    return func.rank().over(order_by=(points.desc(), countback.desc()), **window)
+
+
+def _latest_team(team_id: Any = Entry.team_id, *order_by: Any) -> ColumnElement[int]:
+    """
+    Team of the group's latest race (by default ``Event.round``): a driver who changes
+    teams mid-season has an entry per team, and is listed with their current one.
+    """
+    order_by = order_by or (Event.round.desc(), Entry.id.desc())
+    teams = func.array_agg(aggregate_order_by(team_id, *order_by), type_=ARRAY(Integer))
+    return teams[1]
+
+
+def driver_standings_query(season_id: int) -> Select[Any]:
+    """Aggregate RACE results of a season into ranked driver standing rows."""
+    points = func.sum(SessionResult.points)
+    return (
+        select(
+            Entry.season_id,
+            Entry.driver_id,
+            _latest_team().label("team_id"),
+            _rank(points, _countback()).label("position"),
+            points.label("points"),
+            func.count().filter(SessionResult.position == 1).label("wins"),
+        )
+        .select_from(SessionResult)
+        .join(SessionResult.entry)
+        .join(SessionResult.session)
+        .join(RaceSession.event)
+        .filter(Entry.season_id == season_id)
+        .filter(RaceSession.type == SessionType.RACE)
+        .group_by(Entry.season_id, Entry.driver_id)
+    )
+
+
+def constructor_standings_query(season_id: int) -> Select[Any]:
+    """Aggregate RACE results of a season into ranked constructor standing rows."""
+    points = func.sum(SessionResult.points)
+    return (
+        select(
+            Entry.season_id,
+            Entry.team_id,
+            _rank(points, _countback()).label("position"),
+            points.label("points"),
+            func.count().filter(SessionResult.position == 1).label("wins"),
+        )
+        .select_from(SessionResult)
+        .join(SessionResult.entry)
+        .join(SessionResult.session)
+        .filter(Entry.season_id == season_id)
+        .filter(RaceSession.type == SessionType.RACE)
+        .group_by(Entry.season_id, Entry.team_id)
+    )
+
+
+def _points_by_round(
+    season_id: int, through_round: int | None, *keys: InstrumentedAttribute[int]
+) -> Select[Any]:
+    """RACE points, wins and countback per round of a season for each ``keys`` group."""
+    stmt = (
+        select(
+            Event.round,
+            *keys,
+            func.sum(SessionResult.points).label("points"),
+            func.count().filter(SessionResult.position == 1).label("wins"),
+            _countback().label("countback"),
+        )
+        .select_from(SessionResult)
+        .join(SessionResult.entry)
+        .join(SessionResult.session)
+        .join(RaceSession.event)
+        .filter(Entry.season_id == season_id)
+        .filter(RaceSession.type == SessionType.RACE)
+        .group_by(Event.round, *keys)
+    )
+    if through_round is not None:
+        stmt = stmt.filter(Event.round <= through_round)
+    return stmt
+
+
+def _running_totals(scored: Any, keys: tuple[str, ...]) -> Any:
+    """One row per round and group, with points/wins/countback summed over all rounds so far."""
+    rounds = select(scored.c.round).distinct().cte(f"{scored.name}_rounds")
+    groups = select(*(scored.c[k] for k in keys)).distinct().cte(f"{scored.name}_groups")
+    # every group gets a row for every round, so totals carry over rounds it missed
+    partition = [groups.c[k] for k in keys]
+
+    def running(column: Any, default: Any) -> Any:
+        return func.sum(func.coalesce(column, default)).over(
+            partition_by=partition, order_by=rounds.c.round
+        )
+
+    return (
+        select(
+            rounds.c.round,
+            *(groups.c[k] for k in keys),
+            running(scored.c.points, 0.0).label("points"),
+            cast(running(scored.c.wins, 0), Integer).label("wins"),
+            running(scored.c.countback, 0).label("countback"),
+        )
+        .select_from(rounds)
+        .join(groups, true())
+        .outerjoin(
+            scored,
+            and_(scored.c.round == rounds.c.round, *(scored.c[k] == groups.c[k] for k in keys)),
+        )
+        .subquery(f"{scored.name}_running")
+    )
+
+
+def driver_progression_query(season_id: int, through_round: int | None = None) -> Select[Any]:
+    """Cumulative points, wins and position of every driver after each round, in one pass."""
+    scored = (
+        _points_by_round(season_id, through_round, Entry.driver_id)
+        .add_columns(_latest_team().label("team_id"))
+        .cte("driver_scored")
+    )
+    running = _running_totals(scored, ("driver_id",))
+    # every round lists a driver with the team of their latest race in the window
+    teams = (
+        select(
+            scored.c.driver_id,
+            _latest_team(scored.c.team_id, scored.c.round.desc()).label("team_id"),
+        )
+        .group_by(scored.c.driver_id)
+        .subquery("driver_teams")
+    )
+    return (
+        select(
+            running.c.round,
+            running.c.driver_id,
+            teams.c.team_id,
+            _rank(running.c.points, running.c.countback, partition_by=running.c.round).label(
+                "position"
+            ),
+            running.c.points,
+            running.c.wins,
+        )
+        .select_from(running)
+        .join(teams, teams.c.driver_id == running.c.driver_id)
+    )
+
+
+def constructor_progression_query(season_id: int, through_round: int | None = None) -> Select[Any]:
+    """Cumulative points, wins and position of every constructor after each round, in one pass."""
+    scored = _points_by_round(season_id, through_round, Entry.team_id)
+    running = _running_totals(scored.cte("constructor_scored"), ("team_id",))
+    return select(
+        running.c.round,
+        running.c.team_id,
+        _rank(running.c.points, running.c.countback, partition_by=running.c.round).label(
+            "position"
+        ),
+        running.c.points,
+        running.c.wins,
+    )
+
+
+def rebuild_standings(conn: Connection | Session, season_id: int) -> None:
+    """Replace the persisted standings of one season inside the caller's transaction."""
+    conn.execute(delete(DriverStanding).where(DriverStanding.season_id == season_id))
+    conn.execute(
+        insert(DriverStanding).from_select(
+            ["season_id", "driver_id", "team_id", "position", "points", "wins"],
+            driver_standings_query(season_id),
+        )
+    )
+    conn.execute(delete(ConstructorStanding).where(ConstructorStanding.season_id == season_id))
+    conn.execute(
+        insert(ConstructorStanding).from_select(
+            ["season_id", "team_id", "position", "points", "wins"],
+            constructor_standings_query(season_id),
+        )
+    )
+
+
+def _attr_values(obj: object, key: str) -> Iterable[Any]:
+    """Current and pre-flush values of a column attribute."""
+    history = inspect(obj, raiseerr=True).attrs[key].history
+    return (v for v in (*history.added, *history.unchanged, *history.deleted) if v is not None)
+
+
+def affected_season_ids(session: Session) -> set[int]:
+    """Seasons whose standings are touched by the pending changes of ``session``."""
+    season_ids: set[int] = set()
+    entry_ids: set[int] = set()
+    session_ids: set[int] = set()
+
+    dirty = (obj for obj in session.dirty if session.is_modified(obj))
+    for obj in (*session.new, *dirty, *session.deleted):
+        if isinstance(obj, SessionResult):
+            entry_ids.update(_attr_values(obj, "entry_id"))
+        elif isinstance(obj, Entry):
+            season_ids.update(_attr_values(obj, "season_id"))
+        elif isinstance(obj, RaceSession):
+            session_ids.update(_attr_values(obj, "id"))
+
+    conn = session.connection()
+    if entry_ids:
+        season_ids.update(
+            conn.scalars(select(Entry.season_id).where(Entry.id.in_(entry_ids)).distinct())
+        )
+    if session_ids:
+        season_ids.update(
+            conn.scalars(
+                select(Event.season_id)
+                .join(RaceSession, RaceSession.event_id == Event.id)
+                .where(RaceSession.id.in_(session_ids))
+                .distinct()
+            )
+        )
+    return season_ids
+
+
+def sync_standings_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """``after_flush`` hook: rebuild the standings of the seasons the flush touched."""
+    for season_id in sorted(affected_season_ids(session)):
+        rebuild_standings(session.connection(), season_id)
@@ -0,0 +1,202 @@
+"""
+Deterministic synthetic dataset at configurable scale, for benchmarks.
+
+Every season gets ``grid`` drivers drawn from a shared pool, two per team, and
+``races`` events with ``sessions`` sessions each (practice..., qualifying,
+race), all with full result sheets. Refs are prefixed ``syn_`` and seasons start
+at ``start_year`` (1900 by default) so a synthetic load never overlaps real
+data; still, prefer a scratch database. Loading goes through the bulk loader.
+
+Usage:
+    python -m f1api.services.synthetic [--seasons 75 --drivers 1000 --races 25 --sessions 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Engine
+
+from f1api.core.cache import invalidate_response_cache
+from f1api.core.db import engine as default_engine
+from f1api.services.hooks import register_write_hooks
+from f1api.services.ingest import (
+    CircuitRecord,
+    DriverRecord,
+    EntryRecord,
+    IngestReport,
+    ResultRecord,
+    SeasonDataset,
+    SessionRecord,
+    TeamRecord,
+    load_reference_data,
+    load_season,
+)
+from f1api.services.season_stats import refresh_season_stats
+
+POINTS = (25.0, 18.0, 15.0, 12.0, 10.0, 8.0, 6.0, 4.0, 2.0, 1.0)
+
+
+@dataclass(frozen=True)
+class Scale:
+    seasons: int = 75
+    drivers: int = 1000
+    races: int = 25
+    sessions: int = 3
+    teams: int = 40
+    grid: int = 20
+    start_year: int = 1900
+    seed: int = 0
+
+
+def reference_data(
+    scale: Scale,
+) -> tuple[list[TeamRecord], list[DriverRecord], list[CircuitRecord]]:
+    rng = random.Random(f"{scale.seed}:reference")
+    teams: list[TeamRecord] = [
+        {"ref": f"syn_team_{i:03d}", "name": f"Synthetic Team {i:03d}"} for i in range(scale.teams)
+    ]
+    drivers: list[DriverRecord] = [
+        {
+            "ref": f"syn_driver_{i:05d}",
+            "code": f"S{i % 100:02d}",
+            "first_name": f"Driver{i:05d}",
+            "last_name": f"Synthetic{rng.randrange(10_000):04d}",
+            "date_of_birth": date(1870, 1, 1) + timedelta(days=rng.randrange(365 * 120)),
+        }
+        for i in range(scale.drivers)
+    ]
+    circuits: list[CircuitRecord] = [
+        {"ref": f"syn_circuit_{i:03d}", "name": f"Synthetic Circuit {i:03d}"}
+        for i in range(scale.races)
+    ]
+    return teams, drivers, circuits
+
+
+def _session_types(count: int) -> list[tuple[str, str]]:
+    if count <= 1:
+        return [("RACE", "Race")]
+    practice = [("FP", f"Practice {i}") for i in range(1, count - 1)]
+    return [*practice, ("QUALIFYING", "Qualifying"), ("RACE", "Race")]
+
+
+def season_dataset(scale: Scale, year: int) -> SeasonDataset:
+    """One season of entries, events, sessions and results (reference lists left empty)."""
+    rng = random.Random(f"{scale.seed}:{year}")
+    driver_refs = [
+        f"syn_driver_{i:05d}"
+        for i in rng.sample(range(scale.drivers), min(scale.grid, scale.drivers))
+    ]
+    team_refs = [f"syn_team_{i:03d}" for i in rng.sample(range(scale.teams), scale.teams)]
+    entries: list[EntryRecord] = [
+        {"driver": ref, "team": team_refs[n // 2 % len(team_refs)], "car_number": n + 1}
+        for n, ref in enumerate(driver_refs)
+    ]
+
+    sessions: list[SessionRecord] = []
+    results: list[ResultRecord] = []
+    for rnd in range(1, scale.races + 1):
+        started = datetime(year, 3, 1, 14) + timedelta(days=14 * (rnd - 1))
+        grid: list[str] = []
+        for order, (session_type, name) in enumerate(_session_types(scale.sessions), start=1):
+            sessions.append(
+                {
+                    "round": rnd,
+                    "type": session_type,
+                    "session_order": order,
+                    "name": name,
+                    "started_at": started,
+                }
+            )
+            finishers = rng.sample(driver_refs, len(driver_refs))
+            if session_type != "RACE":
+                results.extend(
+                    {"round": rnd, "session_order": order, "driver": ref, "position": pos}
+                    for pos, ref in enumerate(finishers, start=1)
+                )
+                grid = finishers
+                continue
+
+            laps = 50 + rnd % 20
+            winner_ms = 5_400_000 + rng.randrange(600_000)
+            retired = set(rng.sample(finishers, min(3, len(finishers))))
+            classified = [ref for ref in finishers if ref not in retired]
+            for pos, ref in enumerate(classified, start=1):
+                gap = 0 if pos == 1 else (pos - 1) * 1_500 + rng.randrange(1_000)
+                results.append(
+                    {
+                        "round": rnd,
+                        "session_order": order,
+                        "driver": ref,
+                        "position": pos,
+                        "points": POINTS[pos - 1] if pos <= len(POINTS) else 0.0,
+                        "status": "FINISHED",
+                        "time_ms": winner_ms + gap,
+                        "gap_ms": gap,
+                        "laps": laps,
+                        "grid": grid.index(ref) + 1 if ref in grid else None,
+                    }
+                )
+            results.extend(
+                {
+                    "round": rnd,
+                    "session_order": order,
+                    "driver": ref,
+                    "status": "DNF",
+                    "laps": rng.randrange(laps),
+                    "grid": grid.index(ref) + 1 if ref in grid else None,
+                    "classified": False,
+                }
+                for ref in retired
+            )
+
+    return SeasonDataset(
+        year=year,
+        teams=[],
+        drivers=[],
+        circuits=[],
+        entries=entries,
+        events=[
+            {"round": rnd, "circuit": f"syn_circuit_{rnd - 1:03d}", "name": f"Synthetic GP {rnd}"}
+            for rnd in range(1, scale.races + 1)
+        ],
+        sessions=sessions,
+        results=results,
+    )
+
+
+def load_synthetic(scale: Scale, engine: Engine = default_engine) -> IngestReport:
+    """Load every synthetic season (one transaction each) and drop cached API responses."""
+    report = IngestReport()
+    teams, drivers, circuits = reference_data(scale)
+    with engine.begin() as conn:
+        refs = load_reference_data(conn, teams, drivers, circuits, report)
+    for year in range(scale.start_year, scale.start_year + scale.seasons):
+        with engine.begin() as conn:
+            report.merge(load_season(conn, season_dataset(scale, year), refs))
+    started = time.perf_counter()
+    report.record("stats", refresh_season_stats(engine), started)
+    invalidate_response_cache()
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load a synthetic multi-season dataset.")
+    for f in fields(Scale):
+        parser.add_argument(f"--{f.name.replace('_', '-')}", type=int, default=f.default)
+    scale = Scale(**vars(parser.parse_args(argv)))
+    register_write_hooks()
+
+    started = time.perf_counter()
+    report = load_synthetic(scale)
+    print(f"✅ Loaded {scale.seasons} synthetic seasons in {time.perf_counter() - started:.2f}s")
+    print("\n".join(report.lines()))
+
+
+if __name__ == "__main__":
+    main()
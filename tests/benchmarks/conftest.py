@@ -0,0 +1,116 @@
+"""
+Fixtures for the HTTP benchmark suite (opt-in: ``F1API_BENCH=1`` / ``make bench``).
+
+Benchmarks load the synthetic dataset into the database named by ``DATABASE_URL``
+on first run, so point it at a scratch database, never the one the regular test
+suite uses. Scale is read from ``F1API_BENCH_<FIELD>`` (e.g. ``F1API_BENCH_SEASONS``).
+"""
+
+import os
+from collections.abc import Generator
+from dataclasses import dataclass, fields
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+
+from f1api.core.cache import response_cache
+from f1api.core.db import SessionLocal
+from f1api.core.versions import data_versions
+from f1api.models import Driver, Event, Season
+from f1api.models import Session as RaceSession
+from f1api.services.synthetic import Scale, load_synthetic
+
+RESULTS_KEY = pytest.StashKey[dict[str, dict[str, float]]]()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if os.getenv("F1API_BENCH"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks are opt-in: set F1API_BENCH=1 (make bench)")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    results = config.stash.get(RESULTS_KEY, {})
+    if not results:
+        return
+    terminalreporter.section("API benchmarks")
+    terminalreporter.write_line(
+        f"{'scenario':<24}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'queries':>9}"
+    )
+    for name, r in results.items():
+        terminalreporter.write_line(
+            f"{name:<24}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+            f"{r['requests_per_second']:>9.0f}{r['queries_per_request']:>9.2f}"
+        )
+
+
+def bench_scale() -> Scale:
+    overrides = {
+        f.name: int(os.environ[f"F1API_BENCH_{f.name.upper()}"])
+        for f in fields(Scale)
+        if f"F1API_BENCH_{f.name.upper()}" in os.environ
+    }
+    return Scale(**overrides)
+
+
+@dataclass(frozen=True)
+class BenchData:
+    scale: Scale
+    years: list[int]
+    season_ids: list[int]
+    driver_ids: list[int]
+    event_ids: list[int]
+    race_session_ids: list[int]
+
+
+@pytest.fixture(scope="session")
+def bench_data() -> BenchData:
+    """Synthetic dataset (loaded if missing) plus a spread of ids to request."""
+    scale = bench_scale()
+    first, last = scale.start_year, scale.start_year + scale.seasons - 1
+    with SessionLocal() as db:
+        foreign = db.scalar(select(func.count()).filter(~Season.year.between(first, last)))
+        if foreign:
+            pytest.fail(
+                "benchmark database holds non-synthetic seasons; "
+                "point DATABASE_URL at a scratch database"
+            )
+        if (
+            db.scalar(select(func.count()).filter(Season.year.between(first, last)))
+            != scale.seasons
+        ):
+            load_synthetic(scale)
+
+        years = [first + (i * scale.seasons) // 8 for i in range(8)]
+        season_ids = list(db.scalars(select(Season.id).filter(Season.year.in_(years))))
+        driver_ids = list(db.scalars(select(Driver.id).order_by(Driver.id).limit(50)))
+        event_ids = list(
+            db.scalars(select(Event.id).filter(Event.season_id.in_(season_ids)).limit(50))
+        )
+        race_session_ids = list(
+            db.scalars(
+                select(RaceSession.id)
+                .filter(RaceSession.event_id.in_(event_ids), RaceSession.type == "RACE")
+                .limit(50)
+            )
+        )
+    return BenchData(scale, years, season_ids, driver_ids, event_ids, race_session_ids)
+
+
+@pytest.fixture(scope="session")
+def bench_results(request: pytest.FixtureRequest) -> dict[str, dict[str, float]]:
+    return request.config.stash.setdefault(RESULTS_KEY, {})
+
+
+@pytest.fixture()
+def response_cache_disabled(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Measure the handlers and the database, not the in-process response cache."""
+    monkeypatch.setattr(response_cache, "route_ttls", {})
+    monkeypatch.setattr(response_cache, "default_ttl", 0.0)
+    # the data-version snapshot refresh is per process and time, not per request
+    monkeypatch.setattr(data_versions, "refresh_interval", 3600.0)
+    yield
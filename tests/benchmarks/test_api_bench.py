@@ -0,0 +1,130 @@
+"""
+Latency / throughput / DB-queries-per-request benchmarks for every API router.
+
+Each scenario issues ``F1API_BENCH_REQUESTS`` requests through ASGI at
+``F1API_BENCH_CONCURRENCY`` and compares p95 latency and queries per request with
+``baseline.json``. Run with ``F1API_BENCH_UPDATE=1`` to record a new baseline.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from collections.abc import Callable, Generator
+from itertools import cycle
+from pathlib import Path
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from f1api.main import app
+
+BASELINE = Path(__file__).with_name("baseline.json")
+REQUESTS = int(os.getenv("F1API_BENCH_REQUESTS", "200"))
+CONCURRENCY = int(os.getenv("F1API_BENCH_CONCURRENCY", "8"))
+TOLERANCE = float(os.getenv("F1API_BENCH_TOLERANCE", "1.0"))
+UPDATE = bool(os.getenv("F1API_BENCH_UPDATE"))
+
+# scenario -> paths to cycle through, built from the synthetic dataset ids
+SCENARIOS: dict[str, Callable[[Any], list[str]]] = {
+    "seasons_list": lambda d: ["/api/v1/seasons?limit=100"],
+    "season_get": lambda d: [f"/api/v1/seasons/{i}" for i in d.season_ids],
+    "season_snapshot": lambda d: [f"/api/v1/seasons/{y}/snapshot" for y in d.years],
+    "drivers_list": lambda d: ["/api/v1/drivers?limit=100"],
+    "drivers_deep_offset": lambda d: [f"/api/v1/drivers?limit=100&offset={d.scale.drivers - 100}"],
+    "drivers_cursor": lambda d: ["/api/v1/drivers?limit=100&cursor="],
+    "drivers_sparse": lambda d: ["/api/v1/drivers?limit=100&fields=id,code,last_name"],
+    "driver_get": lambda d: [f"/api/v1/drivers/{i}" for i in d.driver_ids],
+    "teams_list": lambda d: ["/api/v1/teams?limit=100"],
+    "events_by_season": lambda d: [f"/api/v1/events?season_year={y}" for y in d.years],
+    "event_results": lambda d: [f"/api/v1/events/{i}/results" for i in d.event_ids],
+    "session_results": lambda d: [f"/api/v1/sessions/{i}/results" for i in d.race_session_ids],
+    "standings_drivers": lambda d: [f"/api/v1/standings/drivers?season_year={y}" for y in d.years],
+    "standings_constructors": lambda d: [
+        f"/api/v1/standings/constructors?season_year={y}" for y in d.years
+    ],
+    "season_stats": lambda d: [f"/api/v1/stats/drivers?season_year={y}" for y in d.years],
+    "standings_progression": lambda d: [
+        f"/api/v1/standings/drivers/progression?season_year={y}" for y in d.years
+    ],
+}
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+async def _measure(paths: list[str], capture_queries: Any) -> dict[str, float]:
+    latencies: list[float] = []
+    todo = iter([p for p, _ in zip(cycle(paths), range(REQUESTS), strict=False)])
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for path in todo:
+                started = time.perf_counter()
+                resp = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                assert resp.status_code == 200, (path, resp.text)
+
+        await client.get(paths[0])  # warm up the pool and statement caches
+        with capture_queries(versions=True) as queries:
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+            elapsed = time.perf_counter() - started
+
+    ms = [s * 1000 for s in latencies]
+    return {
+        "p50_ms": _percentile(ms, 50),
+        "p95_ms": _percentile(ms, 95),
+        "p99_ms": _percentile(ms, 99),
+        "requests_per_second": len(ms) / elapsed,
+        "queries_per_request": len(queries) / len(ms),
+    }
+
+
+@pytest.fixture(scope="module")
+def baseline(
+    bench_results: dict[str, dict[str, float]],
+) -> Generator[dict[str, dict[str, float]], None, None]:
+    data = json.loads(BASELINE.read_text()) if BASELINE.exists() else {"scenarios": {}}
+    yield data["scenarios"]
+    if UPDATE and bench_results:
+        data = {
+            "requests": REQUESTS,
+            "concurrency": CONCURRENCY,
+            "scenarios": {
+                name: {k: round(r[k], 3) for k in ("p95_ms", "queries_per_request")}
+                for name, r in bench_results.items()
+            },
+        }
+        BASELINE.write_text(json.dumps(data, indent=2) + "\n")
+
+
+@pytest.mark.bench
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("response_cache_disabled")
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+async def test_api_benchmark(
+    scenario: str,
+    bench_data: Any,
+    bench_results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    capture_queries: Any,
+) -> None:
+    result = await _measure(SCENARIOS[scenario](bench_data), capture_queries)
+    bench_results[scenario] = result
+    if UPDATE or scenario not in baseline:
+        return
+
+    expected = baseline[scenario]
+    assert result["queries_per_request"] <= expected["queries_per_request"] + 0.01, (
+        f"{scenario}: {result['queries_per_request']:.2f} queries/request, "
+        f"baseline {expected['queries_per_request']:.2f}"
+    )
+    assert result["p95_ms"] <= expected["p95_ms"] * (1 + TOLERANCE), (
+        f"{scenario}: p95 {result['p95_ms']:.2f} ms, baseline {expected['p95_ms']:.2f} ms "
+        f"(+{TOLERANCE:.0%} allowed)"
+    )
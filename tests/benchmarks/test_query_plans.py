@@ -0,0 +1,75 @@
+"""
+Query plans of the hot query shapes on the synthetic dataset.
+
+Each case captures the SQL an endpoint (or the standings rebuild) runs and asserts
+that ``EXPLAIN`` picks the indexes added for that shape.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from f1api.core.db import engine
+from f1api.main import app
+from f1api.services.standings import constructor_standings_query, driver_standings_query
+
+RACE_RESULTS = {"ix_results_entry", "ix_sessions_event_race"}
+
+# request path (``{year}`` is a synthetic season) -> indexes its plans must use
+ENDPOINT_INDEXES: dict[str, set[str]] = {
+    "/api/v1/drivers?limit=100": {"ix_drivers_name"},
+    "/api/v1/drivers?limit=100&cursor=": {"ix_drivers_name"},
+    "/api/v1/standings/drivers/progression?season_year={year}": RACE_RESULTS,
+    "/api/v1/standings/constructors/progression?season_year={year}": RACE_RESULTS,
+}
+
+
+def _indexes(plan: dict[str, Any]) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from _indexes(child)
+
+
+def _explain(statement: str, params: Any = None) -> set[str]:
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", params)
+        return set(_indexes(cursor.fetchone()[0][0]["Plan"]))
+    finally:
+        raw.close()
+
+
+@pytest.fixture(scope="module")
+def analyzed(bench_data: Any) -> Any:
+    """Fresh planner statistics, as autovacuum would have after a bulk load."""
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    return bench_data
+
+
+@pytest.mark.bench
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("response_cache_disabled")
+@pytest.mark.parametrize("path", list(ENDPOINT_INDEXES))
+async def test_endpoint_plans_use_indexes(path: str, analyzed: Any, capture_queries: Any) -> None:
+    transport = ASGITransport(app=app)
+    with capture_queries() as queries:
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            resp = await client.get(path.format(year=analyzed.years[0]))
+    assert resp.status_code == 200
+
+    used = set().union(*(_explain(q.statement, q.parameters) for q in queries))
+    assert ENDPOINT_INDEXES[path] <= used, f"{path}: plan uses {sorted(used)}"
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize("query", [driver_standings_query, constructor_standings_query])
+def test_standings_rebuild_plans_use_indexes(query: Any, analyzed: Any) -> None:
+    stmt = query(analyzed.season_ids[0])
+    used = _explain(str(stmt.compile(engine, compile_kwargs={"literal_binds": True})))
+    assert RACE_RESULTS <= used, f"plan uses {sorted(used)}"
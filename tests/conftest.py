@@ -1,14 +1,22 @@
 """Shared pytest fixtures for test isolation."""
 
 import os
-from collections.abc import Generator
-from typing import Any, Dict
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, Dict, NamedTuple
 
 import pytest
-from sqlalchemy import Engine, create_engine
+import pytest_asyncio
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import Session, sessionmaker
 
 from f1api.core.config import settings
+from f1api.core.db import async_engine
+from f1api.services.hooks import register_write_hooks
+
+# ORM writes in tests keep standings and data versions in step, as in the app
+register_write_hooks()
 
 
 @pytest.fixture(scope="session")
@@ -52,6 +60,56 @@ def ensure_clean_tables(db_engine: Engine) -> None:
     pass
 
 
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def dispose_async_engine() -> AsyncGenerator[None, None]:
+    """
+    Drop pooled async connections after each test.
+    pytest-asyncio gives every test its own event loop, and asyncpg/psycopg async
+    connections cannot be reused across loops.
+    """
+    yield
+    await async_engine.dispose()
+
+
+class CapturedQuery(NamedTuple):
+    statement: str
+    parameters: Any
+    execution_options: Mapping[str, Any]
+
+
+QueryCapture = Callable[..., AbstractContextManager[list[CapturedQuery]]]
+
+
+@pytest.fixture(scope="function")
+def capture_queries() -> QueryCapture:
+    """
+    Record the statements an engine sends while the returned context is open.
+    Data-version lookups are left out unless versions=True: they are refreshed on
+    their own schedule and say nothing about the query plan of the code under test.
+    """
+
+    @contextmanager
+    def capture(
+        target: Engine | AsyncEngine = async_engine, *, versions: bool = False
+    ) -> Iterator[list[CapturedQuery]]:
+        sync_engine = target.sync_engine if isinstance(target, AsyncEngine) else target
+        queries: list[CapturedQuery] = []
+
+        def _record(
+            conn: Any, cursor: Any, statement: str, params: Any, context: Any, *args: Any
+        ) -> None:
+            if versions or "data_versions" not in statement:
+                queries.append(CapturedQuery(statement, params, context.execution_options))
+
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            yield queries
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+
+    return capture
+
+
 @pytest.fixture(scope="function")
 def seed_minimal_data(db_session: Session) -> Dict[str, Any]:
     """
@@ -1,6 +1,7 @@
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from f1api.api.pagination import encode_cursor
 from f1api.main import app
 
 
@@ -51,3 +52,40 @@ async def test_drivers_pagination_metadata() -> None:
     assert data["page"] == 1
     assert data["total"] >= 2  # At least VER and PER
     assert len(data["items"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_drivers_cursor_pagination_matches_offset_order() -> None:
+    """Walking the list with cursors yields the same rows as one offset page."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        full = (await client.get("/api/v1/drivers?limit=1000")).json()
+
+        seen: list[int] = []
+        cursor = ""
+        while cursor is not None:
+            resp = await client.get("/api/v1/drivers", params={"limit": 7, "cursor": cursor})
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["total"] is None
+            assert data["pages"] is None
+            seen.extend(d["id"] for d in data["items"])
+            cursor = data["next_cursor"]
+
+    assert seen == [d["id"] for d in full["items"]]
+
+
+@pytest.mark.asyncio
+async def test_drivers_invalid_cursor() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/drivers?cursor=not-a-cursor")
+        # right arity, wrong types: (last_name, first_name, id) given as integers
+        wrong_types = await client.get(f"/api/v1/drivers?cursor={encode_cursor([1, 2, 3])}")
+        # a teams cursor (name, id) sent to events (round, id)
+        team_cursor = encode_cursor(["Ferrari", 1])
+        other_endpoint = await client.get(f"/api/v1/events?cursor={team_cursor}")
+    assert resp.status_code == 400
+    assert wrong_types.status_code == 400
+    assert wrong_types.json()["detail"] == "Invalid cursor"
+    assert other_endpoint.status_code == 400
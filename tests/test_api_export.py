@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from f1api.api import export
+from f1api.core.db import engine
+from f1api.main import app
+from f1api.models import Event, Season, Session, SessionResult
+from f1api.services import export as export_service
+from f1api.services.export import RESULT_COLUMNS
+
+
+def _result_count(year: int) -> int:
+    with engine.connect() as conn:
+        return (
+            conn.scalar(
+                select(func.count())
+                .select_from(SessionResult)
+                .join(SessionResult.session)
+                .join(Session.event)
+                .join(Event.season)
+                .filter(Season.year == year)
+            )
+            or 0
+        )
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_streams_batches_from_a_server_side_cursor(
+    monkeypatch: pytest.MonkeyPatch, capture_queries: Any
+) -> None:
+    monkeypatch.setattr(export, "EXPORT_BATCH_ROWS", 7)
+    chunks: list[bytes] = []
+
+    async def recording_app(scope: Any, receive: Any, send: Any) -> None:
+        async def _send(message: Any) -> None:
+            if message["type"] == "http.response.body" and message.get("body"):
+                chunks.append(message["body"])
+            await send(message)
+
+        await app(scope, receive, _send)
+
+    transport = ASGITransport(app=recording_app)
+    with capture_queries() as queries:
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/api/v1/export/results?season_year=2024")
+    streamed = [
+        bool(q.execution_options.get("stream_results"))
+        for q in queries
+        if "AS session_name" in q.statement
+    ]
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        events = (await client.get("/api/v1/events?season_year=2024")).json()["items"]
+        bahrain = next(e for e in events if e["name"] == "Bahrain Grand Prix")
+        sheets = (await client.get(f"/api/v1/events/{bahrain['id']}/results")).json()
+    race = next(s for s in sheets["sessions"] if s["session"]["type"] == "RACE")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert "x-cache" not in resp.headers and "content-encoding" not in resp.headers
+    assert streamed == [True]
+
+    rows = [json.loads(line) for line in resp.content.splitlines()]
+    assert len(rows) == _result_count(2024)
+    assert len(chunks) == -(-len(rows) // 7)  # one chunk per cursor batch
+    assert list(rows[0]) == list(RESULT_COLUMNS)
+
+    exported = [r for r in rows if r["session_id"] == race["session"]["id"]]
+    sheet = [r for r in race["results"] if r["position"] is not None]
+    assert sheet
+    assert [(r["driver_ref"], r["points"]) for r in exported[: len(sheet)]] == [
+        (r["driver_ref"], r["points"]) for r in sheet
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_matches_ndjson() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        as_csv = await client.get("/api/v1/export/results?season_year=2024&format=csv")
+        as_ndjson = await client.get("/api/v1/export/results?season_year=2024")
+
+    assert as_csv.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="results-2024.csv"' in as_csv.headers["content-disposition"]
+    reader = csv.DictReader(io.StringIO(as_csv.text))
+    assert reader.fieldnames == list(RESULT_COLUMNS)
+    rows = [json.loads(line) for line in as_ndjson.text.splitlines()]
+    assert [(r["session_id"], r["driver_ref"]) for r in reader] == [
+        (str(r["session_id"]), r["driver_ref"]) for r in rows
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_unknown_season() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/export/results?season_year=1800&format=csv")
+        bad_format = await client.get("/api/v1/export/results?format=xml")
+    assert resp.status_code == 404
+    assert bad_format.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+async def test_columnar_export_round_trips(fmt: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(f"/api/v1/export/results?season_year=2024&format={fmt}")
+        as_ndjson = await client.get("/api/v1/export/results?season_year=2024")
+
+    assert resp.status_code == 200
+    if fmt == "arrow":
+        assert resp.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(resp.content).read_all()
+    else:
+        assert resp.headers["content-type"] == "application/vnd.apache.parquet"
+        table = pq.read_table(pa.BufferReader(resp.content))
+    assert table.schema == export_service.arrow_schema()
+    assert table.to_pylist() == [json.loads(line) for line in as_ndjson.text.splitlines()]
+
+
+def test_cli_writes_parquet_in_row_groups(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_ROWS", 7)
+    monkeypatch.setattr(export_service, "PARQUET_ROW_GROUP_ROWS", 20)
+    out = tmp_path / "results.parquet"
+
+    export_service.main([str(out), "--season", "2024"])
+
+    rows = _result_count(2024)
+    assert f"Exported {rows} results" in capsys.readouterr().out
+    metadata = pq.ParquetFile(out).metadata
+    assert metadata.num_rows == rows
+    # 7-row cursor batches gathered into row groups of at least 20 rows
+    assert metadata.num_row_groups == -(-rows // 21)
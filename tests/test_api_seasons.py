@@ -1,7 +1,13 @@
+from typing import Any
+
 import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from httpx import ASGITransport, AsyncClient
 
+from f1api.core.cache import response_cache
 from f1api.main import app
+from f1api.schemas import SeasonSnapshot
 
 
 @pytest.mark.asyncio
@@ -32,3 +38,39 @@ async def test_get_season_not_found() -> None:
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         resp = await client.get("/api/v1/seasons/99999")
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_season_snapshot_is_one_document_in_bounded_queries(capture_queries: Any) -> None:
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    with capture_queries() as queries:
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/api/v1/seasons/2024/snapshot")
+            cached = await client.get("/api/v1/seasons/2024/snapshot")
+            snapshot_queries = len(queries)
+            standings = await client.get("/api/v1/standings/drivers?season_year=2024")
+            constructors = await client.get("/api/v1/standings/constructors?season_year=2024")
+            events = await client.get("/api/v1/events?season_year=2024")
+
+    assert resp.status_code == 200
+    assert snapshot_queries == 5  # season, events, entries, two standings; then a cache hit
+    assert cached.headers["x-cache"] == "HIT" and cached.content == resp.content
+
+    # fast path output equals what pydantic would render
+    snapshot = SeasonSnapshot.model_validate_json(resp.content)
+    assert JSONResponse(jsonable_encoder(snapshot)).body == resp.content
+    assert snapshot.season.year == 2024
+    assert [e.id for e in snapshot.events] == [e["id"] for e in events.json()["items"]]
+    assert all(e.circuit.id == e.circuit_id for e in snapshot.events)
+    assert len(snapshot.entries) == 20
+    assert resp.json()["driver_standings"] == standings.json()["items"]
+    assert resp.json()["constructor_standings"] == constructors.json()["items"]
+
+
+@pytest.mark.asyncio
+async def test_season_snapshot_not_found() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/seasons/1066/snapshot")
+    assert resp.status_code == 404
@@ -0,0 +1,59 @@
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from f1api.main import app
+
+
+async def _bahrain(client: AsyncClient) -> dict[str, Any]:
+    resp = await client.get("/api/v1/events?season_year=2024")
+    return next(e for e in resp.json()["items"] if e["name"] == "Bahrain Grand Prix")
+
+
+@pytest.mark.asyncio
+async def test_event_results_returns_every_session_sheet() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        bahrain = await _bahrain(client)
+        resp = await client.get(f"/api/v1/events/{bahrain['id']}/results")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["event"]["id"] == bahrain["id"]
+    assert [s["session"]["type"] for s in data["sessions"]] == ["FP", "QUALIFYING", "RACE"]
+
+    race = data["sessions"][-1]["results"]
+    assert len(race) == 10
+    assert [r["position"] for r in race] == list(range(1, 11))
+    winner = race[0]
+    assert winner["driver_code"] == "VER"
+    assert winner["team_name"] == "Red Bull Racing"
+    assert winner["points"] == 25
+    assert winner["grid"] == 1
+    assert winner["laps"] == 57
+
+
+@pytest.mark.asyncio
+async def test_session_results_use_a_fixed_number_of_queries(capture_queries: Any) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        bahrain = await _bahrain(client)
+        sheet = (await client.get(f"/api/v1/events/{bahrain['id']}/results")).json()
+        race_id = sheet["sessions"][-1]["session"]["id"]
+
+        with capture_queries() as queries:
+            resp = await client.get(f"/api/v1/sessions/{race_id}/results?nocache=1")
+    assert resp.status_code == 200
+    assert resp.json()["results"] == sheet["sessions"][-1]["results"]
+    # session + (results JOIN entries JOIN drivers JOIN teams), regardless of grid size
+    assert len([q for q in queries if q.statement.lstrip().upper().startswith("SELECT")]) == 2
+
+
+@pytest.mark.asyncio
+async def test_session_results_not_found() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/sessions/99999/results")
+        event_resp = await client.get("/api/v1/events/99999/results")
+    assert resp.status_code == 404
+    assert event_resp.status_code == 404
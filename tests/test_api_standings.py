@@ -126,3 +126,72 @@ async def test_standings_pagination() -> None:
         page1_drivers = {d["driver_id"] for d in data1["items"]}
         page2_drivers = {d["driver_id"] for d in data2["items"]}
         assert len(page1_drivers & page2_drivers) == 0  # No overlap
+
+
+@pytest.mark.asyncio
+async def test_standings_cursor_pagination() -> None:
+    """Cursor pages follow the championship order without a total count."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp1 = await client.get("/api/v1/standings/drivers?season_year=2024&limit=3&cursor=")
+        data1 = resp1.json()
+        resp2 = await client.get(
+            "/api/v1/standings/drivers",
+            params={"season_year": 2024, "limit": 3, "cursor": data1["next_cursor"]},
+        )
+        data2 = resp2.json()
+
+    assert data1["total"] is None
+    assert [s["position"] for s in data1["items"]] == [1, 2, 3]
+    assert [s["position"] for s in data2["items"]] == [4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_driver_progression_ends_at_current_standings() -> None:
+    """The last round of the progression matches the persisted standings."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/standings/drivers/progression?season_year=2024")
+        standings = await client.get("/api/v1/standings/drivers?season_year=2024")
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert [r["round"] for r in data["rounds"]] == [1, 2, 3, 4, 5, 6]
+    final = {
+        d["driver_id"]: (d["positions"][-1], d["points"][-1], d["wins"][-1])
+        for d in data["drivers"]
+    }
+    assert final == {
+        s["driver_id"]: (s["position"], s["points"], s["wins"]) for s in standings.json()["items"]
+    }
+
+    ver = data["drivers"][0]
+    assert ver["driver_code"] == "VER"
+    assert ver["points"] == [25.0, 50.0, 50.0, 75.0, 100.0, 118.0]
+    assert ver["wins"] == [1, 2, 2, 3, 4, 4]
+    for driver in data["drivers"]:
+        assert driver["points"] == sorted(driver["points"])  # cumulative
+
+
+@pytest.mark.asyncio
+async def test_constructor_progression_after_round() -> None:
+    """after_round stops the progression, giving the standings after that round."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            "/api/v1/standings/constructors/progression?season_year=2024&after_round=2"
+        )
+        missing = await client.get("/api/v1/standings/constructors/progression?season_year=1999")
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert [r["event_name"] for r in data["rounds"]] == [
+        "Bahrain Grand Prix",
+        "Saudi Arabian Grand Prix",
+    ]
+    assert data["constructors"][0]["team_ref"] == "red_bull_racing"
+    assert data["constructors"][0]["points"] == [43.0, 86.0]
+    assert [c["positions"][-1] for c in data["constructors"]] == list(
+        range(1, len(data["constructors"]) + 1)
+    )
+    assert missing.status_code == 404
@@ -0,0 +1,111 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, text, update
+from sqlalchemy.orm import Session
+
+from f1api.core.db import engine
+from f1api.main import app
+from f1api.models import (
+    DataVersion,
+    Driver,
+    Entry,
+    SeasonDriverStats,
+    SessionResult,
+    SessionType,
+)
+from f1api.models import Session as RaceSession
+from f1api.services.data_versions import SEASON_STATS_SCOPE
+from f1api.services.season_stats import refresh_season_stats
+
+
+@pytest.mark.asyncio
+async def test_driver_season_stats_2024() -> None:
+    """Driver stats come from the materialized view and agree with the standings."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/stats/drivers?season_year=2024")
+        standings = await client.get("/api/v1/standings/drivers?season_year=2024")
+    assert resp.status_code == 200
+    data = resp.json()
+
+    ver = next(s for s in data["items"] if s["driver_code"] == "VER")
+    assert (ver["starts"], ver["wins"], ver["podiums"], ver["points"]) == (6, 4, 5, 118.0)
+    assert ver["avg_grid"] is not None and ver["avg_finish"] is not None
+    points = {s["driver_id"]: s["points"] for s in standings.json()["items"]}
+    assert {s["driver_id"]: s["points"] for s in data["items"]} == points
+
+
+@pytest.mark.asyncio
+async def test_team_season_stats_2024() -> None:
+    """Team stats add up every car of the team."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/stats/teams?season_year=2024")
+        missing = await client.get("/api/v1/stats/teams?season_year=1999")
+    assert resp.status_code == 200
+    rbr = next(s for s in resp.json()["items"] if s["team_ref"] == "red_bull_racing")
+    assert (rbr["starts"], rbr["wins"], rbr["points"]) == (12, 4, 209.0)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/v1/stats/drivers", "/api/v1/stats/teams"])
+async def test_season_stats_are_ordered_by_points(path: str) -> None:
+    key = "driver_id" if path.endswith("drivers") else "team_id"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        items = (await client.get(f"{path}?season_year=2024")).json()["items"]
+        pages: list[dict[str, object]] = []
+        cursor = ""
+        while cursor is not None:
+            page = (await client.get(f"{path}?season_year=2024&limit=3&cursor={cursor}")).json()
+            pages += page["items"]
+            cursor = page["next_cursor"]
+
+    ranked = [(s["points"], s[key]) for s in items]
+    assert ranked == sorted(ranked, key=lambda p: (-p[0], p[1]))
+    assert pages == items
+
+
+def test_non_starters_are_not_counted_as_starts_or_dnfs(db_session: Session) -> None:
+    def ver_stats() -> tuple[int, int]:
+        stats = db_session.execute(
+            select(SeasonDriverStats.starts, SeasonDriverStats.dnfs)
+            .join(Driver, Driver.id == SeasonDriverStats.driver_id)
+            .filter(Driver.code == "VER")
+        ).one()
+        return stats.starts, stats.dnfs
+
+    starts, dnfs = ver_stats()
+    finish = db_session.scalars(
+        select(SessionResult.id)
+        .join(SessionResult.entry)
+        .join(Entry.driver)
+        .join(SessionResult.session)
+        .filter(
+            Driver.code == "VER",
+            RaceSession.type == SessionType.RACE,
+            SessionResult.status == "FINISHED",
+        )
+        .limit(1)
+    ).one()
+    # rolled back with the test's transaction, view refresh included
+    db_session.execute(
+        update(SessionResult)
+        .filter(SessionResult.id == finish)
+        .values(status="DNS", position=None, classified=False)
+    )
+    db_session.execute(text("REFRESH MATERIALIZED VIEW season_driver_stats"))
+
+    assert ver_stats() == (starts - 1, dnfs)
+
+
+def test_refresh_bumps_season_stats_version() -> None:
+    def version() -> int:
+        with engine.connect() as conn:
+            stmt = select(DataVersion.version).filter(DataVersion.scope == SEASON_STATS_SCOPE)
+            return conn.scalar(stmt) or 0
+
+    before = version()
+    assert refresh_season_stats() > 0
+    assert version() == before + 1
@@ -32,3 +32,28 @@ async def test_get_team_not_found() -> None:
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         resp = await client.get("/api/v1/teams/99999")
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_teams_count_modes() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        exact = (await client.get("/api/v1/teams?count=exact")).json()
+        estimate = (await client.get("/api/v1/teams?count=estimate")).json()
+        filtered = (await client.get("/api/v1/teams?ref=ferrari&count=estimate")).json()
+        none = (await client.get("/api/v1/teams?count=none")).json()
+        invalid = await client.get("/api/v1/teams?count=sometimes")
+
+    assert exact["total_is_estimate"] is False
+    assert exact["total"] >= 10
+
+    assert estimate["total_is_estimate"] is True
+    assert isinstance(estimate["total"], int)
+    assert isinstance(filtered["total"], int)
+
+    assert none["total"] is None
+    assert none["pages"] is None
+    assert none["page"] == 1
+    assert none["items"] == exact["items"]
+
+    assert invalid.status_code == 422
@@ -0,0 +1,75 @@
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from f1api.core.cache import response_cache
+from f1api.main import app
+
+
+@pytest.fixture
+def client() -> AsyncClient:
+    response_cache.invalidate()
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_batch_get_keeps_request_order_and_reports_missing(
+    client: AsyncClient, capture_queries: Any
+) -> None:
+    async with client:
+        drivers = (await client.get("/api/v1/drivers?limit=3")).json()["items"]
+        a, b, c = drivers
+        await client.get(f"/api/v1/drivers/{a['id']}")  # reference index loaded
+        with capture_queries() as queries:
+            resp = await client.get(
+                f"/api/v1/drivers:batchGet?ids={c['id']},999999,{a['id']},{c['id']}"
+                f"&refs=nobody,{b['ref']},{a['ref']}"
+            )
+
+    assert resp.status_code == 200
+    # ids first, then refs; a driver named twice is returned once
+    assert resp.json()["items"] == [c, a, b]
+    assert resp.json()["missing"] == {"ids": [999999], "refs": ["nobody"]}
+    assert queries == []  # drivers are resolved from the reference index
+
+
+@pytest.mark.asyncio
+async def test_batch_get_post_body_and_fields(client: AsyncClient, capture_queries: Any) -> None:
+    async with client:
+        teams = (await client.get("/api/v1/teams?limit=2")).json()["items"]
+        resp = await client.post(
+            "/api/v1/teams:batchGet?fields=name",
+            json={"ids": [teams[1]["id"]], "refs": [teams[0]["ref"]]},
+        )
+        events = (await client.get("/api/v1/events?season_year=2024&limit=2")).json()["items"]
+        event_ids = [e["id"] for e in events]
+        with capture_queries() as queries:
+            by_id = await client.post("/api/v1/events:batchGet", json={"ids": event_ids})
+        seasons = await client.get("/api/v1/seasons:batchGet?ids=1")
+
+    assert resp.status_code == 200
+    assert resp.json()["items"] == [{"name": teams[1]["name"]}, {"name": teams[0]["name"]}]
+    assert by_id.json() == {"items": events, "missing": {"ids": [], "refs": []}}
+    assert len(queries) == 1 and "ANY" in queries[0].statement
+    assert seasons.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "path", "body", "detail"),
+    [
+        ("GET", "/api/v1/drivers:batchGet", None, "No ids or refs to look up"),
+        ("GET", "/api/v1/drivers:batchGet?ids=1,x", None, "ids must be comma-separated integers"),
+        ("GET", f"/api/v1/teams:batchGet?ids={','.join(['1'] * 1001)}", None, "At most 1000"),
+        ("POST", "/api/v1/events:batchGet", {"refs": ["bahrain"]}, "only be looked up by id"),
+        ("POST", "/api/v1/seasons:batchGet", {"refs": ["2024"]}, "only be looked up by id"),
+    ],
+)
+async def test_batch_get_rejects_bad_keys(
+    client: AsyncClient, method: str, path: str, body: Any, detail: str
+) -> None:
+    async with client:
+        resp = await client.request(method, path, json=body)
+    assert resp.status_code == 400
+    assert detail in resp.json()["detail"]
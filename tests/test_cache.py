@@ -0,0 +1,68 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from f1api.core.cache import CachedResponse, ResponseCache, response_cache
+from f1api.main import app
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _entry(body: bytes) -> CachedResponse:
+    return CachedResponse(200, [(b"content-type", b"application/json")], body)
+
+
+def test_cache_expires_after_ttl() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(max_bytes=1024, default_ttl=10, clock=clock)
+    cache.set("/a?", _entry(b"{}"), ttl=10)
+    assert cache.get("/a?") is not None
+    clock.now = 10
+    assert cache.get("/a?") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (1, 1, 0, 0)
+
+
+def test_cache_evicts_least_recently_used_by_bytes() -> None:
+    entry_size = _entry(b"x" * 40).size
+    cache = ResponseCache(max_bytes=entry_size * 2, default_ttl=10)
+    cache.set("/a?", _entry(b"x" * 40), ttl=10)
+    cache.set("/b?", _entry(b"x" * 40), ttl=10)
+    assert cache.get("/a?") is not None  # /b? is now least recently used
+    cache.set("/c?", _entry(b"x" * 40), ttl=10)
+    assert cache.get("/b?") is None
+    assert cache.get("/a?") is not None
+    assert cache.stats().evictions == 1
+
+
+def test_cache_route_ttls_and_invalidation() -> None:
+    cache = ResponseCache(
+        max_bytes=1024, default_ttl=5, route_ttls={"/api/v1/x": 60, "/api/v1/x/live": 0}
+    )
+    assert cache.ttl_for("/api/v1/x/1") == 60
+    assert cache.ttl_for("/api/v1/x/live") == 0
+    assert cache.ttl_for("/other") == 5
+
+    cache.set("/api/v1/x?", _entry(b"1"), ttl=60)
+    cache.set("/api/v1/y?", _entry(b"2"), ttl=60)
+    cache.invalidate("/api/v1/x")
+    assert cache.get("/api/v1/x?") is None
+    assert cache.get("/api/v1/y?") is not None
+
+
+@pytest.mark.asyncio
+async def test_repeat_get_served_from_cache() -> None:
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/teams?offset=0&limit=5")
+        # Same params in a different order share the cache entry
+        second = await client.get("/api/v1/teams?limit=5&offset=0")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.content == first.content
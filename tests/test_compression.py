@@ -0,0 +1,70 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from f1api.core.cache import ROUTE_TTLS, response_cache
+from f1api.core.compression import ENCODINGS, negotiate
+from f1api.main import app
+
+DRIVERS = "/api/v1/drivers?limit=20"
+
+
+def test_negotiate_prefers_highest_q_then_server_order() -> None:
+    assert negotiate("gzip, deflate") == "gzip"
+    assert negotiate("deflate, identity") is None
+    assert negotiate("gzip;q=0") is None
+    assert negotiate("*") == ENCODINGS[0]
+    assert negotiate("GZIP;Q=0.8, zstd;q=0.1") == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_keep_compressed_variants() -> None:
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        plain = await client.get(DRIVERS, headers={"Accept-Encoding": "identity"})
+        first = await client.get(DRIVERS, headers={"Accept-Encoding": "gzip"})
+        hit = await client.get(DRIVERS, headers={"Accept-Encoding": "gzip"})
+        revalidated = await client.get(
+            DRIVERS, headers={"Accept-Encoding": "gzip", "If-None-Match": hit.headers["etag"]}
+        )
+
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert [r.headers["x-cache"] for r in (plain, first, hit)] == ["MISS", "HIT", "HIT"]
+    for resp in (first, hit):
+        assert resp.headers["content-encoding"] == "gzip"
+        assert int(resp.headers["content-length"]) < len(plain.content)
+        assert resp.content == plain.content
+        assert resp.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+
+    # one cache entry for all encodings; the gzip variant was compressed once and kept
+    entries = [e for k, e in response_cache._entries.items() if k.startswith(DRIVERS.split("?")[0])]
+    assert [list(e.variants) for e in entries] == [["gzip"]]
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == hit.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_small_and_uncached_responses(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(ROUTE_TTLS, "/api/v1/drivers", 0.0)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        small = await client.get("/api/v1/seasons", headers={"Accept-Encoding": "gzip"})
+        uncached = await client.get(DRIVERS, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in small.headers  # below compression_min_bytes
+    assert small.headers["vary"] == "Accept-Encoding"
+    assert "x-cache" not in uncached.headers
+    assert uncached.headers["content-encoding"] == "gzip"
+    assert uncached.json()["total"] == 20
+
+
+@pytest.mark.asyncio
+async def test_brotli_is_preferred_when_available() -> None:
+    pytest.importorskip("brotli")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(DRIVERS, headers={"Accept-Encoding": "gzip, br"})
+    assert resp.headers["content-encoding"] == "br"
+    assert resp.json()["total"] == 20
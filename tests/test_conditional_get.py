@@ -0,0 +1,77 @@
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.orm import Session
+
+from f1api.core.db import engine
+from f1api.core.versions import ROUTE_SCOPES, data_versions, scopes_for
+from f1api.main import app
+from f1api.models import Season, Team
+from f1api.services.data_versions import bump_data_versions, flushed_scopes
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304_without_queries(
+    monkeypatch: pytest.MonkeyPatch, capture_queries: Any
+) -> None:
+    monkeypatch.setattr(data_versions, "refresh_interval", 60.0)
+    data_versions.expire()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/drivers?limit=5")
+        etag = first.headers["etag"]
+
+        with capture_queries(versions=True) as queries:
+            resp = await client.get("/api/v1/drivers?limit=5", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, max-age=300"
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert queries == []
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_only_for_routes_reading_a_bumped_scope() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        drivers = await client.get("/api/v1/drivers?limit=5")
+        teams = await client.get("/api/v1/teams?limit=5")
+        other_page = await client.get("/api/v1/drivers?limit=6")
+        assert other_page.headers["etag"] != drivers.headers["etag"]
+
+        with engine.begin() as conn:  # commit expires this process's version snapshot
+            bump_data_versions(conn, ["drivers"])
+
+        drivers_again = await client.get(
+            "/api/v1/drivers?limit=5", headers={"If-None-Match": drivers.headers["etag"]}
+        )
+        teams_again = await client.get(
+            "/api/v1/teams?limit=5", headers={"If-None-Match": teams.headers["etag"]}
+        )
+
+    assert drivers_again.status_code == 200
+    assert drivers_again.headers["etag"] != drivers.headers["etag"]
+    assert drivers_again.headers["x-cache"] == "MISS"  # cache entries are per data version
+    assert "last-modified" in drivers_again.headers
+    assert teams_again.status_code == 304
+
+
+def test_orm_writes_map_to_scopes(db_session: Session) -> None:
+    db_session.add(Team(ref="versions_team", name="Versions Team"))
+    assert flushed_scopes(db_session) == {"teams"}
+    db_session.add(Season(year=1895))
+    assert flushed_scopes(db_session) == {"teams", "seasons", "standings"}
+
+
+def test_route_scopes_match_templated_prefixes() -> None:
+    assert scopes_for("/api/v1/seasons/2024/snapshot") == (
+        "/api/v1/seasons/{year}/snapshot",
+        ROUTE_SCOPES["/api/v1/seasons/{year}/snapshot"],
+    )
+    assert "standings" in ROUTE_SCOPES["/api/v1/seasons/{year}/snapshot"]
+    assert scopes_for("/api/v1/seasons/3") == ("/api/v1/seasons", ("seasons",))
@@ -0,0 +1,177 @@
+from pathlib import Path
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from f1api.models import (
+    ConstructorStanding,
+    DriverStanding,
+    Entry,
+    Season,
+    SeasonDriverStats,
+    SessionResult,
+    Team,
+)
+from f1api.services.ergast import _parse_years, _status, read_archive
+from f1api.services.ingest import load_reference_data, load_season
+from f1api.services.standings import driver_progression_query
+
+ARCHIVE = {
+    "constructors.csv": "constructorId,constructorRef,name,nationality,url\n"
+    "1,erg_alpha,Alpha,British,\\N\n"
+    "2,erg_beta,Beta,Italian,\\N\n",
+    "drivers.csv": "driverId,driverRef,number,code,forename,surname,dob,nationality,url\n"
+    "1,erg_ann,\\N,ANN,Ann,Able,1920-01-01,British,\\N\n"
+    "2,erg_ben,7,\\N,Ben,Baker,1921-02-02,Italian,\\N\n"
+    "3,erg_cid,\\N,\\N,Cid,Nodob,\\N,French,\\N\n",
+    "circuits.csv": "circuitId,circuitRef,name,location,country,lat,lng,alt,url\n"
+    "1,erg_ring,Ring,Townsville,UK,51.5,-1.0,\\N,\\N\n",
+    "status.csv": "statusId,status\n1,Finished\n2,Engine\n11,+1 Lap\n",
+    "races.csv": "raceId,year,round,circuitId,name,date,time,url\n"
+    "10,1897,1,1,First GP,1897-05-01,\\N,\\N\n"
+    "11,1897,2,1,Second GP,1897-06-01,14:00:00,\\N\n"
+    "12,1896,1,1,Old GP,1896-05-01,\\N,\\N\n",
+    "results.csv": "resultId,raceId,driverId,constructorId,number,grid,position,positionText,"
+    "positionOrder,points,laps,time,milliseconds,fastestLap,rank,fastestLapTime,"
+    "fastestLapSpeed,statusId\n"
+    "1,10,1,1,1,1,1,1,1,8,50,\\N,6000000,\\N,\\N,\\N,\\N,1\n"
+    "2,10,2,2,7,2,2,2,2,6,49,\\N,\\N,\\N,\\N,\\N,\\N,11\n"
+    "3,10,2,2,7,2,\\N,R,3,0,10,\\N,\\N,\\N,\\N,\\N,\\N,2\n"
+    "4,11,2,2,7,1,1,1,1,8,50,\\N,6100000,\\N,\\N,\\N,\\N,1\n"
+    "5,11,1,1,1,2,2,2,2,6,50,\\N,6105000,\\N,\\N,\\N,\\N,1\n"
+    "6,10,3,1,9,3,3,3,4,4,50,\\N,\\N,\\N,\\N,\\N,\\N,1\n",
+}
+
+
+def _write_archive(root: Path) -> Path:
+    for name, content in ARCHIVE.items():
+        (root / name).write_text(content)
+    return root
+
+
+def test_read_archive_normalizes_ergast_quirks(tmp_path: Path) -> None:
+    archive = read_archive(_write_archive(tmp_path), years={1897})
+
+    assert list(archive.seasons) == [1897]
+    assert [d["ref"] for d in archive.drivers] == ["erg_ann", "erg_ben"]
+    assert archive.drivers[0]["permanent_number"] is None
+
+    season = archive.seasons[1897]
+    assert {e["driver"]: e["team"] for e in season["entries"]} == {
+        "erg_ann": "erg_alpha",
+        "erg_ben": "erg_beta",
+    }
+    # Duplicate result for Ben in round 1 collapses to the best-placed one
+    round_one = [r for r in season["results"] if r["round"] == 1]
+    assert [(r["driver"], r["position"], r["status"]) for r in round_one] == [
+        ("erg_ann", 1, "FINISHED"),
+        ("erg_ben", 2, "FINISHED"),
+    ]
+    round_two = {r["driver"]: r for r in season["results"] if r["round"] == 2}
+    assert round_two["erg_ann"]["gap_ms"] == 5000
+    assert [s["started_at"] for s in season["sessions"]][1].hour == 14  # type: ignore[union-attr]
+    assert any("no date of birth" in note for note in archive.notes)
+    assert any("duplicate result" in note for note in archive.notes)
+    assert [_status(s) for s in ("+2 Laps", "Withdrew", "Did not qualify", "Gearbox")] == [
+        "FINISHED",
+        "DNS",
+        "DNQ",
+        "Gearbox",
+    ]
+
+
+def _write_team_change_archive(root: Path) -> Path:
+    """The archive with Ben moving from Beta to Alpha for round 2, qualifying included."""
+    _write_archive(root)
+    results = root / "results.csv"
+    results.write_text(results.read_text().replace("\n4,11,2,2,", "\n4,11,2,1,"))
+    (root / "qualifying.csv").write_text(
+        "qualifyId,raceId,driverId,constructorId,number,position,q1,q2,q3\n"
+        "1,11,2,1,7,1,\\N,\\N,\\N\n"
+        "2,11,1,1,1,2,\\N,\\N,\\N\n"
+    )
+    return root
+
+
+def test_read_archive_keeps_an_entry_per_team_a_driver_drove_for(tmp_path: Path) -> None:
+    season = read_archive(_write_team_change_archive(tmp_path), years={1897}).seasons[1897]
+
+    assert sorted((e["driver"], e["team"]) for e in season["entries"]) == [
+        ("erg_ann", "erg_alpha"),
+        ("erg_ben", "erg_alpha"),
+        ("erg_ben", "erg_beta"),
+    ]
+    assert {(r["round"], r.get("team")) for r in season["results"] if r["driver"] == "erg_ben"} == {
+        (1, "erg_beta"),
+        (2, "erg_alpha"),
+    }
+
+
+def test_mid_season_team_change_credits_each_team(db_session: Session, tmp_path: Path) -> None:
+    archive = read_archive(_write_team_change_archive(tmp_path), years={1897})
+    conn = db_session.connection()
+    refs = load_reference_data(conn, archive.teams, archive.drivers, archive.circuits)
+    load_season(conn, archive.seasons[1897], refs)
+    season_id = db_session.scalar(select(Season.id).filter(Season.year == 1897))
+
+    # Ben's points add up over both entries; he is listed with his latest team
+    drivers = db_session.execute(
+        select(DriverStanding.points, Team.ref)
+        .join(Team, Team.id == DriverStanding.team_id)
+        .filter(DriverStanding.season_id == season_id)
+        .order_by(DriverStanding.position, Team.ref)
+    ).all()
+    assert [tuple(row) for row in drivers] == [(14.0, "erg_alpha"), (14.0, "erg_alpha")]
+    constructors = db_session.execute(
+        select(Team.ref, ConstructorStanding.points)
+        .join(Team, Team.id == ConstructorStanding.team_id)
+        .filter(ConstructorStanding.season_id == season_id)
+        .order_by(ConstructorStanding.position)
+    ).all()
+    assert [tuple(row) for row in constructors] == [("erg_alpha", 22.0), ("erg_beta", 6.0)]
+    progression = db_session.execute(driver_progression_query(season_id)).all()
+    assert sorted((r.round, r.points, r.team_id) for r in progression) == [
+        (1, 6.0, refs.teams["erg_alpha"]),
+        (1, 8.0, refs.teams["erg_alpha"]),
+        (2, 14.0, refs.teams["erg_alpha"]),
+        (2, 14.0, refs.teams["erg_alpha"]),
+    ]
+    # qualifying and race results of round 2 sit on Ben's Alpha entry
+    teams = db_session.scalars(
+        select(Team.ref)
+        .join(Entry, Entry.team_id == Team.id)
+        .join(SessionResult, SessionResult.entry_id == Entry.id)
+        .filter(Entry.season_id == season_id)
+    ).all()
+    assert sorted(teams) == ["erg_alpha"] * 5 + ["erg_beta"]
+
+    db_session.execute(text("REFRESH MATERIALIZED VIEW season_driver_stats"))
+    stats = db_session.execute(
+        select(SeasonDriverStats.starts, SeasonDriverStats.points, Team.ref)
+        .join(Team, Team.id == SeasonDriverStats.team_id)
+        .filter(SeasonDriverStats.season_id == season_id)
+        .order_by(SeasonDriverStats.driver_id)
+    ).all()
+    assert [tuple(row) for row in stats] == [(2, 14.0, "erg_alpha"), (2, 14.0, "erg_alpha")]
+
+
+def test_archive_season_loads_with_shared_refs(db_session: Session, tmp_path: Path) -> None:
+    archive = read_archive(_write_archive(tmp_path), years={1897})
+    conn = db_session.connection()
+
+    refs = load_reference_data(conn, archive.teams, archive.drivers, archive.circuits)
+    report = load_season(conn, archive.seasons[1897], refs)
+    assert report.rows["results"] == 4
+    assert "teams" not in report.rows
+
+    season_id = db_session.scalar(select(Season.id).filter(Season.year == 1897))
+    points = db_session.scalars(
+        select(DriverStanding.points)
+        .filter(DriverStanding.season_id == season_id)
+        .order_by(DriverStanding.position)
+    ).all()
+    assert points == [14.0, 14.0]
+
+
+def test_parse_years() -> None:
+    assert _parse_years("1950-1952,2024") == {1950, 1951, 1952, 2024}
@@ -0,0 +1,69 @@
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from f1api.core.cache import response_cache
+from f1api.main import app
+
+
+async def _get(path: str) -> Any:
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.asyncio
+async def test_fields_narrow_the_projection_and_the_payload(capture_queries: Any) -> None:
+    full = await _get("/api/v1/drivers?limit=5")
+    with capture_queries() as queries:
+        narrow = await _get("/api/v1/drivers?limit=5&fields=last_name,id,code")
+
+    assert narrow.status_code == 200
+    # schema order, whatever the order requested
+    assert [list(item) for item in narrow.json()["items"]] == [["id", "code", "last_name"]] * 5
+    assert narrow.json()["items"] == [
+        {"id": d["id"], "code": d["code"], "last_name": d["last_name"]}
+        for d in full.json()["items"]
+    ]
+    page_query = queries[-1].statement
+    assert "drivers.last_name" in page_query
+    assert "date_of_birth" not in page_query and "wikipedia_url" not in page_query
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_keep_sort_keys_that_were_not_requested() -> None:
+    full = await _get("/api/v1/drivers?limit=1000")
+    ids: list[int] = []
+    cursor = ""
+    while cursor is not None:
+        page = (await _get(f"/api/v1/drivers?fields=id&limit=7&cursor={cursor}")).json()
+        assert all(list(item) == ["id"] for item in page["items"])
+        ids += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+    assert ids == [d["id"] for d in full.json()["items"]]
+
+
+@pytest.mark.asyncio
+async def test_fields_on_joined_lists_and_detail_endpoints() -> None:
+    full = await _get("/api/v1/standings/drivers?season_year=2024")
+    narrow = await _get("/api/v1/standings/drivers?season_year=2024&fields=driver_ref,points")
+    assert narrow.json()["items"] == [
+        {"driver_ref": s["driver_ref"], "points": s["points"]} for s in full.json()["items"]
+    ]
+
+    driver_id = full.json()["items"][0]["driver_id"]
+    detail = await _get(f"/api/v1/drivers/{driver_id}?fields=code,first_name")
+    assert list(detail.json()) == ["code", "first_name"]
+    assert (await _get(f"/api/v1/drivers/{driver_id}")).json()["id"] == driver_id
+    assert (await _get("/api/v1/drivers/999999?fields=code")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_unknown_fields_are_rejected() -> None:
+    resp = await _get("/api/v1/teams?fields=name,wikipedia_url,secret")
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Unknown fields: secret, wikipedia_url"
+    # an empty list means all fields
+    assert list((await _get("/api/v1/teams?fields=")).json()["items"][0]) == ["id", "ref", "name"]
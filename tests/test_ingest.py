@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from f1api.models import Driver, DriverStanding, Entry, Season, SessionResult
+from f1api.services.ingest import SeasonDataset, load_season, read_dataset
+
+
+def _dataset(alice_points: float = 25.0) -> SeasonDataset:
+    return {
+        "year": 1898,
+        "teams": [{"ref": "ingest_team", "name": "Ingest Team"}],
+        "drivers": [
+            {
+                "ref": "ingest_alice",
+                "first_name": "Alice",
+                "last_name": "A",
+                "date_of_birth": "1990-01-01",  # type: ignore[typeddict-item]
+            },
+            {
+                "ref": "ingest_bob",
+                "first_name": "Bob",
+                "last_name": "B",
+                "date_of_birth": "1990-01-01",  # type: ignore[typeddict-item]
+            },
+        ],
+        "circuits": [{"ref": "ingest_circuit", "name": "Ingest Circuit"}],
+        "entries": [
+            {"driver": "ingest_alice", "team": "ingest_team", "car_number": 1},
+            {"driver": "ingest_bob", "team": "ingest_team", "car_number": 2},
+        ],
+        "events": [{"round": 1, "circuit": "ingest_circuit", "name": "Ingest GP"}],
+        "sessions": [{"round": 1, "type": "RACE", "session_order": 3, "name": "Race"}],
+        "results": [
+            {
+                "round": 1,
+                "session_order": 3,
+                "driver": "ingest_alice",
+                "position": 1,
+                "points": alice_points,
+            },
+            {"round": 1, "session_order": 3, "driver": "ingest_bob", "position": 2, "points": 18},
+        ],
+    }
+
+
+def _season_counts(db: Session) -> tuple[int, int, list[tuple[int, float]]]:
+    season_id = db.scalar(select(Season.id).filter(Season.year == 1898))
+    entries = db.scalar(select(func.count()).filter(Entry.season_id == season_id))
+    results = db.scalar(
+        select(func.count())
+        .select_from(SessionResult)
+        .join(SessionResult.entry)
+        .filter(Entry.season_id == season_id)
+    )
+    standings = db.execute(
+        select(DriverStanding.position, DriverStanding.points)
+        .filter(DriverStanding.season_id == season_id)
+        .order_by(DriverStanding.position)
+    ).all()
+    return entries or 0, results or 0, [tuple(row) for row in standings]
+
+
+def test_load_season_is_idempotent_upsert(db_session: Session, tmp_path: Path) -> None:
+    path = tmp_path / "1898.json"
+    path.write_text(json.dumps(_dataset()))
+    conn = db_session.connection()
+
+    report = load_season(conn, read_dataset(path))
+    assert report.rows["results"] == 2
+    assert _season_counts(db_session) == (2, 2, [(1, 25.0), (2, 18.0)])
+
+    # Re-loading updates in place instead of duplicating, standings follow
+    path.write_text(json.dumps(_dataset(alice_points=10)))
+    load_season(conn, read_dataset(path))
+    assert _season_counts(db_session) == (2, 2, [(1, 18.0), (2, 10.0)])
+
+
+def test_reload_drops_missing_results_and_keeps_omitted_reference_fields(
+    db_session: Session,
+) -> None:
+    conn = db_session.connection()
+    data = _dataset()
+    data["drivers"][1]["code"] = "BOB"
+    data["sessions"].append({"round": 1, "type": "QUALIFYING", "session_order": 2, "name": "Q"})
+    data["results"].append({"round": 1, "session_order": 2, "driver": "ingest_bob", "position": 1})
+    load_season(conn, data)
+    assert _season_counts(db_session)[1] == 3
+
+    # Bob's race result and the qualifying session are gone; his code is not repeated
+    reload = _dataset()
+    reload["results"] = reload["results"][:1]
+    load_season(conn, reload)
+
+    assert _season_counts(db_session) == (2, 1, [(1, 25.0)])
+    assert db_session.scalar(select(Driver.code).filter(Driver.ref == "ingest_bob")) == "BOB"
+
+
+def test_results_of_a_driver_with_several_teams_must_name_theirs(db_session: Session) -> None:
+    data = _dataset()
+    data["teams"].append({"ref": "ingest_other", "name": "Ingest Other"})
+    data["entries"].append({"driver": "ingest_bob", "team": "ingest_other", "car_number": 22})
+
+    with pytest.raises(ValueError, match="ingest_bob has entries with several teams"):
+        load_season(db_session.connection(), data)
+
+    data["results"][1]["team"] = "ingest_other"
+    load_season(db_session.connection(), data)
+    assert _season_counts(db_session) == (3, 2, [(1, 25.0), (2, 18.0)])
+
+
+def test_read_dataset_from_csv_directory(tmp_path: Path) -> None:
+    (tmp_path / "season.csv").write_text("year\n1898\n")
+    (tmp_path / "drivers.csv").write_text(
+        "ref,first_name,last_name,date_of_birth,permanent_number\n"
+        "ingest_alice,Alice,A,1990-01-01,\n"
+    )
+    (tmp_path / "results.csv").write_text(
+        "round,session_order,driver,position,points,classified\n1,3,ingest_alice,,0,false\n"
+    )
+
+    data = read_dataset(tmp_path)
+    assert data["year"] == 1898
+    assert data["teams"] == []
+    assert data["drivers"][0]["date_of_birth"].year == 1990
+    assert "permanent_number" not in data["drivers"][0]
+    assert data["results"] == [
+        {
+            "round": 1,
+            "session_order": 3,
+            "driver": "ingest_alice",
+            "points": 0.0,
+            "classified": False,
+        }
+    ]
@@ -1,15 +1,161 @@
+import os
+import threading
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
+from f1api.core.db import ping_after_idle
+from f1api.core.metrics import (
+    DB_QUERIES,
+    DB_QUERY_ERRORS,
+    POOL_INVALIDATIONS,
+    POOL_TIMEOUTS,
+    POOL_WAITS,
+    REGISTRY,
+    Counter,
+    Histogram,
+    TimedQueuePool,
+    instrument_engine,
+)
 from f1api.main import app
 
 
 @pytest.mark.asyncio
-async def test_metrics_stub_returns_placeholder() -> None:
+async def test_metrics_exposes_route_template_series() -> None:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/api/v1/drivers/99999")
         resp = await client.get("/metrics")
 
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("text/plain")
-    assert resp.text == "# Metrics not implemented yet\n"
+    body = resp.text
+    # labelled by route template, not the raw path
+    assert (
+        'f1api_http_requests_total{method="GET",route="/api/v1/drivers/{driver_id}",status="404"}'
+        in body
+    )
+    assert "/api/v1/drivers/99999" not in body
+    assert 'f1api_http_request_duration_seconds_bucket{method="GET",' in body
+    assert "# TYPE f1api_http_requests_in_flight gauge" in body
+    assert 'f1api_http_response_size_bytes_count{method="GET",' in body
+    assert 'f1api_db_queries_total{pool="api"}' in body
+    assert 'f1api_db_pool_checkout_wait_seconds_count{pool="api"}' in body
+    assert 'f1api_db_pool_utilization{pool="api"}' in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_count_db_queries_per_request() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/api/v1/events/99999")
+        body = (await client.get("/metrics")).text
+
+    line = next(
+        ln
+        for ln in body.splitlines()
+        if ln.startswith('f1api_http_request_db_queries_sum{route="/api/v1/events/{event_id}"}')
+    )
+    assert float(line.rsplit(" ", 1)[1]) >= 1
+
+
+def test_metric_shards_merge_across_threads() -> None:
+    counter = Counter("test_shard_total", "test")
+    histogram = Histogram("test_shard_seconds", "test", buckets=(1.0, 2.0))
+    REGISTRY.remove(counter)
+    REGISTRY.remove(histogram)
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc(("a",))
+            histogram.observe(1.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.values() == {("a",): 4000.0}
+    lines = list(histogram.samples())
+    assert 'test_shard_seconds_bucket{le="1.0"} 0.0' in lines
+    assert 'test_shard_seconds_bucket{le="2.0"} 4000.0' in lines
+    assert 'test_shard_seconds_bucket{le="+Inf"} 4000.0' in lines
+    assert "test_shard_seconds_count 4000.0" in lines
+
+
+@pytest.mark.asyncio
+async def test_debug_pool_view() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/api/v1/events/99999")
+        resp = await client.get("/api/v1/_debug/pool")
+
+    assert resp.status_code == 200
+    api = next(p for p in resp.json()["pools"] if p["pool"] == "api")
+    assert api["checkouts"] >= 1 and api["connects"] >= 1
+    assert {"size", "max_overflow", "timeout", "recycle", "waits", "invalidations"} <= set(api)
+
+
+def test_idle_connections_are_pinged_and_replaced_when_dead() -> None:
+    now = [0.0]
+    engine = create_engine(
+        os.environ["DATABASE_URL"], poolclass=TimedQueuePool, pool_size=1, max_overflow=0
+    )
+    instrument_engine(engine, "idle_test")
+    ping_after_idle(engine, 30.0, clock=lambda: now[0])
+    try:
+        with engine.connect() as conn:
+            pid = conn.execute(text("SELECT pg_backend_pid()")).scalar_one()
+        with engine.connect() as conn:  # reused without a ping: not idle long enough
+            assert conn.execute(text("SELECT pg_backend_pid()")).scalar_one() == pid
+        other = create_engine(os.environ["DATABASE_URL"])
+        with other.connect() as conn:
+            conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+        other.dispose()
+
+        now[0] = 31.0
+        with engine.connect() as conn:  # ping fails, the pool opens a fresh connection
+            assert conn.execute(text("SELECT pg_backend_pid()")).scalar_one() != pid
+        assert POOL_INVALIDATIONS.values()[("idle_test",)] == 1
+    finally:
+        engine.dispose()
+
+
+def test_exhausted_pool_counts_waits_and_timeouts() -> None:
+    engine = create_engine(
+        os.environ["DATABASE_URL"],
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        pool_logging_name="wait_test",
+    )
+    instrument_engine(engine, "wait_test")
+    try:
+        with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        assert POOL_WAITS.values()[("wait_test",)] == 1
+        assert POOL_TIMEOUTS.values()[("wait_test",)] == 1
+    finally:
+        engine.dispose()
+
+
+def test_failed_statements_are_counted_and_leave_no_timer_behind() -> None:
+    engine = create_engine(os.environ["DATABASE_URL"], poolclass=TimedQueuePool, pool_size=1)
+    instrument_engine(engine, "error_test")
+    try:
+        with engine.connect() as conn:
+            with pytest.raises(ProgrammingError):
+                conn.execute(text("SELECT * FROM no_such_table"))
+            conn.rollback()
+            conn.execute(text("SELECT 1"))
+            assert conn.info["f1api_query_start"] == []
+        assert DB_QUERY_ERRORS.values()[("error_test",)] == 1
+        assert DB_QUERIES.values()[("error_test",)] == 2
+    finally:
+        engine.dispose()
@@ -0,0 +1,123 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from f1api.core import db
+from f1api.core.cache import response_cache
+from f1api.core.config import settings
+from f1api.core.versions import Versions, data_versions
+from f1api.main import app
+
+DEAD_URL = "postgresql+psycopg://f1user@127.0.0.1:1/f1db"
+
+
+@pytest_asyncio.fixture
+async def replica_engines() -> AsyncGenerator[tuple[AsyncEngine, AsyncEngine], None]:
+    """A reachable "replica" (the test database itself) and one that refuses connections."""
+    live = create_async_engine(settings.database_url)
+    dead = create_async_engine(DEAD_URL)
+    yield live, dead
+    await live.dispose()
+    await dead.dispose()
+
+
+def test_replica_set_rotates_and_skips_replicas_that_are_down() -> None:
+    now = [0.0]
+    a, b, c = (create_async_engine(DEAD_URL) for _ in range(3))
+    replicas = db.ReplicaSet([a, b, c], retry_after=5.0, clock=lambda: now[0])
+
+    assert replicas.candidates() == [a, b, c]
+    assert replicas.candidates() == [b, c, a]
+    replicas.mark_down(c)
+    assert replicas.candidates() == [a, b]
+    now[0] = 5.0
+    assert replicas.candidates() == [a, b, c]
+    assert db.ReplicaSet([], retry_after=5.0).candidates() == []
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_a_healthy_replica_unless_the_request_opts_out(
+    monkeypatch: pytest.MonkeyPatch,
+    replica_engines: tuple[AsyncEngine, AsyncEngine],
+    capture_queries: Any,
+) -> None:
+    live, dead = replica_engines
+    replicas = db.ReplicaSet([dead, live], retry_after=60.0)
+    monkeypatch.setattr(db, "replicas", replicas)
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    with (
+        capture_queries(live, versions=True) as on_replica,
+        capture_queries(db.async_engine, versions=True) as on_primary,
+    ):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            replica_read = await client.get("/api/v1/drivers?limit=5")
+            replica_calls = {"replica": len(on_replica), "primary": len(on_primary)}
+            primary_read = await client.get(
+                "/api/v1/drivers?limit=5&offset=1", headers={"X-Read-Your-Writes": "1"}
+            )
+
+    assert replica_read.status_code == 200 and primary_read.status_code == 200
+    assert replica_read.json()["items"][1:] == primary_read.json()["items"][:4]
+    # the refused replica was skipped and benched; the page came from the live one
+    assert replicas.candidates() == [live]
+    assert replica_calls["replica"] > 0
+    assert len(on_replica) == replica_calls["replica"]
+    assert len(on_primary) > replica_calls["primary"]
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_when_no_replica_is_reachable(
+    monkeypatch: pytest.MonkeyPatch, replica_engines: tuple[AsyncEngine, AsyncEngine]
+) -> None:
+    _, dead = replica_engines
+    monkeypatch.setattr(db, "replicas", db.ReplicaSet([dead], retry_after=60.0))
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/seasons")
+    assert resp.status_code == 200
+    assert db.replicas.candidates() == []
+
+
+@pytest.mark.asyncio
+async def test_responses_from_a_lagging_replica_are_not_cached_or_etagged(
+    monkeypatch: pytest.MonkeyPatch, replica_engines: tuple[AsyncEngine, AsyncEngine]
+) -> None:
+    live, _ = replica_engines
+    monkeypatch.setattr(db, "replicas", db.ReplicaSet([live], retry_after=60.0))
+    load = data_versions.loader
+    lag = {"wal": 0}
+
+    async def writer_ahead() -> tuple[Versions, int]:
+        versions, lsn = await load()
+        return versions, lsn + lag["wal"]
+
+    monkeypatch.setattr(data_versions, "loader", writer_ahead)
+    data_versions.expire()
+    response_cache.invalidate()
+    path = "/api/v1/events?season_year=2024"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        fresh = [await client.get(path) for _ in range(2)]
+        bypass = await client.get(path, headers={"X-Read-Your-Writes": "1"})
+
+        lag["wal"] = 1 << 40  # the primary is far ahead of what the replica has replayed
+        data_versions.expire()
+        response_cache.invalidate()
+        stale = [await client.get(path) for _ in range(2)]
+        export = await client.get("/api/v1/export/results?season_year=2024")
+
+    assert [r.headers["x-cache"] for r in fresh] == ["MISS", "HIT"]
+    assert "etag" in fresh[0].headers
+    assert "x-cache" not in bypass.headers and bypass.json() == fresh[0].json()
+
+    assert [r.headers["x-cache"] for r in stale] == ["MISS", "MISS"]
+    assert all("etag" not in r.headers for r in stale)
+    assert stale[0].json() == fresh[0].json()
+    # the stream keeps its ETag: it skipped the lagging replica for the primary
+    assert export.status_code == 200 and "etag" in export.headers
@@ -0,0 +1,108 @@
+from datetime import UTC, date, datetime
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from f1api.api.pagination import paginate_records
+from f1api.core.cache import response_cache
+from f1api.core.reference import (
+    CircuitRecord,
+    DriverRecord,
+    ReferenceIndex,
+    ReferenceStore,
+    SeasonRecord,
+    TeamRecord,
+    reference_index,
+)
+from f1api.core.versions import DataVersionStore, Versions
+from f1api.main import app
+from f1api.models import Driver
+from f1api.schemas import CircuitRead, DriverRead, SeasonRead, TeamRead
+
+
+def test_records_have_the_read_schema_fields() -> None:
+    for record, schema in [
+        (DriverRecord, DriverRead),
+        (TeamRecord, TeamRead),
+        (CircuitRecord, CircuitRead),
+        (SeasonRecord, SeasonRead),
+    ]:
+        assert record._fields == tuple(schema.model_fields)
+
+
+def test_in_memory_order_matches_the_database(db_session: Session) -> None:
+    for i, last_name in enumerate(["de Vries", "Zhou", "Álvarez", "alvarez", "Alvarez"]):
+        db_session.add(
+            Driver(
+                ref=f"collation_{i}",
+                first_name="Test",
+                last_name=last_name,
+                date_of_birth=date(2000, 1, 1),
+            )
+        )
+    db_session.flush()
+    order_by = (Driver.last_name, Driver.first_name, Driver.id)
+    rows = db_session.execute(select(*order_by).order_by(*order_by)).all()
+
+    page = paginate_records(
+        list(reversed(rows)),
+        order_by=[col.key for col in order_by],
+        limit=len(rows),
+        offset=0,
+        cursor=None,
+    )
+    assert page.rows == rows
+
+
+@pytest.mark.asyncio
+async def test_store_rebuilds_and_swaps_only_when_versions_change() -> None:
+    versions: Versions = {"drivers": (1, datetime(2024, 1, 1, tzinfo=UTC))}
+    tokens: list[str] = []
+
+    async def load_versions() -> tuple[Versions, int]:
+        return dict(versions), 0
+
+    async def loader(token: str) -> ReferenceIndex:
+        tokens.append(token)
+        return ReferenceIndex.build(token, [], [], [], [])
+
+    store = ReferenceStore(DataVersionStore(0.0, loader=load_versions), loader=loader)
+    first = await store.current()
+    assert await store.current() is first
+
+    versions["events"] = (7, datetime(2024, 1, 2, tzinfo=UTC))  # not a reference table
+    assert await store.current() is first
+
+    versions["drivers"] = (2, datetime(2024, 1, 3, tzinfo=UTC))
+    second = await store.current()
+    assert second is not first and len(tokens) == 2 and tokens[0] != tokens[1]
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_served_without_queries(capture_queries: Any) -> None:
+    response_cache.invalidate()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        listed = (await client.get("/api/v1/drivers?limit=1")).json()["items"][0]
+        team = (await client.get("/api/v1/teams?limit=1")).json()["items"][0]
+        await reference_index.current()
+        response_cache.invalidate()
+
+        with capture_queries() as queries:
+            by_id = await client.get(f"/api/v1/drivers/{listed['id']}")
+            by_ref = await client.get(f"/api/v1/drivers?ref={listed['ref']}&fields=id,code")
+            by_code = await client.get(f"/api/v1/drivers?code={listed['code']}")
+            team_by_ref = await client.get(f"/api/v1/teams?ref={team['ref']}&cursor=")
+            missing = await client.get("/api/v1/teams/99999")
+
+    assert queries == []
+    assert by_id.json() == listed
+    assert by_ref.json()["items"] == [{"id": listed["id"], "code": listed["code"]}]
+    assert by_ref.json()["total"] == 1
+    assert listed in by_code.json()["items"]
+    assert team_by_ref.json()["items"] == [team]
+    assert team_by_ref.json()["next_cursor"] is None
+    assert missing.status_code == 404
@@ -0,0 +1,56 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from f1api.api.serialization import serialize_rows
+from f1api.main import app
+from f1api.schemas import (
+    ConstructorStandingRead,
+    DriverRead,
+    DriverSeasonStatsRead,
+    DriverStandingRead,
+    EventRead,
+    PaginatedResponse,
+    SeasonRead,
+    TeamRead,
+    TeamSeasonStatsRead,
+)
+
+LIST_ENDPOINTS: list[tuple[str, type[BaseModel]]] = [
+    ("/api/v1/drivers?limit=7&offset=3", DriverRead),
+    ("/api/v1/drivers?cursor=&limit=5", DriverRead),
+    ("/api/v1/teams?count=none", TeamRead),
+    ("/api/v1/seasons", SeasonRead),
+    ("/api/v1/events?season_year=2024", EventRead),
+    ("/api/v1/standings/drivers?season_year=2024", DriverStandingRead),
+    ("/api/v1/standings/constructors?season_year=2024&limit=3", ConstructorStandingRead),
+    ("/api/v1/stats/drivers?season_year=2024", DriverSeasonStatsRead),
+    ("/api/v1/stats/teams?season_year=2024&cursor=", TeamSeasonStatsRead),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("path", "schema"), LIST_ENDPOINTS)
+async def test_fast_path_is_byte_identical_to_pydantic_path(
+    path: str, schema: type[BaseModel]
+) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(path)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+
+    # What the default path (validate, then FastAPI's JSONResponse) renders for the same data
+    model = PaginatedResponse[schema].model_validate_json(resp.content)  # type: ignore[valid-type]
+    assert JSONResponse(jsonable_encoder(model)).body == resp.content
+
+
+def test_serialize_rows_follows_schema_field_order() -> None:
+    class Row:
+        year = 2024
+        id = 7
+        extra = "ignored"
+
+    assert list(serialize_rows([Row()], SeasonRead)[0].items()) == [("id", 7), ("year", 2024)]
@@ -0,0 +1,127 @@
+from datetime import date
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from f1api.models import (
+    Circuit,
+    ConstructorStanding,
+    Driver,
+    DriverStanding,
+    Entry,
+    Event,
+    Season,
+    SessionResult,
+    SessionType,
+    Team,
+)
+from f1api.models import Session as RaceSession
+from f1api.services.data_versions import bump_versions_after_flush
+from f1api.services.hooks import register_write_hooks
+from f1api.services.standings import sync_standings_after_flush
+
+
+def _race_weekend(db: Session) -> tuple[Season, RaceSession, RaceSession, Entry, Entry]:
+    season = Season(year=1899)
+    team = Team(ref="sync_team", name="Sync Team")
+    circuit = Circuit(ref="sync_circuit", name="Sync Circuit")
+    alice = Driver(
+        ref="sync_alice", first_name="Alice", last_name="A", date_of_birth=date(1990, 1, 1)
+    )
+    bob = Driver(ref="sync_bob", first_name="Bob", last_name="B", date_of_birth=date(1990, 1, 1))
+    db.add_all([season, team, circuit, alice, bob])
+    db.flush()
+
+    event = Event(season_id=season.id, circuit_id=circuit.id, round=1, name="Sync GP")
+    alice_entry = Entry(season_id=season.id, team_id=team.id, driver_id=alice.id)
+    bob_entry = Entry(season_id=season.id, team_id=team.id, driver_id=bob.id)
+    db.add_all([event, alice_entry, bob_entry])
+    db.flush()
+
+    quali = RaceSession(event_id=event.id, type=SessionType.QUALIFYING, name="Q", session_order=2)
+    race = RaceSession(event_id=event.id, type=SessionType.RACE, name="Race", session_order=3)
+    db.add_all([quali, race])
+    db.flush()
+    return season, quali, race, alice_entry, bob_entry
+
+
+def _driver_table(db: Session, season_id: int) -> list[tuple[int, int, float, int]]:
+    stmt = (
+        select(
+            DriverStanding.position,
+            DriverStanding.driver_id,
+            DriverStanding.points,
+            DriverStanding.wins,
+        )
+        .filter(DriverStanding.season_id == season_id)
+        .order_by(DriverStanding.position)
+    )
+    return [tuple(row) for row in db.execute(stmt).all()]
+
+
+def test_standings_follow_race_result_writes(db_session: Session) -> None:
+    season, quali, race, alice, bob = _race_weekend(db_session)
+
+    # Non-race sessions don't score
+    db_session.add(SessionResult(session_id=quali.id, entry_id=alice.id, position=1, points=99))
+    db_session.flush()
+    assert _driver_table(db_session, season.id) == []
+
+    # Insert
+    win = SessionResult(session_id=race.id, entry_id=alice.id, position=1, points=25)
+    second = SessionResult(session_id=race.id, entry_id=bob.id, position=2, points=18)
+    db_session.add_all([win, second])
+    db_session.flush()
+    assert _driver_table(db_session, season.id) == [
+        (1, alice.driver_id, 25.0, 1),
+        (2, bob.driver_id, 18.0, 0),
+    ]
+
+    # Update swaps the order
+    win.position, win.points = 2, 18
+    second.position, second.points = 1, 25
+    db_session.flush()
+    assert _driver_table(db_session, season.id) == [
+        (1, bob.driver_id, 25.0, 1),
+        (2, alice.driver_id, 18.0, 0),
+    ]
+
+    # Delete
+    db_session.delete(second)
+    db_session.flush()
+    assert _driver_table(db_session, season.id) == [(1, alice.driver_id, 18.0, 0)]
+
+    constructors = db_session.execute(
+        select(ConstructorStanding.position, ConstructorStanding.points).filter(
+            ConstructorStanding.season_id == season.id
+        )
+    ).all()
+    assert [tuple(row) for row in constructors] == [(1, 18.0)]
+
+
+def test_ties_are_broken_by_countback(db_session: Session) -> None:
+    season, _, race, alice, bob = _race_weekend(db_session)
+
+    # Level on points: the better finish wins, not the alphabetical order
+    alice_result = SessionResult(session_id=race.id, entry_id=alice.id, position=2, points=10)
+    bob_result = SessionResult(session_id=race.id, entry_id=bob.id, position=1, points=10)
+    db_session.add_all([alice_result, bob_result])
+    db_session.flush()
+    assert _driver_table(db_session, season.id) == [
+        (1, bob.driver_id, 10.0, 1),
+        (2, alice.driver_id, 10.0, 0),
+    ]
+
+    # Level on points and every finish: the rank is shared
+    alice_result.position = bob_result.position = None
+    db_session.flush()
+    assert sorted(_driver_table(db_session, season.id)) == [
+        (1, alice.driver_id, 10.0, 0),
+        (1, bob.driver_id, 10.0, 0),
+    ]
+
+
+def test_write_hooks_are_registered_on_every_session() -> None:
+    register_write_hooks()  # already done by conftest; registering again is a no-op
+    for hook in (sync_standings_after_flush, bump_versions_after_flush):
+        assert event.contains(Session, "after_flush", hook)